@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Performance benchmarks for orator.
+
+The benchmarks run against an in-memory SQLite database and
+their results are written as JSON so that runs on different
+commits can be compared::
+
+    python -m benchmarks -o before.json
+    git checkout other-branch
+    python -m benchmarks -o after.json --baseline before.json
+"""
+
+from .runner import benchmark, get_benchmarks, run_benchmarks, compare
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import argparse
+
+from .fixtures import Environment
+from .runner import get_benchmarks, run_benchmarks, compare, load, dump
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "-k", "--filter", help="Only run benchmarks whose name matches this regex"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="Number of timed runs"
+    )
+    parser.add_argument(
+        "-s", "--scale", type=float, default=1, help="Size multiplier of the data set"
+    )
+    parser.add_argument("-o", "--output", help="Write the JSON results to this file")
+    parser.add_argument("-b", "--baseline", help="Compare with a previous JSON result")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown considered a regression (default: 0.1)",
+    )
+    parser.add_argument(
+        "-l", "--list", action="store_true", help="List the benchmarks and exit"
+    )
+
+    args = parser.parse_args(argv)
+
+    benchmarks = get_benchmarks(args.filter)
+
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)
+
+        return 0
+
+    env = Environment(args.scale)
+
+    def output(result):
+        line = "{:<36} {:>12.6f}s {:>14.1f} ops/s".format(
+            result["name"], result["min"], result["ops_per_sec"] or 0
+        )
+        if result["peak_memory"] is not None:
+            line += " {:>10.1f} KiB".format(result["peak_memory"] / 1024.0)
+
+        sys.stderr.write(line + "\n")
+
+    results = run_benchmarks(benchmarks, env, args.repeat, output)
+
+    if args.output:
+        dump(results, args.output)
+
+    if not args.baseline:
+        return 0
+
+    regressions = 0
+    sys.stderr.write("\n")
+    for entry in compare(load(args.baseline), results, args.threshold):
+        if entry["regression"]:
+            regressions += 1
+
+        sys.stderr.write(
+            "{:<36} {:>12.6f}s {:>12.6f}s {:>8.2f}x{}\n".format(
+                entry["name"],
+                entry["baseline"],
+                entry["current"],
+                entry["ratio"],
+                "  REGRESSION" if entry["regression"] else "",
+            )
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+from .runner import benchmark
+
+# Number of compilations performed by a single run
+COMPILATIONS = 1000
+
+
+def _select_shapes(env):
+    db = env.db
+
+    return {
+        "simple": lambda: db.table("bench_users").where("id", 1),
+        "columns": lambda: db.table("bench_users").select(
+            "bench_users.id", "bench_users.name", "bench_users.email as mail"
+        ),
+        "join": lambda: (
+            db.table("bench_users")
+            .join("bench_posts", "bench_posts.user_id", "=", "bench_users.id")
+            .where("bench_users.active", True)
+            .where("bench_posts.votes", ">", 3)
+            .order_by("bench_posts.created_at", "desc")
+            .limit(10)
+        ),
+        "where_in": lambda: db.table("bench_posts").where_in(
+            "user_id", list(range(100))
+        ),
+        "nested": lambda: (
+            db.table("bench_posts")
+            .where(db.query().where("votes", ">", 1).or_where("votes", "<", 0))
+            .where_exists(
+                db.table("bench_users").where_raw(
+                    '"bench_users"."id" = "bench_posts"."user_id"'
+                )
+            )
+        ),
+        "aggregate": lambda: (
+            db.table("bench_posts")
+            .select("user_id")
+            .group_by("user_id")
+            .having("user_id", ">", 10)
+        ),
+    }
+
+
+def _register_select(shape):
+    @benchmark("compile.select.%s" % shape, ops=COMPILATIONS)
+    def compile_select(env):
+        query = _select_shapes(env)[shape]()
+        grammar = query.get_grammar()
+
+        def run():
+            for _ in range(COMPILATIONS):
+                grammar.compile_select(query)
+
+        return run
+
+
+for _shape in ["simple", "columns", "join", "where_in", "nested", "aggregate"]:
+    _register_select(_shape)
+
+
+@benchmark("compile.insert.single", ops=COMPILATIONS)
+def compile_insert_single(env):
+    query = env.db.table("bench_users")
+    grammar = query.get_grammar()
+    values = {"name": "john", "email": "john@doe.com", "country_id": 1}
+
+    def run():
+        for _ in range(COMPILATIONS):
+            grammar.compile_insert(query, values)
+
+    return run
+
+
+@benchmark("compile.insert.batch", ops=COMPILATIONS)
+def compile_insert_batch(env):
+    query = env.db.table("bench_users")
+    grammar = query.get_grammar()
+    values = [
+        {"name": "john", "email": "john%d@doe.com" % i, "country_id": 1}
+        for i in range(100)
+    ]
+
+    def run():
+        for _ in range(COMPILATIONS):
+            grammar.compile_insert(query, values)
+
+    return run
+
+
+@benchmark("compile.update", ops=COMPILATIONS)
+def compile_update(env):
+    query = env.db.table("bench_users").where("id", 1).where("active", True)
+    grammar = query.get_grammar()
+    values = {"name": "john", "email": "john@doe.com", "country_id": 1}
+
+    def run():
+        for _ in range(COMPILATIONS):
+            grammar.compile_update(query, values)
+
+    return run
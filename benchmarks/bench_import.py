@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import subprocess
+
+from .runner import benchmark
+
+
+def _import(module):
+    def run():
+        subprocess.check_call([sys.executable, "-c", "import %s" % module])
+
+    return run
+
+
+@benchmark("import.interpreter")
+def import_interpreter(env):
+    return _import("sys")
+
+
+@benchmark("import.orator")
+def import_orator(env):
+    return _import("orator")
+
+
+@benchmark("import.orator_orm")
+def import_orator_orm(env):
+    return _import("orator.orm")
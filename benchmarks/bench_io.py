@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+
+from .runner import benchmark
+from .fixtures import Post
+
+CHUNK_SIZE = 500
+
+INSERT_BATCH_SIZE = 100
+
+
+@benchmark("chunk.query", ops=lambda env: env.posts, memory=True)
+def chunk_query(env):
+    def run():
+        for chunk in env.db.table("bench_posts").chunk(CHUNK_SIZE):
+            pass
+
+    return run
+
+
+@benchmark("chunk.model", ops=lambda env: env.posts, memory=True)
+def chunk_model(env):
+    def run():
+        for chunk in Post.chunk(CHUNK_SIZE):
+            pass
+
+    return run
+
+
+@benchmark("columns.get", group="columns", ops=lambda env: env.posts, memory=True)
+def columns_get(env):
+    def run():
+        rows = env.db.table("bench_posts").get()
+
+        return dict((c, [row[c] for row in rows]) for c in ("id", "votes", "title"))
+
+    return run
+
+
+@benchmark(
+    "columns.to_columns", group="columns", ops=lambda env: env.posts, memory=True
+)
+def columns_to_columns(env):
+    def run():
+        env.db.table("bench_posts").to_columns()
+
+    return run
+
+
+@benchmark("export.get", group="export", ops=lambda env: env.posts, memory=True)
+def export_get(env):
+    def run():
+        with open(os.devnull, "w") as fp:
+            for post in Post.all():
+                fp.write(json.dumps(post.serialize(), default=str))
+                fp.write("\n")
+
+    return run
+
+
+@benchmark("export.csv", group="export", ops=lambda env: env.posts, memory=True)
+def export_csv(env):
+    def run():
+        with open(os.devnull, "w") as fp:
+            env.db.table("bench_posts").export(fp, chunk_size=CHUNK_SIZE)
+
+    return run
+
+
+@benchmark("export.ndjson", group="export", ops=lambda env: env.posts, memory=True)
+def export_ndjson(env):
+    def run():
+        with open(os.devnull, "w") as fp:
+            env.db.table("bench_posts").export(
+                fp, format="ndjson", chunk_size=CHUNK_SIZE
+            )
+
+    return run
+
+
+@benchmark("export.model", group="export", ops=lambda env: env.posts, memory=True)
+def export_model(env):
+    def run():
+        with open(os.devnull, "w") as fp:
+            Post.query().export(fp, format="ndjson", chunk_size=CHUNK_SIZE)
+
+    return run
+
+
+def _insert_rows(env):
+    return [
+        {
+            "name": "user %d" % i,
+            "email": "user%d@example.com" % i,
+            "votes": i,
+            "created_at": "2019-07-15 12:00:00",
+        }
+        for i in range(env.posts)
+    ]
+
+
+@benchmark("insert.bulk", group="insert", ops=lambda env: env.posts)
+def insert_bulk(env):
+    rows = _insert_rows(env)
+    query = env.db.table("bench_inserts")
+
+    def setup():
+        query.delete()
+
+    def run():
+        with env.db.transaction():
+            for i in range(0, len(rows), INSERT_BATCH_SIZE):
+                env.db.table("bench_inserts").insert(rows[i : i + INSERT_BATCH_SIZE])
+
+    return setup, run
+
+
+@benchmark("insert.single", group="insert", ops=lambda env: env.users)
+def insert_single(env):
+    rows = _insert_rows(env)[: env.users]
+    query = env.db.table("bench_inserts")
+
+    def setup():
+        query.delete()
+
+    def run():
+        with env.db.transaction():
+            for row in rows:
+                env.db.table("bench_inserts").insert(row)
+
+    return setup, run
+
+
+@benchmark("schema.uncached", group="schema")
+def schema_uncached(env):
+    connection = env.db.connection()
+    manager = connection.get_schema_manager()
+
+    def run():
+        connection.forget_schema()
+        manager.list_table_details("bench_posts")
+
+    return run
+
+
+@benchmark("schema.cached", group="schema")
+def schema_cached(env):
+    manager = env.db.connection().get_schema_manager()
+
+    def run():
+        manager.list_table_details("bench_posts")
+
+    return run
+
+
+@benchmark("schema.introspect", group="schema")
+def schema_introspect(env):
+    connection = env.db.connection()
+    manager = connection.get_schema_manager()
+
+    def run():
+        connection.forget_schema()
+        manager.introspect()
+
+    return run
+
+
+@benchmark("aggregate.separate", group="aggregate")
+def aggregate_separate(env):
+    def run():
+        query = env.db.table("bench_posts").where("votes", ">", 0)
+
+        query.count()
+        query.sum("votes")
+        query.avg("votes")
+        query.min("created_at")
+        query.max("created_at")
+
+    return run
+
+
+@benchmark("aggregate.combined", group="aggregate")
+def aggregate_combined(env):
+    def run():
+        env.db.table("bench_posts").where("votes", ">", 0).aggregates(
+            count="*", sum="votes", avg="votes", min="created_at", max="created_at"
+        )
+
+    return run
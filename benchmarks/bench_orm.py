@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from .runner import benchmark
+from .fixtures import User, Post, Country, Photo, Tag
+
+
+@benchmark("orm.hydrate", ops=lambda env: env.posts)
+def hydrate(env):
+    rows = env.db.table("bench_posts").get().all()
+
+    def run():
+        Post.hydrate(rows)
+
+    return run
+
+
+@benchmark("orm.to_dict", ops=lambda env: env.users)
+def to_dict(env):
+    users = User.all()
+
+    def run():
+        for user in users:
+            user.to_dict()
+
+    return run
+
+
+@benchmark("orm.to_json", ops=lambda env: env.users)
+def to_json(env):
+    users = User.all()
+
+    def run():
+        users.to_json()
+
+    return run
+
+
+@benchmark("orm.to_dict.relations", ops=lambda env: env.users)
+def to_dict_with_relations(env):
+    users = User.with_("posts", "roles").get()
+
+    def run():
+        for user in users:
+            user.to_dict()
+
+    return run
+
+
+def _register_eager_load(name, model, relation):
+    @benchmark("eager_load.%s" % name, group="eager_load", ops=lambda env: env.users)
+    def eager_load(env):
+        def run():
+            model.with_(relation).get()
+
+        return run
+
+
+# One benchmark per relation type
+for _name, _model, _relation in [
+    ("belongs_to", Post, "user"),
+    ("has_one", User, "profile"),
+    ("has_many", User, "posts"),
+    ("belongs_to_many", User, "roles"),
+    ("has_many_through", Country, "posts"),
+    ("morph_one", User, "avatar"),
+    ("morph_many", User, "photos"),
+    ("morph_to", Photo, "imageable"),
+    ("morph_to_many", User, "tags"),
+    ("morphed_by_many", Tag, "users"),
+]:
+    _register_eager_load(_name, _model, _relation)
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+
+from orator import DatabaseManager, Model, Schema
+from orator.orm import (
+    has_one,
+    has_many,
+    belongs_to,
+    belongs_to_many,
+    has_many_through,
+    morph_one,
+    morph_many,
+    morph_to,
+    morph_to_many,
+    morphed_by_many,
+)
+
+
+class Environment(object):
+    """
+    An in-memory SQLite database seeded with the benchmark data set.
+    """
+
+    USERS = 1000
+    POSTS_PER_USER = 5
+    ROLES = 20
+    ROLES_PER_USER = 3
+    TAGS = 50
+    TAGS_PER_USER = 3
+    COUNTRIES = 10
+
+    def __init__(self, scale=1):
+        self.scale = scale
+
+        self.db = DatabaseManager(
+            {
+                "default": "sqlite",
+                "sqlite": {"driver": "sqlite", "database": ":memory:"},
+            }
+        )
+        self.schema = Schema(self.db)
+
+        Model.set_connection_resolver(self.db)
+
+        self.create_tables()
+        self.seed()
+
+    @property
+    def users(self):
+        return int(self.USERS * self.scale)
+
+    @property
+    def posts(self):
+        return self.users * self.POSTS_PER_USER
+
+    def create_tables(self):
+        with self.schema.create("bench_countries") as table:
+            table.increments("id")
+            table.string("name")
+
+        with self.schema.create("bench_users") as table:
+            table.increments("id")
+            table.integer("country_id").unsigned()
+            table.string("name")
+            table.string("email").unique()
+            table.boolean("active").default(True)
+            table.timestamps()
+
+        with self.schema.create("bench_profiles") as table:
+            table.increments("id")
+            table.integer("user_id").unsigned().index()
+            table.text("bio")
+
+        with self.schema.create("bench_posts") as table:
+            table.increments("id")
+            table.integer("user_id").unsigned().index()
+            table.string("title")
+            table.text("body")
+            table.integer("votes").default(0)
+            table.timestamps()
+
+        with self.schema.create("bench_roles") as table:
+            table.increments("id")
+            table.string("name")
+
+        with self.schema.create("bench_role_user") as table:
+            table.integer("user_id").unsigned().index()
+            table.integer("role_id").unsigned().index()
+            table.boolean("is_admin").default(False)
+
+        with self.schema.create("bench_photos") as table:
+            table.increments("id")
+            table.morphs("imageable")
+            table.string("path")
+
+        with self.schema.create("bench_tags") as table:
+            table.increments("id")
+            table.string("name")
+
+        with self.schema.create("bench_taggables") as table:
+            table.integer("tag_id").unsigned().index()
+            table.morphs("taggable")
+
+        with self.schema.create("bench_inserts") as table:
+            table.increments("id")
+            table.string("name")
+            table.string("email")
+            table.integer("votes")
+            table.timestamp("created_at")
+
+    def seed(self):
+        now = "2019-07-15 12:00:00"
+
+        with self.db.transaction():
+            self._insert(
+                "bench_countries",
+                [{"name": "country %d" % i} for i in range(self.COUNTRIES)],
+            )
+            self._insert(
+                "bench_roles", [{"name": "role %d" % i} for i in range(self.ROLES)]
+            )
+            self._insert(
+                "bench_tags", [{"name": "tag %d" % i} for i in range(self.TAGS)]
+            )
+
+            users = []
+            profiles = []
+            posts = []
+            role_user = []
+            photos = []
+            taggables = []
+
+            for i in range(1, self.users + 1):
+                users.append(
+                    {
+                        "country_id": i % self.COUNTRIES + 1,
+                        "name": "user %d" % i,
+                        "email": "user%d@example.com" % i,
+                        "active": i % 2,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                profiles.append({"user_id": i, "bio": "bio of user %d" % i})
+                photos.append(
+                    {
+                        "imageable_id": i,
+                        "imageable_type": "bench_users",
+                        "path": "/photos/%d.png" % i,
+                    }
+                )
+
+                for j in range(self.POSTS_PER_USER):
+                    posts.append(
+                        {
+                            "user_id": i,
+                            "title": "post %d of user %d" % (j, i),
+                            "body": "lorem ipsum " * 10,
+                            "votes": j,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                    )
+
+                for j in range(self.ROLES_PER_USER):
+                    role_user.append(
+                        {
+                            "user_id": i,
+                            "role_id": (i + j) % self.ROLES + 1,
+                            "is_admin": j == 0,
+                        }
+                    )
+
+                for j in range(self.TAGS_PER_USER):
+                    taggables.append(
+                        {
+                            "tag_id": (i + j) % self.TAGS + 1,
+                            "taggable_id": i,
+                            "taggable_type": "bench_users",
+                        }
+                    )
+
+            self._insert("bench_users", users)
+            self._insert("bench_profiles", profiles)
+            self._insert("bench_posts", posts)
+            self._insert("bench_role_user", role_user)
+            self._insert("bench_photos", photos)
+            self._insert("bench_taggables", taggables)
+
+    def _insert(self, table, rows, size=100):
+        for i in range(0, len(rows), size):
+            self.db.table(table).insert(rows[i : i + size])
+
+
+class User(Model):
+
+    __table__ = "bench_users"
+    __guarded__ = []
+    __hidden__ = ["email"]
+    __casts__ = {"active": "bool"}
+
+    @belongs_to("country_id")
+    def country(self):
+        return Country
+
+    @has_one("user_id")
+    def profile(self):
+        return Profile
+
+    @has_many("user_id")
+    def posts(self):
+        return Post
+
+    @belongs_to_many("bench_role_user", "user_id", "role_id", with_pivot=["is_admin"])
+    def roles(self):
+        return Role
+
+    @morph_one("imageable")
+    def avatar(self):
+        return Photo
+
+    @morph_many("imageable")
+    def photos(self):
+        return Photo
+
+    @morph_to_many("taggable", "bench_taggables", "taggable_id", "tag_id")
+    def tags(self):
+        return Tag
+
+
+class Profile(Model):
+
+    __table__ = "bench_profiles"
+    __timestamps__ = False
+
+
+class Post(Model):
+
+    __table__ = "bench_posts"
+    __guarded__ = []
+
+    @belongs_to("user_id")
+    def user(self):
+        return User
+
+
+class Role(Model):
+
+    __table__ = "bench_roles"
+    __timestamps__ = False
+
+
+class Photo(Model):
+
+    __table__ = "bench_photos"
+    __timestamps__ = False
+
+    @morph_to
+    def imageable(self):
+        return
+
+
+class Tag(Model):
+
+    __table__ = "bench_tags"
+    __timestamps__ = False
+
+    @morphed_by_many("taggable", "bench_taggables", "tag_id", "taggable_id")
+    def users(self):
+        return User
+
+
+class Country(Model):
+
+    __table__ = "bench_countries"
+    __timestamps__ = False
+
+    @has_many_through(User, "country_id", "user_id")
+    def posts(self):
+        return Post
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+import re
+import gc
+import sys
+import platform
+import datetime
+import subprocess
+
+from timeit import default_timer
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+import simplejson as json
+
+import orator
+
+
+_registry = []
+
+
+class Benchmark(object):
+    def __init__(self, name, factory, group=None, ops=1, memory=False):
+        """
+        :param name: The unique name of the benchmark
+        :type name: str
+
+        :param factory: A callable receiving the environment and returning
+                        either the function to time or a (setup, run) tuple
+        :type factory: callable
+
+        :param group: The group of the benchmark
+        :type group: str
+
+        :param ops: The number of operations performed by a single run
+        :type ops: int or callable
+
+        :param memory: Whether to measure the peak memory of a run
+        :type memory: bool
+        """
+        self.name = name
+        self.factory = factory
+        self.group = group or name.split(".")[0]
+        self.ops = ops
+        self.memory = memory
+
+    def run(self, env, repeat=5):
+        """
+        Run the benchmark.
+
+        :param env: The benchmark environment
+        :type env: benchmarks.fixtures.Environment
+
+        :param repeat: The number of timed runs
+        :type repeat: int
+
+        :rtype: dict
+        """
+        prepared = self.factory(env)
+        if isinstance(prepared, tuple):
+            setup, run = prepared
+        else:
+            setup, run = None, prepared
+
+        ops = self.ops(env) if callable(self.ops) else self.ops
+
+        # Warming up caches so that the first timed run is not penalized
+        if setup:
+            setup()
+
+        run()
+
+        timings = []
+        for _ in range(repeat):
+            if setup:
+                setup()
+
+            gc.collect()
+            gc.disable()
+            try:
+                start = default_timer()
+                run()
+                timings.append(default_timer() - start)
+            finally:
+                gc.enable()
+
+        peak_memory = None
+        if self.memory and tracemalloc is not None:
+            if setup:
+                setup()
+
+            gc.collect()
+            tracemalloc.start()
+            try:
+                run()
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        timings.sort()
+        best = timings[0]
+
+        return {
+            "name": self.name,
+            "group": self.group,
+            "ops": ops,
+            "repeat": repeat,
+            "min": best,
+            "median": timings[len(timings) // 2],
+            "mean": sum(timings) / len(timings),
+            "ops_per_sec": ops / best if best else None,
+            "peak_memory": peak_memory,
+        }
+
+
+def benchmark(name, group=None, ops=1, memory=False):
+    """
+    Register a benchmark.
+
+    :param name: The unique name of the benchmark
+    :type name: str
+
+    :param group: The group of the benchmark
+    :type group: str
+
+    :param ops: The number of operations performed by a single run
+    :type ops: int or callable
+
+    :param memory: Whether to measure the peak memory of a run
+    :type memory: bool
+    """
+
+    def decorator(factory):
+        _registry.append(Benchmark(name, factory, group, ops, memory))
+
+        return factory
+
+    return decorator
+
+
+def get_benchmarks(pattern=None):
+    """
+    Get the registered benchmarks, optionally filtered by name.
+
+    :param pattern: A regular expression the name must match
+    :type pattern: str
+
+    :rtype: list
+    """
+    # Importing the modules registers their benchmarks
+    from . import bench_compile, bench_orm, bench_io, bench_import  # noqa
+
+    if pattern is None:
+        return list(_registry)
+
+    return [b for b in _registry if re.search(pattern, b.name)]
+
+
+def run_benchmarks(benchmarks, env, repeat=5, output=None):
+    """
+    Run a list of benchmarks and collect their results.
+
+    :rtype: dict
+    """
+    results = []
+    for bench in benchmarks:
+        result = bench.run(env, repeat)
+        results.append(result)
+
+        if output is not None:
+            output(result)
+
+    return {"meta": get_meta(env), "results": results}
+
+
+def get_meta(env):
+    """
+    Describe the environment the benchmarks are run in.
+
+    :rtype: dict
+    """
+    try:
+        commit = (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.STDOUT
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "orator": orator.__version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "scale": env.scale,
+        "date": datetime.datetime.utcnow().isoformat(),
+    }
+
+
+def compare(baseline, current, threshold=0.1):
+    """
+    Compare two sets of results.
+
+    :param baseline: The reference results
+    :type baseline: dict
+
+    :param current: The new results
+    :type current: dict
+
+    :param threshold: The relative slowdown considered a regression
+    :type threshold: float
+
+    :return: The comparison of each benchmark present in both sets
+    :rtype: list
+    """
+    reference = dict((r["name"], r) for r in baseline["results"])
+
+    comparison = []
+    for result in current["results"]:
+        base = reference.get(result["name"])
+        if base is None or not base["min"]:
+            continue
+
+        # Ratios are based on the best timing, which is the least noisy one
+        ratio = result["min"] / base["min"]
+
+        comparison.append(
+            {
+                "name": result["name"],
+                "baseline": base["min"],
+                "current": result["min"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+
+    return comparison
+
+
+def load(path):
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def dump(results, path):
+    if path == "-":
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+        return
+
+    with open(path, "w") as fh:
+        json.dump(results, fh, indent=2)
@@ -14,6 +14,8 @@ from .migrations import (
     StatusCommand,
     ResetCommand,
     RefreshCommand,
+    SquashCommand,
+    DiffCommand,
 )
 
 application.add(InstallCommand())
@@ -23,6 +25,8 @@ application.add(RollbackCommand())
 application.add(StatusCommand())
 application.add(ResetCommand())
 application.add(RefreshCommand())
+application.add(SquashCommand())
+application.add(DiffCommand())
 
 # Seeds
 from .seeds import SeedersMakeCommand, SeedCommand
@@ -7,3 +7,5 @@ from .rollback_command import RollbackCommand
 from .status_command import StatusCommand
 from .reset_command import ResetCommand
 from .refresh_command import RefreshCommand
+from .squash_command import SquashCommand
+from .diff_command import DiffCommand
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import os
+from orator.migrations import MigrationCreator, SchemaDiffer
+from .base_command import BaseCommand
+
+
+class DiffCommand(BaseCommand):
+    """
+    Generate the migration going from the database schema to a declared schema.
+
+    migrate:diff
+        {name=update_schema : The name of the migration.}
+        {--d|database= : The database connection to use.}
+        {--p|path= : The path to migrations files.}
+        {--s|schema= : The declared schema file, schema.py in the migrations path by default.}
+        {--shadow= : The connection of an empty database to build the declared schema on.}
+        {--sql : Print the SQL statements instead of creating a migration.}
+    """
+
+    # The file caching the declared schema, in the migrations path
+    SNAPSHOT_FILE = ".schema_snapshot.json"
+
+    def handle(self):
+        """
+        Executes the command.
+        """
+        path = self.option("path")
+        if path is None:
+            path = self._get_migration_path()
+
+        schema = self.option("schema") or os.path.join(path, "schema.py")
+
+        shadow = self.option("shadow")
+        if shadow is not None:
+            shadow = self.resolver.connection(shadow)
+
+        differ = SchemaDiffer(
+            self.resolver.connection(self.option("database")),
+            shadow,
+            os.path.join(path, self.SNAPSHOT_FILE),
+        )
+
+        up, down = differ.diff(schema)
+
+        if not up:
+            return self.info("The database schema is up to date")
+
+        if self.option("sql"):
+            for statement in differ.to_sql(up):
+                self.line("%s;" % statement)
+
+            return
+
+        migration = MigrationCreator().create(
+            self.argument("name"), path, stub=differ.to_stub(up, down)
+        )
+
+        self.line(
+            "<info>Created migration:</info> {}".format(os.path.basename(migration))
+        )
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from orator.migrations import Migrator, DatabaseMigrationRepository
+from orator.migrations import Migrator, DatabaseMigrationRepository, ParallelMigrator
 from .base_command import BaseCommand
 
 
@@ -16,6 +16,9 @@ class MigrateCommand(BaseCommand):
                         Defaults to <comment>./seeders</comment>.}
         {--P|pretend : Dump the SQL queries that would be run.}
         {--f|force : Force the operation to run.}
+        {--t|targets=* : The database connections to migrate concurrently.}
+        {--w|workers=4 : The maximum number of targets migrated at once.}
+        {--fail-fast : Do not migrate the remaining targets after a failure.}
     """
 
     def handle(self):
@@ -24,6 +27,9 @@ class MigrateCommand(BaseCommand):
         ):
             return
 
+        if self.option("targets"):
+            return self._migrate_targets(self.option("targets"))
+
         database = self.option("database")
         repository = DatabaseMigrationRepository(self.resolver, "migrations")
 
@@ -59,6 +65,70 @@ class MigrateCommand(BaseCommand):
 
             self.call("db:seed", options)
 
+    def _migrate_targets(self, targets):
+        """
+        Run the migrations on several databases concurrently.
+
+        :param targets: The database connections
+        :type targets: list
+
+        :return: The exit code
+        :rtype: int
+        """
+        migrator = ParallelMigrator(
+            self.resolver, "migrations", workers=int(self.option("workers"))
+        )
+
+        path = self.option("path")
+
+        if path is None:
+            path = self._get_migration_path()
+
+        results = migrator.run(
+            path, targets, self.option("pretend"), self.option("fail-fast")
+        )
+
+        rows = []
+        for result in results:
+            if result.notes:
+                self.line("[<info>%s</info>]" % result.connection)
+
+                for note in result.notes:
+                    self.line(note)
+
+            if result.status == ParallelMigrator.FAILED:
+                self.line("<error>%s</error>" % result.error)
+                status = "<fg=red>Failed</>"
+            elif result.status == ParallelMigrator.SKIPPED:
+                status = "<comment>Skipped</comment>"
+            else:
+                status = "<info>Succeeded</info>"
+
+            rows.append(
+                [
+                    "<fg=cyan>%s</>" % result.connection,
+                    status,
+                    str(len(result.migrations)),
+                ]
+            )
+
+        self.table(["Target", "Status", "Migrated"], rows).render()
+
+        if any(result.status != ParallelMigrator.SUCCEEDED for result in results):
+            return 1
+
+        if self.option("seed"):
+            for target in targets:
+                options = [("--force", self.option("force")), ("--database", target)]
+
+                if self.get_definition().has_option("config"):
+                    options.append(("--config", self.option("config")))
+
+                if self.option("seed-path"):
+                    options.append(("--path", self.option("seed-path")))
+
+                self.call("db:seed", options)
+
     def _prepare_database(self, migrator, database):
         migrator.set_connection(database)
 
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from orator.migrations import Migrator, DatabaseMigrationRepository
+from .base_command import BaseCommand
+
+
+class SquashCommand(BaseCommand):
+    """
+    Dump the database schema to replace the migrations which have been run.
+
+    migrate:squash
+        {--d|database= : The database connection to use.}
+        {--p|path= : The path of migrations files to be executed.}
+        {--prune : Delete the squashed migrations files.}
+    """
+
+    def handle(self):
+        """
+        Executes the command.
+        """
+        database = self.option("database")
+        repository = DatabaseMigrationRepository(self.resolver, "migrations")
+
+        migrator = Migrator(repository, self.resolver)
+
+        migrator.set_connection(database)
+
+        if not migrator.repository_exists():
+            return self.error("No migrations found")
+
+        path = self.option("path")
+
+        if path is None:
+            path = self._get_migration_path()
+
+        migrations = migrator.squash(path, self.option("prune"))
+
+        self.line(
+            "<info>Squashed</info> %d migrations into <fg=cyan>%s</>"
+            % (len(migrations), Migrator.SCHEMA_FILE)
+        )
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from orator.migrations import Migrator, DatabaseMigrationRepository
+from collections import OrderedDict
+from orator.migrations import Migrator, DatabaseMigrationRepository, ParallelMigrator
 from .base_command import BaseCommand
 
 
@@ -11,12 +12,16 @@ class StatusCommand(BaseCommand):
     migrate:status
         {--d|database= : The database connection to use.}
         {--p|path= : The path of migrations files to be executed.}
+        {--t|targets=* : The database connections to check.}
     """
 
     def handle(self):
         """
         Executes the command.
         """
+        if self.option("targets"):
+            return self._targets_status(self.option("targets"))
+
         database = self.option("database")
 
         self.resolver.set_default_connection(database)
@@ -35,7 +40,7 @@ class StatusCommand(BaseCommand):
         if path is None:
             path = self._get_migration_path()
 
-        ran = migrator.get_repository().get_ran()
+        ran = set(migrator.get_repository().get_ran())
 
         migrations = []
         for migration in migrator._get_migration_files(path):
@@ -55,3 +60,49 @@ class StatusCommand(BaseCommand):
 
     def _prepare_database(self, migrator, database):
         migrator.set_connection(database)
+
+    def _targets_status(self, targets):
+        """
+        Show the status of the migrations on several databases.
+
+        :param targets: The database connections
+        :type targets: list
+        """
+        path = self.option("path")
+
+        if path is None:
+            path = self._get_migration_path()
+
+        status = ParallelMigrator(self.resolver, "migrations").status(targets)
+
+        errors = OrderedDict()
+        for target, ran in list(status.items()):
+            if ran is None or isinstance(ran, Exception):
+                errors[target] = ran
+                status[target] = set()
+            else:
+                status[target] = set(ran)
+
+        migrations = []
+        for migration in Migrator(None, self.resolver)._get_migration_files(path):
+            pending = [target for target, ran in status.items() if migration not in ran]
+
+            if not pending:
+                ran = "<info>Yes</>"
+            elif len(pending) == len(targets):
+                ran = "<fg=red>No</>"
+            else:
+                ran = "<comment>%d/%d</>" % (len(targets) - len(pending), len(targets))
+
+            migrations.append(["<fg=cyan>%s</>" % migration, ran, ", ".join(pending)])
+
+        if not migrations:
+            return self.error("No migrations found")
+
+        self.table(["Migration", "Ran?", "Pending on"], migrations).render()
+
+        for target, error in errors.items():
+            if error is None:
+                self.line("<comment>No migrations table on %s</comment>" % target)
+            else:
+                self.line("<error>Unable to check %s: %s</error>" % (target, error))
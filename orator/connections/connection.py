@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import re
 import time
 import logging
 from functools import wraps
@@ -11,12 +12,16 @@ from ..query.expression import QueryExpression
 from ..query.processors.processor import QueryProcessor
 from ..schema.builder import SchemaBuilder
 from ..dbal.schema_manager import SchemaManager
+from ..dbal.table import Table
 from ..exceptions.query import QueryException
 
 
 query_logger = logging.getLogger("orator.connection.queries")
 connection_logger = logging.getLogger("orator.connection")
 
+# Statements which may change the schema
+DDL_PATTERN = re.compile(r"\b(?:ALTER|CREATE|DROP|RENAME|TRUNCATE)\s", re.I)
+
 
 def run(wrapped):
     """
@@ -115,6 +120,12 @@ class Connection(ConnectionInterface):
 
         self._server_version = None
 
+        # The catalog rows describing the tables, by table
+        self._schema_cache = {}
+
+        # The row counts of the paginated queries, by query
+        self._count_cache = {}
+
         self.use_default_query_grammar()
 
     def use_default_query_grammar(self):
@@ -238,6 +249,70 @@ class Connection(ConnectionInterface):
 
                     results = cursor.fetchmany(size)
 
+    def select_tuples(
+        self, size, query, bindings=None, use_read_connection=True, server_side=False
+    ):
+        """
+        Execute a select query and fetch the rows as tuples, by chunks.
+
+        :param size: The number of rows of a chunk
+        :type size: int
+
+        :param server_side: Whether to use a server-side cursor, if supported,
+                            so that the rows are not all sent at once
+        :type server_side: bool
+
+        :return: The names of the columns, the number of rows if known
+                 and an iterator over the chunks of rows
+        :rtype: tuple
+        """
+        if self.pretending():
+            self.log_query(query, bindings)
+
+            return [], None, iter([])
+
+        self._reconnect_if_missing_connection()
+
+        if use_read_connection:
+            connection = self.get_read_connection()
+        else:
+            connection = self.get_connection()
+
+        bindings = self.prepare_bindings(bindings)
+
+        start = time.time()
+        cursor = connection.tuple_cursor(server_side)
+
+        try:
+            cursor.execute(self._prepare_tuple_query(query), bindings)
+
+            # Server-side cursors only describe the rows once some are fetched
+            first = cursor.fetchmany(size)
+        except Exception as e:
+            cursor.close()
+
+            raise QueryException(query, bindings, e)
+
+        self.log_query(query, bindings, self._get_elapsed_time(start))
+
+        columns = [column[0] for column in cursor.description or []]
+        count = cursor.rowcount if not server_side and cursor.rowcount >= 0 else None
+
+        def chunks():
+            try:
+                results = first
+                while results:
+                    yield results
+
+                    results = cursor.fetchmany(size)
+            finally:
+                cursor.close()
+
+        return columns, count, chunks()
+
+    def _prepare_tuple_query(self, query):
+        return query
+
     def _get_cursor_for_select(self, use_read_connection=True):
         if use_read_connection:
             self._cursor = self.get_read_connection().cursor()
@@ -260,6 +335,8 @@ class Connection(ConnectionInterface):
         if self.pretending():
             return True
 
+        self._forget_schema_if_changed(query)
+
         bindings = self.prepare_bindings(bindings)
 
         return self._new_cursor().execute(query, bindings)
@@ -289,16 +366,112 @@ class Connection(ConnectionInterface):
         if self.pretending():
             return True
 
+        self._forget_schema_if_changed(query)
+
         return bool(self.get_connection().execute(query))
 
+    def copy_from(self, table, rows, columns):
+        raise NotImplementedError(
+            "COPY is not supported by %s" % self.__class__.__name__
+        )
+
+    def copy_to(self, query, bindings, destination):
+        raise NotImplementedError(
+            "COPY is not supported by %s" % self.__class__.__name__
+        )
+
+    def dump_schema(self, exclude=None):
+        raise NotImplementedError(
+            "Dumping the schema is not supported by %s" % self.__class__.__name__
+        )
+
+    def load_schema(self, sql):
+        """
+        Execute the statements of a schema dump.
+
+        :param sql: The statements, separated by blank lines
+        :type sql: str
+        """
+        for statement in re.split(r";\s*\n\s*\n", sql):
+            statement = statement.strip().rstrip(";")
+
+            if statement:
+                self.statement(statement)
+
+    def get_replication_lag(self):
+        """
+        Get how far behind the replicas are.
+
+        :return: The replication lag, in seconds, or None if unknown
+        :rtype: float or None
+        """
+        return None
+
     def prepare_bindings(self, bindings):
         if bindings is None:
             return []
 
         return bindings
 
+    def transaction(self, callback=None, retries=0, backoff=0.1):
+        """
+        Execute a block inside a transaction.
+
+        Used as a context manager, the block is executed once.
+        When a callback is given, it is executed inside the transaction
+        and executed again, up to ``retries`` times, if the transaction
+        fails because of a deadlock or a serialization failure.
+
+        :param callback: The callback to execute, receiving the connection
+        :type callback: callable
+
+        :param retries: The maximum number of retries
+        :type retries: int
+
+        :param backoff: The delay before the first retry, in seconds,
+                        doubled at each retry, or a callable receiving
+                        the attempt number and returning the delay
+        :type backoff: float or callable
+
+        :return: The result of the callback
+        """
+        if callback is None:
+            if retries:
+                raise ValueError("Retrying a transaction requires a callback")
+
+            return self._transaction()
+
+        attempt = 0
+        while True:
+            try:
+                with self._transaction():
+                    return callback(self)
+            except Exception as e:
+                # Only a whole transaction can be retried, since the
+                # enclosing one might have been rolled back by the database.
+                if (
+                    attempt >= retries
+                    or self._transactions > 0
+                    or not self._caused_by_retryable_error(e)
+                ):
+                    raise
+
+            if callable(backoff):
+                delay = backoff(attempt)
+            else:
+                delay = backoff * 2 ** attempt
+
+            attempt += 1
+
+            connection_logger.debug(
+                "Retrying transaction (attempt %d of %d)" % (attempt, retries)
+            )
+
+            if delay:
+                time.sleep(delay)
+
     @contextmanager
-    def transaction(self):
+    def _transaction(self):
         self.begin_transaction()
 
         try:
@@ -314,22 +487,99 @@ class Connection(ConnectionInterface):
             raise
 
     def begin_transaction(self):
+        if self._transactions >= 1:
+            self._create_savepoint()
+
         self._transactions += 1
 
     def commit(self):
         if self._transactions == 1:
             self._connection.commit()
+        elif self._transactions > 1:
+            self._release_savepoint()
+        else:
+            return
 
         self._transactions -= 1
 
     def rollback(self):
+        # The schema changes of the transaction may have been rolled back
+        self.forget_schema()
+
         if self._transactions == 1:
             self._transactions = 0
 
             self._connection.rollback()
-        else:
+        elif self._transactions > 1:
+            self._rollback_to_savepoint()
+
             self._transactions -= 1
 
+    def _create_savepoint(self):
+        """
+        Create a savepoint for the transaction about to be started.
+        """
+        self._savepoint_statement(
+            self._query_grammar.compile_savepoint,
+            self._get_savepoint_name(self._transactions + 1),
+        )
+
+    def _release_savepoint(self):
+        """
+        Release the savepoint of the current transaction.
+        """
+        self._savepoint_statement(
+            self._query_grammar.compile_savepoint_release,
+            self._get_savepoint_name(self._transactions),
+        )
+
+    def _rollback_to_savepoint(self):
+        """
+        Roll back the current transaction to its savepoint.
+        """
+        self._savepoint_statement(
+            self._query_grammar.compile_savepoint_rollback,
+            self._get_savepoint_name(self._transactions),
+        )
+
+    def _get_savepoint_name(self, level):
+        return "trans%d" % level
+
+    def _savepoint_statement(self, compiler, name):
+        if self._pretending or not self._query_grammar.supports_savepoints():
+            return
+
+        # Executed like any statement to be logged and wrapped consistently
+        self.statement(compiler(name))
+
+    def _caused_by_retryable_error(self, e):
+        """
+        Determine if an error is a deadlock or a serialization failure
+        after which the transaction can be retried.
+
+        :param e: The error
+        :type e: Exception
+
+        :rtype: bool
+        """
+        if isinstance(e, QueryException):
+            e = e.previous
+
+        message = str(e).lower()
+
+        for s in [
+            "deadlock",
+            "could not serialize access",
+            "serialization failure",
+            "lock wait timeout exceeded",
+            "database is locked",
+            "database table is locked",
+        ]:
+            if s in message:
+                return True
+
+        return False
+
     def transaction_level(self):
         return self._transactions
 
@@ -530,7 +780,44 @@ class Connection(ConnectionInterface):
     def get_column(self, table, column):
         schema = self.get_schema_manager()
 
-        return schema.list_table_details(table).get_column(column)
+        return Table(table, schema.list_table_columns(table)).get_column(column)
+
+    def get_schema_cache(self):
+        """
+        Get the cached catalog rows describing the tables of the connection.
+
+        :rtype: dict
+        """
+        return self._schema_cache
+
+    def get_count_cache(self):
+        """
+        Get the cached row counts of the queries paginated
+        with the "cached" count strategy.
+
+        :return: The expiration time and the count, by query
+        :rtype: dict
+        """
+        return self._count_cache
+
+    def forget_schema(self, table=None):
+        """
+        Clear the cached description of a table, or of every table.
+
+        It is done automatically when executing schema changes
+        but not when they are made by another connection.
+
+        :param table: The table
+        :type table: str
+        """
+        if table is None:
+            self._schema_cache.clear()
+        else:
+            self._schema_cache.pop(table, None)
+
+    def _forget_schema_if_changed(self, query):
+        if self._schema_cache and DDL_PATTERN.search(query):
+            self.forget_schema()
 
     def get_schema_manager(self):
         return SchemaManager(self)
@@ -575,3 +862,12 @@ class Connection(ConnectionInterface):
 
     def get_server_version(self):
         return self._connection.get_server_version()
+
+    def supports_window_functions(self):
+        """
+        Determine whether the server supports window functions,
+        like ROW_NUMBER() OVER (...).
+
+        :rtype: bool
+        """
+        return True
@@ -152,7 +152,39 @@ class ConnectionInterface(object):
         """
         raise NotImplementedError()
 
-    def transaction(self):
+    def select_tuples(
+        self, size, query, bindings=None, use_read_connection=True, server_side=False
+    ):
+        raise NotImplementedError()
+
+    def copy_from(self, table, rows, columns):
+        raise NotImplementedError()
+
+    def copy_to(self, query, bindings, destination):
+        raise NotImplementedError()
+
+    def dump_schema(self, exclude=None):
+        raise NotImplementedError()
+
+    def load_schema(self, sql):
+        raise NotImplementedError()
+
+    def get_replication_lag(self):
+        raise NotImplementedError()
+
+    def get_schema_cache(self):
+        raise NotImplementedError()
+
+    def forget_schema(self, table=None):
+        raise NotImplementedError()
+
+    def get_count_cache(self):
+        raise NotImplementedError()
+
+    def supports_window_functions(self):
+        raise NotImplementedError()
+
+    def transaction(self, callback=None, retries=0, backoff=0.1):
         raise NotImplementedError()
 
     def begin_transaction(self):
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+import io
+import datetime
+import binascii
+
+from ..utils import basestring, decode, lazy_import, PY2
+
+json = lazy_import("simplejson")
+
+
+class CopyReader(io.TextIOBase):
+    """
+    A file-like object streaming rows as CSV data
+    to a COPY ... FROM STDIN statement.
+
+    The rows are consumed lazily, as the driver reads the data,
+    so they can be produced by a generator.
+    """
+
+    def __init__(self, rows, columns, date_format):
+        """
+        :param rows: The rows to copy, as sequences or dictionaries
+        :type rows: iterable
+
+        :param columns: The columns of the rows
+        :type columns: list
+
+        :param date_format: The format of dates
+        :type date_format: str
+        """
+        self._rows = iter(rows)
+        self._columns = columns
+        self._date_format = date_format
+        self._buffer = ""
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            try:
+                row = next(self._rows)
+            except StopIteration:
+                break
+
+            self._buffer += self.format_row(row)
+            self.count += 1
+
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        return data
+
+    def format_row(self, row):
+        """
+        Format a row as a CSV line.
+
+        :param row: The row, as a sequence or a dictionary
+        :type row: list or dict
+
+        :rtype: str
+        """
+        if isinstance(row, dict):
+            row = [row.get(column) for column in self._columns]
+
+        return ",".join(self.format_value(value) for value in row) + "\n"
+
+    def format_value(self, value):
+        """
+        Format a single value for the CSV format of COPY.
+
+        NULL values are unquoted empty strings,
+        so every other string is quoted.
+
+        :rtype: str
+        """
+        if value is None:
+            return ""
+
+        if value is True:
+            return "t"
+
+        if value is False:
+            return "f"
+
+        if isinstance(value, datetime.date):
+            value = value.strftime(self._date_format)
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        elif isinstance(value, (bytes, bytearray)) and not (
+            PY2 and isinstance(value, str)
+        ):
+            value = "\\x%s" % decode(binascii.hexlify(value))
+        elif not isinstance(value, basestring):
+            return str(value)
+
+        return '"%s"' % value.replace('"', '""')
+
+
+class CopyWriter(io.TextIOBase):
+    """
+    A file-like object passing the data
+    of a COPY ... TO STDOUT statement to a callback.
+
+    Being a text file, the data is decoded by the driver.
+    """
+
+    def __init__(self, callback):
+        self._callback = callback
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._callback(data)
+
+        return len(data)
+
+
+class LoadDataWriter(object):
+    """
+    Writes rows to a file in the default format of LOAD DATA INFILE:
+    tab-separated fields, with special characters escaped by a backslash.
+    """
+
+    ESCAPES = [
+        (b"\\", b"\\\\"),
+        (b"\t", b"\\t"),
+        (b"\n", b"\\n"),
+        (b"\r", b"\\r"),
+        (b"\0", b"\\0"),
+    ]
+
+    def __init__(self, columns, date_format, encoding="utf-8"):
+        """
+        :param columns: The columns of the rows
+        :type columns: list
+
+        :param date_format: The format of dates
+        :type date_format: str
+
+        :param encoding: The encoding of the file
+        :type encoding: str
+        """
+        self._columns = columns
+        self._date_format = date_format
+        self._encoding = encoding
+
+    def write(self, rows, file):
+        """
+        Write rows to a binary file.
+
+        :param rows: The rows, as sequences or dictionaries
+        :type rows: iterable
+
+        :param file: The file to write to
+        :type file: file
+
+        :return: The number of written rows
+        :rtype: int
+        """
+        count = 0
+        for row in rows:
+            file.write(self.format_row(row))
+            count += 1
+
+        return count
+
+    def format_row(self, row):
+        """
+        Format a row as a line of the file.
+
+        :param row: The row, as a sequence or a dictionary
+        :type row: list or dict
+
+        :rtype: bytes
+        """
+        if isinstance(row, dict):
+            row = [row.get(column) for column in self._columns]
+
+        return b"\t".join(self.format_value(value) for value in row) + b"\n"
+
+    def format_value(self, value):
+        """
+        Format a single value.
+
+        :rtype: bytes
+        """
+        if value is None:
+            return b"\\N"
+
+        if value is True:
+            return b"1"
+
+        if value is False:
+            return b"0"
+
+        if isinstance(value, datetime.date):
+            value = value.strftime(self._date_format)
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        elif not isinstance(value, (basestring, bytes, bytearray)):
+            value = str(value)
+
+        if not isinstance(value, (bytes, bytearray)):
+            value = value.encode(self._encoding)
+
+        value = bytes(value)
+        for char, escaped in self.ESCAPES:
+            value = value.replace(char, escaped)
+
+        return value
@@ -1,8 +1,16 @@
 # -*- coding: utf-8 -*-
 
+import os
+import re
+import tempfile
+
+from collections import namedtuple, OrderedDict
 from ..utils import decode
 from ..utils import PY2
 from .connection import Connection
+from .copy_stream import LoadDataWriter
+from ..exceptions.query import QueryException
+from ..utils.qmarker import qmark
 from ..query.grammars.mysql_grammar import MySQLQueryGrammar
 from ..query.processors.mysql_processor import MySQLQueryProcessor
 from ..schema.grammars import MySQLSchemaGrammar
@@ -10,10 +18,24 @@ from ..schema import MySQLSchemaBuilder
 from ..dbal.mysql_schema_manager import MySQLSchemaManager
 
 
+LoadDataResult = namedtuple("LoadDataResult", ["rows", "warnings"])
+
+
 class MySQLConnection(Connection):
 
     name = "mysql"
 
+    # The errors raised when loading local files is disabled,
+    # either by the server or by the client.
+    LOCAL_INFILE_ERRORS = (1148, 2068, 3948)
+
+    # The maximum number of rows inserted by a single
+    # statement when falling back to inserts.
+    load_data_batch_size = 1000
+
+    # Whether local files can be loaded, once known
+    _local_infile = None
+
     def get_default_query_grammar(self):
         return MySQLQueryGrammar(marker=self._marker)
 
@@ -37,36 +59,277 @@ class MySQLConnection(Connection):
     def get_schema_manager(self):
         return MySQLSchemaManager(self)
 
-    def begin_transaction(self):
-        self._reconnect_if_missing_connection()
+    def load_data(self, table, rows, columns, replace=False):
+        """
+        Load rows into a table with a LOAD DATA LOCAL INFILE statement.
+
+        The rows are streamed to a temporary file which is sent to the server.
+        If the server or the client does not allow loading local files,
+        the rows are inserted by batches instead.
+        Loading local files is enabled on the client side
+        with the ``local_infile`` option of the connection configuration.
+
+        Like LOAD DATA, the rows conflicting with existing ones are ignored,
+        or replace them if ``replace`` is True.
+
+        :param table: The table to load
+        :type table: str
+
+        :param rows: The rows, as sequences or dictionaries
+        :type rows: iterable
 
+        :param columns: The columns of the rows
+        :type columns: list
+
+        :param replace: Whether to replace the existing rows with the same keys
+        :type replace: bool
+
+        :return: The number of loaded rows and the warnings
+        :rtype: LoadDataResult
+        """
+        grammar = self.get_query_grammar()
+        charset = self._config.get("charset", "utf8")
+        if not charset.startswith("utf8"):
+            charset = "utf8"
+
+        query = grammar.compile_load_data(table, columns, replace, charset)
+
+        if not self._supports_local_infile(query):
+            return self._insert_data(table, rows, columns, replace)
+
+        writer = LoadDataWriter(columns, grammar.get_date_format())
+
+        fd, path = tempfile.mkstemp(suffix=".tsv")
         try:
-            self._connection.autocommit(False)
-        except Exception as e:
-            if self._caused_by_lost_connection(e):
-                self.reconnect()
-                self._connection.autocommit(False)
-            else:
+            with os.fdopen(fd, "wb") as fh:
+                writer.write(rows, fh)
+
+            loaded = self.affecting_statement(query, [path])
+        finally:
+            os.remove(path)
+
+        return LoadDataResult(loaded, self._get_warnings())
+
+    def _supports_local_infile(self, query):
+        """
+        Determine if local files can be loaded,
+        by loading an empty file the first time.
+
+        :rtype: bool
+        """
+        if self._local_infile is not None:
+            return self._local_infile
+
+        fd, path = tempfile.mkstemp(suffix=".tsv")
+        os.close(fd)
+
+        try:
+            self.affecting_statement(query, [path])
+            supported = True
+        except QueryException as e:
+            args = getattr(e.previous, "args", None)
+
+            if not args or args[0] not in self.LOCAL_INFILE_ERRORS:
                 raise
 
+            supported = False
+        finally:
+            os.remove(path)
+
+        if not self.pretending():
+            self._local_infile = supported
+
+        return supported
+
+    def _insert_data(self, table, rows, columns, replace=False):
+        """
+        Insert rows into a table by batches.
+
+        :rtype: LoadDataResult
+        """
+        grammar = self.get_query_grammar()
+        query = self.table(table)
+        size = max(1, min(self.load_data_batch_size, 65535 // len(columns)))
+
+        loaded = 0
+        warnings = []
+        batch = []
+        for row in rows:
+            if isinstance(row, dict):
+                row = [row.get(column) for column in columns]
+
+            batch.append(OrderedDict(zip(columns, row)))
+
+            if len(batch) < size:
+                continue
+
+            loaded += self._insert_batch(grammar, query, batch, replace)
+            warnings += self._get_warnings()
+            batch = []
+
+        if batch:
+            loaded += self._insert_batch(grammar, query, batch, replace)
+            warnings += self._get_warnings()
+
+        return LoadDataResult(loaded, warnings)
+
+    def _insert_batch(self, grammar, query, batch, replace):
+        bindings = [value for record in batch for value in record.values()]
+
+        return self.affecting_statement(
+            grammar.compile_bulk_insert(query, batch, replace), bindings
+        )
+
+    def _get_warnings(self):
+        """
+        Get the warnings of the last statement.
+
+        :rtype: list
+        """
+        if self.pretending():
+            return []
+
+        return list(self.select("SHOW WARNINGS", [], False))
+
+    def dump_schema(self, exclude=None):
+        """
+        Get the statements creating the tables and views.
+
+        :param exclude: The tables to leave out
+        :type exclude: list
+
+        :rtype: list
+        """
+        exclude = set(exclude or [])
+        tables = []
+        views = []
+
+        for row in self.select("SHOW FULL TABLES", [], False):
+            row = list(row.values())
+            name, type = row[0], row[1]
+
+            if name in exclude:
+                continue
+
+            if type == "VIEW":
+                views.append(name)
+            else:
+                tables.append(name)
+
+        # The tables are created in alphabetical order,
+        # so the foreign keys are only checked once they all exist.
+        statements = ["SET FOREIGN_KEY_CHECKS=0"]
+
+        for name in tables:
+            sql = self._show_create("TABLE", name)["Create Table"]
+
+            statements.append(re.sub(r" AUTO_INCREMENT=\d+", "", sql))
+
+        for name in views:
+            statements.append(self._show_create("VIEW", name)["Create View"])
+
+        statements.append("SET FOREIGN_KEY_CHECKS=1")
+
+        return statements
+
+    def load_schema(self, sql):
+        # The question marks are escaped from the "qmark" conversion
+        super(MySQLConnection, self).load_schema(sql.replace("?", "??"))
+
+    def _show_create(self, type, name):
+        return self.select(
+            "SHOW CREATE %s `%s`" % (type, name.replace("`", "``")), [], False
+        )[0]
+
+    def supports_window_functions(self):
+        version = self.server_version
+
+        if version is None:
+            return True
+
+        # Window functions were added in MariaDB 10.2 and MySQL 8.0
+        if version[3] == "mariadb":
+            return tuple(version[:2]) >= (10, 2)
+
+        return tuple(version[:2]) >= (8, 0)
+
+    def get_replication_lag(self):
+        """
+        Get how far behind the replica used for reads is.
+
+        :return: The replication lag, in seconds, or None if unknown
+        :rtype: float or None
+        """
+        if self.pretending():
+            return None
+
+        # The status is empty when the read connection is not a replica
+        results = self.select("SHOW SLAVE STATUS", [])
+
+        if not results or results[0].get("Seconds_Behind_Master") is None:
+            return None
+
+        return float(results[0]["Seconds_Behind_Master"])
+
+    def _prepare_tuple_query(self, query):
+        # The tuple cursors do not convert "qmark" queries
+        if self._marker == "?":
+            return qmark(query)
+
+        return query
+
+    def begin_transaction(self):
+        # Nested transactions only create a savepoint
+        # in the transaction already in progress.
+        if self._transactions == 0:
+            self._reconnect_if_missing_connection()
+
+            try:
+                self._connection.autocommit(False)
+            except Exception as e:
+                if self._caused_by_lost_connection(e):
+                    self.reconnect()
+                    self._connection.autocommit(False)
+                else:
+                    raise
+
         super(MySQLConnection, self).begin_transaction()
 
     def commit(self):
         if self._transactions == 1:
             self._connection.commit()
             self._connection.autocommit(True)
+        elif self._transactions > 1:
+            self._release_savepoint()
+        else:
+            return
 
         self._transactions -= 1
 
     def rollback(self):
+        # The schema changes of the transaction may have been rolled back
+        self.forget_schema()
+
         if self._transactions == 1:
             self._transactions = 0
 
             self._connection.rollback()
             self._connection.autocommit(True)
-        else:
+        elif self._transactions > 1:
+            self._rollback_to_savepoint()
+
             self._transactions -= 1
 
+    def _caused_by_retryable_error(self, e):
+        previous = getattr(e, "previous", e)
+        args = getattr(previous, "args", None)
+
+        # ER_LOCK_DEADLOCK and ER_LOCK_WAIT_TIMEOUT
+        if args and args[0] in (1213, 1205):
+            return True
+
+        return super(MySQLConnection, self)._caused_by_retryable_error(e)
+
     def _get_cursor_query(self, query, bindings):
         if not hasattr(self._cursor, "_last_executed") or self._pretending:
             return super(MySQLConnection, self)._get_cursor_query(query, bindings)
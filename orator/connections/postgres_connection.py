@@ -1,8 +1,16 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import division
-from ..utils import PY2
+
+import os
+import time
+import subprocess
+
+from ..utils import PY2, decode
 from .connection import Connection, run
+from .copy_stream import CopyReader, CopyWriter
+from ..exceptions.query import QueryException
+from ..utils.qmarker import qmark
 from ..query.grammars.postgres_grammar import PostgresQueryGrammar
 from ..query.processors.postgres_processor import PostgresQueryProcessor
 from ..schema.grammars import PostgresSchemaGrammar
@@ -30,14 +38,165 @@ class PostgresConnection(Connection):
         if self.pretending():
             return True
 
+        self._forget_schema_if_changed(query)
+
         bindings = self.prepare_bindings(bindings)
 
         self._new_cursor().execute(query, bindings)
 
         return True
 
+    def copy_from(self, table, rows, columns):
+        """
+        Load rows into a table with a COPY statement.
+
+        The rows are streamed to the database as they are produced,
+        so they can be given as a generator.
+
+        :param table: The table to load
+        :type table: str
+
+        :param rows: The rows, as sequences or dictionaries
+        :type rows: iterable
+
+        :param columns: The columns of the rows
+        :type columns: list
+
+        :return: The number of copied rows
+        :rtype: int
+        """
+        grammar = self.get_query_grammar()
+        query = grammar.compile_copy_from(table, columns)
+
+        reader = CopyReader(rows, columns, grammar.get_date_format())
+
+        self._copy(query, None, reader)
+
+        return reader.count
+
+    def copy_to(self, query, bindings, destination):
+        """
+        Write the data of a COPY ... TO STDOUT statement.
+
+        :param query: The COPY statement
+        :type query: str
+
+        :param bindings: The bindings of the copied query
+        :type bindings: list
+
+        :param destination: A file-like object or a callback receiving the data
+        :type destination: file or callable
+        """
+        if callable(destination) and not hasattr(destination, "write"):
+            destination = CopyWriter(destination)
+
+        self._copy(query, self.prepare_bindings(bindings), destination)
+
+    def dump_schema(self, exclude=None):
+        """
+        Get the script creating the schema, dumped by ``pg_dump``.
+
+        :param exclude: The tables to leave out
+        :type exclude: list
+
+        :rtype: list
+        """
+        command = ["pg_dump", "--schema-only", "--no-owner", "--no-privileges"]
+
+        for option in ["host", "port", "user"]:
+            if self._config.get(option):
+                command.append("--%s=%s" % (option, self._config[option]))
+
+        for table in exclude or []:
+            command.append("--exclude-table=%s" % table)
+
+        command.append(self._config["database"])
+
+        env = dict(os.environ)
+        if self._config.get("password"):
+            env["PGPASSWORD"] = str(self._config["password"])
+
+        try:
+            output = subprocess.check_output(command, env=env)
+        except OSError:
+            raise RuntimeError("pg_dump is required to dump PostgreSQL schemas")
+
+        # The psql meta-commands can't be executed by the server
+        lines = [l for l in decode(output).splitlines() if not l.startswith("\\")]
+
+        return ["\n".join(lines)]
+
+    def load_schema(self, sql):
+        """
+        Execute the script of a schema dump.
+
+        :param sql: The script
+        :type sql: str
+        """
+        # The dump clears the search path for its own session
+        # so it is only changed for the transaction loading it.
+        sql = sql.replace(
+            "set_config('search_path', '', false)",
+            "set_config('search_path', '', true)",
+        )
+
+        with self.transaction():
+            # The question marks are escaped from the "qmark" conversion
+            self.statement(sql.replace("?", "??"))
+
+    def get_replication_lag(self):
+        """
+        Get how far behind the replicas of the primary server are.
+
+        :return: The replication lag, in seconds, or None if unknown
+        :rtype: float or None
+        """
+        if self.pretending():
+            return None
+
+        results = self.select(
+            "SELECT EXTRACT(EPOCH FROM MAX(replay_lag)) AS lag FROM pg_stat_replication",
+            [],
+            False,
+        )
+
+        if not results or results[0]["lag"] is None:
+            return None
+
+        return float(results[0]["lag"])
+
+    def _copy(self, query, bindings, file):
+        self._reconnect_if_missing_connection()
+
+        start = time.time()
+
+        if not self.pretending():
+            cursor = self._new_cursor()
+
+            try:
+                if bindings:
+                    # COPY does not accept parameters
+                    # so we interpolate the bindings beforehand.
+                    query = cursor.mogrify(query, bindings)
+
+                cursor.copy_expert(query, file)
+            except Exception as e:
+                raise QueryException(query, bindings, e)
+
+        self.log_query(query, bindings, self._get_elapsed_time(start))
+
+    def _prepare_tuple_query(self, query):
+        # The tuple cursors do not convert "qmark" queries
+        if self._marker == "?":
+            return qmark(query)
+
+        return query
+
     def begin_transaction(self):
-        self._connection.autocommit = False
+        # Autocommit can't be changed once a transaction is in progress,
+        # nested transactions only create a savepoint.
+        if self._transactions == 0:
+            self._connection.autocommit = False
 
         super(PostgresConnection, self).begin_transaction()
 
@@ -45,18 +204,36 @@ class PostgresConnection(Connection):
         if self._transactions == 1:
             self._connection.commit()
             self._connection.autocommit = True
+        elif self._transactions > 1:
+            self._release_savepoint()
+        else:
+            return
 
         self._transactions -= 1
 
     def rollback(self):
+        # The schema changes of the transaction may have been rolled back
+        self.forget_schema()
+
         if self._transactions == 1:
             self._transactions = 0
 
             self._connection.rollback()
             self._connection.autocommit = True
-        else:
+        elif self._transactions > 1:
+            self._rollback_to_savepoint()
+
             self._transactions -= 1
 
+    def _caused_by_retryable_error(self, e):
+        previous = getattr(e, "previous", e)
+
+        # serialization_failure and deadlock_detected
+        if getattr(previous, "pgcode", None) in ("40001", "40P01"):
+            return True
+
+        return super(PostgresConnection, self)._caused_by_retryable_error(e)
+
     def _get_cursor_query(self, query, bindings):
         if self._pretending:
             if PY2:
@@ -24,26 +24,39 @@ class SQLiteConnection(Connection):
     def get_schema_manager(self):
         return SQLiteSchemaManager(self)
 
-    def begin_transaction(self):
-        self._connection.isolation_level = "DEFERRED"
+    def dump_schema(self, exclude=None):
+        """
+        Get the statements creating the tables, indexes, views and triggers.
 
-        super(SQLiteConnection, self).begin_transaction()
+        :param exclude: The tables to leave out
+        :type exclude: list
+
+        :rtype: list
+        """
+        exclude = set(exclude or [])
+
+        rows = self.select(
+            "SELECT tbl_name, sql FROM sqlite_master "
+            "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' "
+            "ORDER BY CASE type WHEN 'table' THEN 0 WHEN 'index' THEN 1 ELSE 2 END, "
+            "rowid"
+        )
 
-    def commit(self):
-        if self._transactions == 1:
-            self._connection.commit()
-            self._connection.isolation_level = None
+        return [row["sql"] for row in rows if row["tbl_name"] not in exclude]
 
-        self._transactions -= 1
+    def supports_window_functions(self):
+        version = self.server_version
 
-    def rollback(self):
-        if self._transactions == 1:
-            self._transactions = 0
+        # Window functions were added in SQLite 3.25
+        return version is None or tuple(int(v) for v in version[:2]) >= (3, 25)
 
-            self._connection.rollback()
-            self._connection.isolation_level = None
-        else:
-            self._transactions -= 1
+    def begin_transaction(self):
+        # The transaction is started explicitly, rather than by the driver
+        # before the next statement, so that savepoints are nested inside it.
+        if self._transactions == 0 and not self._pretending:
+            self._connection.execute("BEGIN")
+
+        super(SQLiteConnection, self).begin_transaction()
 
     def prepare_bindings(self, bindings):
         bindings = super(SQLiteConnection, self).prepare_bindings(bindings)
@@ -1,6 +1,32 @@
 # -*- coding: utf-8 -*-
 
+import importlib
+
+from ..utils import PY37
 from .connector import Connector
-from .mysql_connector import MySQLConnector
-from .postgres_connector import PostgresConnector
-from .sqlite_connector import SQLiteConnector
+
+# The connectors relying on third-party drivers are only imported
+# when they are first accessed so that unused drivers are never loaded.
+_connectors = {
+    "MySQLConnector": "mysql_connector",
+    "PostgresConnector": "postgres_connector",
+    "SQLiteConnector": "sqlite_connector",
+}
+
+if PY37:
+
+    def __getattr__(name):
+        if name not in _connectors:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+
+        module = importlib.import_module("." + _connectors[name], __name__)
+
+        return getattr(module, name)
+
+
+else:
+    from .mysql_connector import MySQLConnector
+    from .postgres_connector import PostgresConnector
+    from .sqlite_connector import SQLiteConnector
@@ -1,21 +1,22 @@
 # -*- coding: utf-8 -*-
 
 import random
+from .. import connectors
 from ..exceptions import ArgumentError
 from ..exceptions.connectors import UnsupportedDriver
-from .mysql_connector import MySQLConnector
-from .postgres_connector import PostgresConnector
-from .sqlite_connector import SQLiteConnector
 from ..connections import MySQLConnection, PostgresConnection, SQLiteConnection
+from ..utils import basestring
 
 
 class ConnectionFactory(object):
 
+    # Built-in connectors are referenced by name
+    # so that their driver is loaded only when used.
     CONNECTORS = {
-        "sqlite": SQLiteConnector,
-        "mysql": MySQLConnector,
-        "postgres": PostgresConnector,
-        "pgsql": PostgresConnector,
+        "sqlite": "SQLiteConnector",
+        "mysql": "MySQLConnector",
+        "postgres": "PostgresConnector",
+        "pgsql": "PostgresConnector",
     }
 
     CONNECTIONS = {
@@ -84,11 +85,15 @@ class ConnectionFactory(object):
         if driver not in self.CONNECTORS:
             raise UnsupportedDriver(driver)
 
-        return self.CONNECTORS[driver](driver)
+        connector = self.CONNECTORS[driver]
+        if isinstance(connector, basestring):
+            connector = getattr(connectors, connector)
+
+        return connector(driver)
 
     @classmethod
     def register_connector(cls, name, connector):
-        cls.CONNECTORS[connector] = connector
+        cls.CONNECTORS[name] = connector
 
     @classmethod
     def register_connection(cls, name, connection):
@@ -106,5 +106,15 @@ class Connector(object):
     def get_server_version(self):
         return None
 
+    def tuple_cursor(self, server_side=False):
+        """
+        Get a cursor returning the rows as tuples.
+
+        :param server_side: Whether the rows should be kept on the server
+                            and fetched as they are needed, if supported
+        :type server_side: bool
+        """
+        return self._connection.cursor()
+
     def __getattr__(self, item):
         return getattr(self._connection, item)
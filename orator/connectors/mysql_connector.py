@@ -112,6 +112,12 @@ class MySQLConnector(Connector):
     def get_api(self):
         return mysql
 
+    def tuple_cursor(self, server_side=False):
+        if server_side:
+            return self._connection.cursor(mysql.cursors.SSCursor)
+
+        return self._connection.cursor(mysql.cursors.Cursor)
+
     def get_server_version(self):
         version = self._connection.get_server_info()
 
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import uuid
+
 try:
     import psycopg2
     import psycopg2.extras
@@ -48,6 +50,11 @@ class DictCursor(BaseDictCursor):
 
         return super(DictCursor, self).execute(query, vars)
 
+    def mogrify(self, query, vars=None):
+        query = qmark(query)
+
+        return super(DictCursor, self).mogrify(query, vars)
+
     def executemany(self, query, args_seq):
         query = qmark(query)
 
@@ -113,6 +120,18 @@ class PostgresConnector(Connector):
     def autocommit(self, value):
         self._connection.autocommit = value
 
+    def tuple_cursor(self, server_side=False):
+        if not server_side:
+            return self._connection.cursor(cursor_factory=extensions.cursor)
+
+        # Named cursors are declared WITH HOLD
+        # so that they can be used outside of transactions.
+        return self._connection.cursor(
+            "orator_%s" % uuid.uuid4().hex,
+            cursor_factory=extensions.cursor,
+            withhold=True,
+        )
+
     def get_dbal_platform(self):
         return PostgresPlatform()
 
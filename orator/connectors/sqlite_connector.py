@@ -1,18 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from pendulum import Pendulum, Date
-
 try:
     import sqlite3
-
-    from sqlite3 import register_adapter
-
-    register_adapter(Pendulum, lambda val: val.isoformat(" "))
-    register_adapter(Date, lambda val: val.isoformat())
 except ImportError:
     sqlite3 = None
 
 from ..dbal.platforms import SQLitePlatform
+from ..exceptions.connectors import ConnectorException
+from ..utils import PY2
 from ..utils.helpers import serialize
 from .connector import Connector
 
@@ -46,10 +41,61 @@ class SQLiteConnector(Connector):
         "name",
         "foreign_keys",
         "use_qmark",
+        "preset",
+        "shared_cache",
+        "busy_timeout",
+        "journal_mode",
+        "synchronous",
+        "temp_store",
+        "mmap_size",
+        "cache_size",
+    ]
+
+    # The pragmas which can be set in the configuration, in the order
+    # they are applied, with their allowed values (None for integers).
+    PRAGMAS = [
+        ("busy_timeout", None),
+        ("journal_mode", ["delete", "truncate", "persist", "memory", "wal", "off"]),
+        ("synchronous", ["off", "normal", "full", "extra"]),
+        ("temp_store", ["default", "file", "memory"]),
+        ("mmap_size", None),
+        ("cache_size", None),
     ]
 
+    PRESETS = {
+        # Concurrent readers do not block on writers with WAL
+        # and NORMAL synchronization is safe in this mode.
+        "performance": {
+            "journal_mode": "wal",
+            "synchronous": "normal",
+            "temp_store": "memory",
+            "mmap_size": 268435456,
+            "cache_size": -64000,
+            "busy_timeout": 5000,
+        }
+    }
+
+    _adapters_registered = False
+
     def _do_connect(self, config):
-        connection = self.get_api().connect(**self.get_config(config))
+        self._register_adapters()
+
+        params = self.get_config(config)
+
+        # A shared cache in-memory database is shared
+        # by all the connections using the same name.
+        if config.get("shared_cache") and params.get("database") == ":memory:":
+            if PY2:
+                raise ConnectorException(
+                    "Shared cache in-memory databases require Python 3"
+                )
+
+            params["database"] = "file:orator_%s?mode=memory&cache=shared" % (
+                config.get("name") or "default"
+            )
+            params["uri"] = True
+
+        connection = self.get_api().connect(**params)
         connection.isolation_level = None
         connection.row_factory = DictCursor
 
@@ -57,8 +103,70 @@ class SQLiteConnector(Connector):
         if config.get("foreign_keys", True):
             connection.execute("PRAGMA foreign_keys = ON")
 
+        for pragma, value in self.get_pragmas(config):
+            connection.execute("PRAGMA %s = %s" % (pragma, value))
+
         return connection
 
+    def get_pragmas(self, config):
+        """
+        Get the pragmas to set from the configuration and its preset.
+
+        :param config: The connection configuration
+        :type config: dict
+
+        :rtype: list
+        """
+        values = {}
+
+        preset = config.get("preset")
+        if preset:
+            if preset not in self.PRESETS:
+                raise ConnectorException('Unknown SQLite preset "%s"' % preset)
+
+            values.update(self.PRESETS[preset])
+
+        values.update((k, config[k]) for k, _ in self.PRAGMAS if k in config)
+
+        pragmas = []
+        for pragma, allowed in self.PRAGMAS:
+            value = values.get(pragma)
+            if value is None:
+                continue
+
+            # Pragmas can't be bound so their values are validated
+            if allowed is None:
+                value = int(value)
+            else:
+                value = str(value).lower()
+
+                if value not in allowed:
+                    raise ConnectorException(
+                        'Invalid value "%s" for the SQLite %s' % (value, pragma)
+                    )
+
+            pragmas.append((pragma, value))
+
+        return pragmas
+
+    @classmethod
+    def _register_adapters(cls):
+        """
+        Register the adapters for pendulum instances.
+
+        This is done on the first connection so that pendulum
+        is not loaded when simply importing the connector.
+        """
+        if cls._adapters_registered:
+            return
+
+        from pendulum import Pendulum, Date
+
+        sqlite3.register_adapter(Pendulum, lambda val: val.isoformat(" "))
+        sqlite3.register_adapter(Date, lambda val: val.isoformat())
+
+        SQLiteConnector._adapters_registered = True
+
     def get_api(self):
         return sqlite3
 
@@ -70,6 +178,12 @@ class SQLiteConnector(Connector):
     def isolation_level(self, value):
         self._connection.isolation_level = value
 
+    def tuple_cursor(self, server_side=False):
+        cursor = self._connection.cursor()
+        cursor.row_factory = None
+
+        return cursor
+
     def get_dbal_platform(self):
         return SQLitePlatform()
 
@@ -100,6 +100,40 @@ class MySQLPlatform(Platform):
 
         return sql
 
+    def get_list_tables_columns_sql(self):
+        return (
+            "SELECT TABLE_NAME AS table_name, COLUMN_NAME AS field, COLUMN_TYPE AS type, "
+            "IS_NULLABLE AS `null`, COLUMN_KEY AS `key`, COLUMN_DEFAULT AS `default`, "
+            "EXTRA AS extra, COLUMN_COMMENT AS comment, "
+            "CHARACTER_SET_NAME AS character_set, COLLATION_NAME AS collation "
+            "FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() "
+            "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+        )
+
+    def get_list_tables_indexes_sql(self):
+        return """
+            SELECT TABLE_NAME AS table_name, TABLE_NAME AS `Table`, NON_UNIQUE AS Non_Unique,
+            INDEX_NAME AS Key_name, SEQ_IN_INDEX AS Seq_in_index, COLUMN_NAME AS Column_Name,
+            COLLATION AS Collation, CARDINALITY AS Cardinality, SUB_PART AS Sub_Part,
+            PACKED AS Packed, NULLABLE AS `Null`, INDEX_TYPE AS Index_Type, COMMENT AS Comment
+            FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE()
+            ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """
+
+    def get_list_tables_foreign_keys_sql(self):
+        return (
+            "SELECT DISTINCT k.`TABLE_NAME` AS table_name, k.`CONSTRAINT_NAME`, "
+            "k.`COLUMN_NAME`, k.`REFERENCED_TABLE_NAME`, "
+            "k.`REFERENCED_COLUMN_NAME` /*!50116 , c.update_rule, c.delete_rule */ "
+            "FROM information_schema.key_column_usage k /*!50116 "
+            "INNER JOIN information_schema.referential_constraints c ON "
+            "  c.constraint_name = k.constraint_name AND "
+            "  c.table_name = k.table_name AND "
+            "  c.constraint_schema = k.table_schema */ "
+            "WHERE k.table_schema = DATABASE() "
+            "AND k.`REFERENCED_COLUMN_NAME` IS NOT NULL"
+        )
+
     def get_alter_table_sql(self, diff):
         """
         Get the ALTER TABLE SQL statement
@@ -53,7 +53,16 @@ class PostgresPlatform(Platform):
     }
 
     def get_list_table_columns_sql(self, table):
-        sql = """SELECT
+        return self._get_list_columns_sql(self.get_table_where_clause(table))
+
+    def get_list_tables_columns_sql(self):
+        return self._get_list_columns_sql(
+            self.get_table_where_clause() + " AND c.relkind IN ('r', 'p')",
+            "c.relname AS table_name,",
+        )
+
+    def _get_list_columns_sql(self, where_clause, select=""):
+        sql = """SELECT %s
                     a.attnum,
                     quote_ident(a.attname) AS field,
                     t.typname AS type,
@@ -82,15 +91,28 @@ class PostgresPlatform(Platform):
                         AND a.attrelid = c.oid
                         AND a.atttypid = t.oid
                         AND n.oid = c.relnamespace
-                    ORDER BY a.attnum""" % self.get_table_where_clause(
-            table
+                    ORDER BY a.attnum""" % (
+            select,
+            where_clause,
         )
 
         return sql
 
     def get_list_table_indexes_sql(self, table):
+        return self._get_list_indexes_sql(
+            self.get_table_where_clause(table, "sc", "sn")
+        )
+
+    def get_list_tables_indexes_sql(self):
+        return self._get_list_indexes_sql(
+            self.get_table_where_clause(None, "sc", "sn"),
+            "(SELECT tc.relname FROM pg_class tc WHERE tc.oid = pg_index.indrelid) "
+            "AS table_name,",
+        )
+
+    def _get_list_indexes_sql(self, where_clause, select=""):
         sql = """
-              SELECT quote_ident(relname) as relname, pg_index.indisunique, pg_index.indisprimary,
+              SELECT %s quote_ident(relname) as relname, pg_index.indisunique, pg_index.indisprimary,
                      pg_index.indkey, pg_index.indrelid,
                      pg_get_expr(indpred, indrelid) AS where
               FROM pg_class, pg_index
@@ -101,9 +123,7 @@ class PostgresPlatform(Platform):
                   AND sc.oid=si.indrelid AND sc.relnamespace = sn.oid
               ) AND pg_index.indexrelid = oid"""
 
-        sql = sql % self.get_table_where_clause(table, "sc", "sn")
-
-        return sql
+        return sql % (select, where_clause)
 
     def get_list_table_foreign_keys_sql(self, table):
         return (
@@ -121,12 +141,23 @@ class PostgresPlatform(Platform):
             " AND r.contype = 'f'"
         )
 
-    def get_table_where_clause(self, table, class_alias="c", namespace_alias="n"):
+    def get_list_tables_foreign_keys_sql(self):
+        return (
+            "SELECT c.relname AS table_name, quote_ident(r.conname) as conname, "
+            "pg_catalog.pg_get_constraintdef(r.oid, true) AS condef "
+            "FROM pg_catalog.pg_constraint r, pg_catalog.pg_class c, "
+            "pg_catalog.pg_namespace n "
+            "WHERE " + self.get_table_where_clause() + " AND n.oid = c.relnamespace"
+            " AND r.conrelid = c.oid"
+            " AND r.contype = 'f'"
+        )
+
+    def get_table_where_clause(self, table=None, class_alias="c", namespace_alias="n"):
         where_clause = (
             namespace_alias
             + ".nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast') AND "
         )
-        if table.find(".") >= 0:
+        if table is not None and table.find(".") >= 0:
             split = table.split(".")
             schema, table = split[0], split[1]
             schema = "'%s'" % schema
@@ -136,12 +167,11 @@ class PostgresPlatform(Platform):
                 " from pg_catalog.pg_settings where name = 'search_path'),','))"
             )
 
-        where_clause += "%s.relname = '%s' AND %s.nspname = %s" % (
-            class_alias,
-            table,
-            namespace_alias,
-            schema,
-        )
+        # Without a table, every table of the search path matches
+        if table is not None:
+            where_clause += "%s.relname = '%s' AND " % (class_alias, table)
+
+        where_clause += "%s.nspname = %s" % (namespace_alias, schema)
 
         return where_clause
 
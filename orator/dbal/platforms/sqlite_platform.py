@@ -63,6 +63,33 @@ class SQLitePlatform(Platform):
 
         return "PRAGMA foreign_key_list('%s')" % table
 
+    def get_list_tables_columns_sql(self):
+        return (
+            "SELECT m.name AS table_name, p.* "
+            "FROM sqlite_master m JOIN pragma_table_info(m.name) p "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' "
+            "ORDER BY m.name, p.cid"
+        )
+
+    def get_list_tables_indexes_sql(self):
+        return (
+            'SELECT m.name AS table_name, l.name AS key_name, l."unique", '
+            "i.name AS column_name "
+            "FROM sqlite_master m JOIN pragma_index_list(m.name) l "
+            "JOIN pragma_index_info(l.name) i "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' "
+            "AND instr(l.name, 'sqlite_') = 0 "
+            "ORDER BY m.name, l.seq, i.seqno"
+        )
+
+    def get_list_tables_foreign_keys_sql(self):
+        return (
+            "SELECT m.name AS table_name, f.* "
+            "FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) f "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' "
+            "ORDER BY m.name, f.id, f.seq"
+        )
+
     def get_pre_alter_table_index_foreign_key_sql(self, diff):
         """
         :param diff: The table diff
@@ -114,38 +114,69 @@ class PostgresSchemaManager(SchemaManager):
 
         return column
 
-    def _get_portable_table_indexes_list(self, table_indexes, table_name):
-        buffer = []
+    def _fetch_table_indexes(self, table):
+        table_indexes = super(PostgresSchemaManager, self)._fetch_table_indexes(table)
 
-        for row in table_indexes:
-            col_numbers = row["indkey"].split(" ")
-            col_numbers_sql = "IN (%s)" % ", ".join(col_numbers)
-            column_name_sql = (
-                "SELECT attnum, attname FROM pg_attribute "
-                "WHERE attrelid=%s AND attnum %s ORDER BY attnum ASC;"
-                % (row["indrelid"], col_numbers_sql)
-            )
+        return self._get_index_columns_rows(
+            table_indexes, self._get_index_columns_names(table_indexes)
+        )
+
+    def _fetch_tables_indexes(self, metadata):
+        table_indexes = super(PostgresSchemaManager, self)._fetch_tables_indexes(
+            metadata
+        )
 
-            index_columns = self._connection.select(column_name_sql)
+        names = self._get_index_columns_names(
+            [index for indexes in table_indexes.values() for index in indexes]
+        )
 
-            # required for getting the order of the columns right.
-            for col_num in col_numbers:
-                for col_row in index_columns:
-                    if int(col_num) == col_row["attnum"]:
-                        buffer.append(
-                            {
-                                "key_name": row["relname"],
-                                "column_name": col_row["attname"].strip(),
-                                "non_unique": not row["indisunique"],
-                                "primary": row["indisprimary"],
-                                "where": row["where"],
-                            }
-                        )
-
-        return super(PostgresSchemaManager, self)._get_portable_table_indexes_list(
-            buffer, table_name
+        return dict(
+            (table, self._get_index_columns_rows(indexes, names))
+            for table, indexes in table_indexes.items()
         )
 
+    def _get_index_columns_names(self, table_indexes):
+        """
+        Get the names of the columns of the indexed tables with a single query.
+
+        :return: The names, by table oid and column number
+        :rtype: dict
+        """
+        if not table_indexes:
+            return {}
+
+        column_name_sql = (
+            "SELECT attrelid, attnum, attname FROM pg_attribute "
+            "WHERE attrelid IN (%s) AND attnum > 0"
+            % ", ".join(set(str(row["indrelid"]) for row in table_indexes))
+        )
+
+        return dict(
+            ((row["attrelid"], row["attnum"]), row["attname"])
+            for row in self._connection.select(column_name_sql)
+        )
+
+    def _get_index_columns_rows(self, table_indexes, names):
+        buffer = []
+
+        for row in table_indexes:
+            # required for getting the order of the columns right.
+            for col_num in row["indkey"].split(" "):
+                name = names.get((row["indrelid"], int(col_num)))
+
+                if name is not None:
+                    buffer.append(
+                        {
+                            "key_name": row["relname"],
+                            "column_name": name.strip(),
+                            "non_unique": not row["indisunique"],
+                            "primary": row["indisprimary"],
+                            "where": row["where"],
+                        }
+                    )
+
+        return buffer
+
     def _get_portable_table_foreign_key_definition(self, table_foreign_key):
         on_update = ""
         on_delete = ""
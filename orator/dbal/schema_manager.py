@@ -23,25 +23,17 @@ class SchemaManager(object):
             self._platform = platform
 
     def list_table_columns(self, table):
-        sql = self._platform.get_list_table_columns_sql(table)
-
-        cursor = self._connection.get_connection().cursor()
-        cursor.execute(sql)
-        table_columns = map(lambda x: dict(x.items()), cursor.fetchall())
+        table_columns = self._get_table_metadata(table, "columns")
 
         return self._get_portable_table_columns_list(table, table_columns)
 
     def list_table_indexes(self, table):
-        sql = self._platform.get_list_table_indexes_sql(table)
-
-        table_indexes = self._connection.select(sql)
+        table_indexes = self._get_table_metadata(table, "indexes")
 
         return self._get_portable_table_indexes_list(table_indexes, table)
 
     def list_table_foreign_keys(self, table):
-        sql = self._platform.get_list_table_foreign_keys_sql(table)
-
-        table_foreign_keys = self._connection.select(sql)
+        table_foreign_keys = self._get_table_metadata(table, "foreign_keys")
 
         return self._get_portable_table_foreign_keys_list(table_foreign_keys)
 
@@ -58,6 +50,164 @@ class SchemaManager(object):
 
         return table
 
+    def introspect(self, tables=None):
+        """
+        Load the metadata of all the tables at once, with a single query
+        for each kind of metadata, in the schema cache of the connection.
+
+        :param tables: The tables to keep, all of them by default
+        :type tables: list
+
+        :return: The loaded tables
+        :rtype: list
+        """
+        metadata = OrderedDict()
+
+        for table, rows in self._fetch_tables_columns().items():
+            if tables is None or table in tables:
+                metadata[table] = {"columns": rows}
+
+        kinds = ["indexes"]
+        if self._platform.supports_foreign_key_constraints():
+            kinds.append("foreign_keys")
+
+        for kind in kinds:
+            fetched = getattr(self, "_fetch_tables_%s" % kind)(metadata)
+
+            for table in metadata:
+                metadata[table][kind] = fetched.get(table, [])
+
+        if not self._connection.pretending():
+            self._connection.get_schema_cache().update(metadata)
+
+        return list(metadata.keys())
+
+    def get_snapshot(self, tables=None):
+        """
+        Get the catalog rows describing the tables,
+        which can be saved and turned into tables later on.
+
+        :param tables: The tables to describe, all of them by default
+        :type tables: list
+
+        :return: The rows of each kind of metadata, by table
+        :rtype: OrderedDict
+        """
+        cache = self._connection.get_schema_cache()
+        snapshot = OrderedDict()
+
+        for table in self.introspect(tables):
+            snapshot[table] = dict(
+                (kind, [dict(row) for row in rows])
+                for kind, rows in cache.get(table, {}).items()
+            )
+
+        return snapshot
+
+    def get_snapshot_tables(self, snapshot):
+        """
+        Get the tables described by a snapshot.
+
+        :param snapshot: The snapshot
+        :type snapshot: dict
+
+        :rtype: OrderedDict
+        """
+        tables = OrderedDict()
+
+        for table_name, metadata in snapshot.items():
+
+            def rows(kind):
+                return [dict(row) for row in metadata.get(kind, [])]
+
+            tables[table_name] = Table(
+                table_name,
+                self._get_portable_table_columns_list(table_name, rows("columns")),
+                self._get_portable_table_indexes_list(rows("indexes"), table_name),
+                self._get_portable_table_foreign_keys_list(rows("foreign_keys")),
+            )
+
+        return tables
+
+    def _get_table_metadata(self, table, kind):
+        """
+        Get the catalog rows describing a table,
+        from the schema cache of the connection if possible.
+
+        :param table: The table
+        :type table: str
+
+        :param kind: The kind of metadata: columns, indexes or foreign_keys
+        :type kind: str
+
+        :rtype: list
+        """
+        cache = self._connection.get_schema_cache()
+
+        rows = cache.get(table, {}).get(kind)
+        if rows is None:
+            rows = [
+                dict(row.items())
+                for row in getattr(self, "_fetch_table_%s" % kind)(table)
+            ]
+
+            # Nothing is actually read while pretending
+            if not self._connection.pretending():
+                cache.setdefault(table, {})[kind] = rows
+
+        # The rows are altered when converted to portable definitions
+        return [dict(row) for row in rows]
+
+    def _fetch_table_columns(self, table):
+        sql = self._platform.get_list_table_columns_sql(table)
+
+        cursor = self._connection.get_connection().cursor()
+        cursor.execute(sql)
+
+        return cursor.fetchall()
+
+    def _fetch_table_indexes(self, table):
+        sql = self._platform.get_list_table_indexes_sql(table)
+
+        return self._connection.select(sql)
+
+    def _fetch_table_foreign_keys(self, table):
+        sql = self._platform.get_list_table_foreign_keys_sql(table)
+
+        return self._connection.select(sql)
+
+    def _fetch_tables_columns(self):
+        sql = self._platform.get_list_tables_columns_sql()
+
+        cursor = self._connection.get_connection().cursor()
+        cursor.execute(sql)
+
+        return self._group_by_table(cursor.fetchall())
+
+    def _fetch_tables_indexes(self, metadata):
+        sql = self._platform.get_list_tables_indexes_sql()
+
+        return self._group_by_table(self._connection.select(sql))
+
+    def _fetch_tables_foreign_keys(self, metadata):
+        sql = self._platform.get_list_tables_foreign_keys_sql()
+
+        return self._group_by_table(self._connection.select(sql))
+
+    def _group_by_table(self, rows):
+        """
+        Group catalog rows by the table in their "table_name" column.
+
+        :rtype: OrderedDict
+        """
+        grouped = OrderedDict()
+
+        for row in rows:
+            row = dict(row.items())
+            grouped.setdefault(row.pop("table_name"), []).append(row)
+
+        return grouped
+
     def _get_portable_table_columns_list(self, table, table_columns):
         columns_list = OrderedDict()
 
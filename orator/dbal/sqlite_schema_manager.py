@@ -73,43 +73,84 @@ class SQLiteSchemaManager(SchemaManager):
 
         return column
 
-    def _get_portable_table_indexes_list(self, table_indexes, table_name):
-        index_buffer = []
+    def introspect(self, tables=None):
+        version = tuple(int(v) for v in self._connection.server_version[:2])
+
+        if version >= (3, 16):
+            return super(SQLiteSchemaManager, self).introspect(tables)
+
+        # Table-valued pragma functions are not available,
+        # so the tables are loaded one at a time.
+        if tables is None:
+            tables = [
+                row["name"]
+                for row in self._connection.select(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+                )
+            ]
 
-        # Fetch primary
-        info = self._connection.select("PRAGMA TABLE_INFO (%s)" % table_name)
+        for table in tables:
+            self.list_table_details(table)
 
-        for row in info:
-            if row["pk"] != 0:
-                index_buffer.append(
-                    {
-                        "key_name": "primary",
-                        "primary": True,
-                        "non_unique": False,
-                        "column_name": row["name"],
-                    }
-                )
+        return list(tables)
+
+    def _fetch_table_indexes(self, table):
+        table_indexes = self._connection.select(
+            self._platform.get_list_table_indexes_sql(table)
+        )
+
+        rows = self._get_primary_key_rows(self._get_table_metadata(table, "columns"))
 
-        # Fetch regular indexes
         for index in table_indexes:
             # Ignore indexes with reserved names, e.g. autoindexes
             if index["name"].find("sqlite_") == -1:
-                key_name = index["name"]
-                idx = {
-                    "key_name": key_name,
-                    "primary": False,
-                    "non_unique": not bool(index["unique"]),
-                }
+                info = self._connection.select(
+                    "PRAGMA INDEX_INFO ('%s')" % index["name"]
+                )
 
-                info = self._connection.select("PRAGMA INDEX_INFO ('%s')" % key_name)
                 for row in info:
-                    idx["column_name"] = row["name"]
-                    index_buffer.append(idx)
-
-        return super(SQLiteSchemaManager, self)._get_portable_table_indexes_list(
-            index_buffer, table_name
+                    rows.append(
+                        {
+                            "key_name": index["name"],
+                            "primary": False,
+                            "non_unique": not bool(index["unique"]),
+                            "column_name": row["name"],
+                        }
+                    )
+
+        return rows
+
+    def _fetch_tables_indexes(self, metadata):
+        table_indexes = self._group_by_table(
+            self._connection.select(self._platform.get_list_tables_indexes_sql())
         )
 
+        fetched = {}
+        for table, data in metadata.items():
+            rows = self._get_primary_key_rows(data["columns"])
+
+            for index in table_indexes.get(table, []):
+                index["primary"] = False
+                index["non_unique"] = not bool(index.pop("unique"))
+                rows.append(index)
+
+            fetched[table] = rows
+
+        return fetched
+
+    def _get_primary_key_rows(self, table_columns):
+        return [
+            {
+                "key_name": "primary",
+                "primary": True,
+                "non_unique": False,
+                "column_name": column["name"],
+            }
+            for column in table_columns
+            if column["pk"] != 0
+        ]
+
     def _get_portable_table_foreign_keys_list(self, table_foreign_keys):
         foreign_keys = OrderedDict()
 
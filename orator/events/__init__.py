@@ -1,14 +1,27 @@
 # -*- coding: utf-8 -*-
 
-from blinker import Namespace
+from lazy_object_proxy import Proxy
+
+from ..utils import lazy_import
+
+blinker = lazy_import("blinker")
 
 
 class Event(object):
 
-    events = Namespace()
+    # The namespace, and blinker, are only loaded
+    # the first time an event is fired or listened to.
+    events = Proxy(lambda: blinker.Namespace())
+
+    # The names of the events having listeners,
+    # so that firing the other ones costs a single lookup.
+    _listened = set()
 
     @classmethod
     def fire(cls, name, *args, **kwargs):
+        if name not in cls._listened:
+            return
+
         name = "orator.%s" % name
         signal = cls.events.signal(name)
 
@@ -18,6 +31,8 @@ class Event(object):
 
     @classmethod
     def listen(cls, name, callback, *args, **kwargs):
+        cls._listened.add(name)
+
         name = "orator.%s" % name
         signal = cls.events.signal(name)
 
@@ -25,12 +40,26 @@ class Event(object):
 
     @classmethod
     def forget(cls, name, *args, **kwargs):
-        name = "orator.%s" % name
-        signal = cls.events.signal(name)
+        signal = cls.events.signal("orator.%s" % name)
 
-        for receiver in signal.receivers:
+        for receiver in list(signal.receivers.values()):
             signal.disconnect(receiver, *args, **kwargs)
 
+        if not signal.receivers:
+            cls._listened.discard(name)
+
+    @classmethod
+    def has_listeners(cls, name):
+        """
+        Determine if an event has listeners.
+
+        :param name: The event name
+        :type name: str
+
+        :rtype: bool
+        """
+        return name in cls._listened
+
 
 def event(name, *args, **kwargs):
     return Event.fire(name, *args, **kwargs)
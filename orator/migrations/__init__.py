@@ -4,3 +4,5 @@ from .database_migration_repository import DatabaseMigrationRepository
 from .migration_creator import MigrationCreator
 from .migration import Migration
 from .migrator import Migrator
+from .parallel_migrator import ParallelMigrator, MigrationResult
+from .schema_differ import SchemaDiffer
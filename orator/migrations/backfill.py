@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+from ..utils import lazy_import
+
+json = lazy_import("simplejson")
+
+
+class Backfill(object):
+    """
+    Updates the rows of a table by ranges of primary keys,
+    committing each batch, so that the table is never locked
+    for long and the update can be resumed if interrupted.
+    """
+
+    # The table storing the progress of the interrupted backfills
+    checkpoints_table = "backfills"
+
+    # The minimum number of seconds between two progress reports
+    report_interval = 10
+
+    def __init__(
+        self,
+        connection,
+        table,
+        values,
+        where=None,
+        batch_size=1000,
+        sleep=0,
+        key="id",
+        max_lag=None,
+        name=None,
+        notify=None,
+    ):
+        """
+        :param connection: The connection to use
+        :type connection: orator.connections.Connection
+
+        :param table: The table to update
+        :type table: str
+
+        :param values: The values to set
+        :type values: dict
+
+        :param where: The conditions the rows to update must match,
+                      as accepted by ``QueryBuilder.where()``
+        :type where: dict or list or orator.query.QueryBuilder
+
+        :param batch_size: The number of keys of each batch
+        :type batch_size: int
+
+        :param sleep: The number of seconds to wait between batches
+        :type sleep: float
+
+        :param key: The column the batches are built from,
+                    usually the primary key
+        :type key: str
+
+        :param max_lag: The maximum replication lag, in seconds,
+                        before waiting for the replicas to catch up
+        :type max_lag: float
+
+        :param name: The name under which the progress is saved
+        :type name: str
+
+        :param notify: A function receiving the progress messages
+        :type notify: callable
+        """
+        self._connection = connection
+        self._table = table
+        self._values = values
+        self._where = where
+        self._batch_size = batch_size
+        self._sleep = sleep
+        self._key = key
+        self._max_lag = max_lag
+        self._name = name or "%s.%s" % (table, ".".join(sorted(values.keys())))
+        self._notify = notify
+
+    def run(self):
+        """
+        Run the backfill.
+
+        :return: The number of updated rows
+        :rtype: int
+        """
+        connection = self._connection
+        pretending = connection.pretending()
+
+        if connection.transaction_level() > 0 and not pretending:
+            raise RuntimeError(
+                "Backfills commit each batch and can't be run inside a transaction"
+            )
+
+        if not pretending:
+            self._create_checkpoints_table()
+
+        last = self._get_checkpoint()
+        if last is not None:
+            self._report("Resuming the backfill of %s after %s" % (self._table, last))
+
+        updated = 0
+        reported = time.time()
+        while True:
+            self._wait_for_replicas()
+
+            end = self._get_batch_end(last)
+            if end is None:
+                break
+
+            with connection.transaction():
+                query = self._new_batch_query(last).where(self._key, "<=", end)
+                if self._where is not None:
+                    query.where(self._where)
+
+                updated += query.update(self._values) or 0
+
+                self._save_checkpoint(end)
+
+            last = end
+
+            if time.time() - reported >= self.report_interval:
+                reported = time.time()
+                self._report(
+                    "Backfilled %d rows of %s, up to %s = %s"
+                    % (updated, self._table, self._key, last)
+                )
+
+            if self._sleep:
+                time.sleep(self._sleep)
+
+        self._delete_checkpoint()
+        self._report("Backfilled %d rows of %s" % (updated, self._table))
+
+        return updated
+
+    def _get_batch_end(self, last):
+        """
+        Get the last key of the batch following a given key.
+
+        :param last: The last key of the previous batch
+        :type last: mixed
+
+        :rtype: mixed
+        """
+        end = (
+            self._new_batch_query(last)
+            .order_by(self._key)
+            .offset(self._batch_size - 1)
+            .pluck(self._key)
+        )
+
+        if end is None:
+            # This is the last, incomplete, batch
+            end = self._new_batch_query(last).max(self._key)
+
+        return end
+
+    def _new_batch_query(self, last):
+        query = self._connection.table(self._table)
+
+        if last is not None:
+            query.where(self._key, ">", last)
+
+        return query
+
+    def _wait_for_replicas(self):
+        """
+        Wait for the replicas to catch up if they lag too far behind.
+        """
+        if self._max_lag is None:
+            return
+
+        while True:
+            lag = self._connection.get_replication_lag()
+            if lag is None or lag <= self._max_lag:
+                return
+
+            self._report("Waiting for the replicas, %.1f seconds behind" % lag)
+
+            time.sleep(max(self._sleep, 1))
+
+    def _create_checkpoints_table(self):
+        schema = self._connection.get_schema_builder()
+
+        if schema.has_table(self.checkpoints_table):
+            return
+
+        with schema.create(self.checkpoints_table) as table:
+            table.string("name").primary()
+            table.text("last_key")
+
+    def _get_checkpoint(self):
+        if self._connection.pretending():
+            return
+
+        last_key = (
+            self._connection.table(self.checkpoints_table)
+            .where("name", self._name)
+            .pluck("last_key")
+        )
+
+        if last_key is not None:
+            return json.loads(last_key)
+
+    def _save_checkpoint(self, last):
+        if self._connection.pretending():
+            return
+
+        query = self._connection.table(self.checkpoints_table).where("name", self._name)
+        last_key = json.dumps(last, default=str)
+
+        if query.exists():
+            query.update(last_key=last_key)
+        else:
+            self._connection.table(self.checkpoints_table).insert(
+                name=self._name, last_key=last_key
+            )
+
+    def _delete_checkpoint(self):
+        if self._connection.pretending():
+            return
+
+        self._connection.table(self.checkpoints_table).where(
+            "name", self._name
+        ).delete()
+
+    def _report(self, message):
+        if self._notify is not None and not self._connection.pretending():
+            self._notify(message)
@@ -4,14 +4,18 @@ from .migration import Migration
 
 
 class DatabaseMigrationRepository(object):
-    def __init__(self, resolver, table):
+    def __init__(self, resolver, table, connection=None):
         """
         :type resolver: orator.database_manager.DatabaseManager
         :type table: str
+
+        :param connection: The name of the connection,
+                           the default one if not given
+        :type connection: str
         """
         self._resolver = resolver
         self._table = table
-        self._connection = None
+        self._connection = connection
 
     def get_ran(self):
         """
@@ -97,6 +101,9 @@ class DatabaseMigrationRepository(object):
         """
         return self.get_connection().table(self._table)
 
+    def get_table_name(self):
+        return self._table
+
     def get_connection_resolver(self):
         return self._resolver
 
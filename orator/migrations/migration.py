@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
 from orator import Model
+from .backfill import Backfill
 
 
 class Migration(object):
 
     _connection = None
+    _notifier = None
     transactional = True
 
     @property
@@ -21,3 +23,73 @@ class Migration(object):
 
     def set_connection(self, connection):
         self._connection = connection
+
+    def set_notifier(self, notifier):
+        """
+        Set the function receiving the messages of the migration.
+
+        :param notifier: The function
+        :type notifier: callable
+        """
+        self._notifier = notifier
+
+    def note(self, message):
+        """
+        Report a message, like the progress of a long operation.
+
+        :param message: The message
+        :type message: str
+        """
+        if self._notifier is not None:
+            self._notifier(message)
+
+    def backfill(
+        self, table, set_, where=None, batch_size=1000, sleep=0, key="id", max_lag=None
+    ):
+        """
+        Update the rows of a table by batches of primary keys,
+        each batch being committed separately.
+
+        The progress is saved so that an interrupted backfill
+        resumes where it stopped. Since each batch is committed,
+        the migration must not be transactional.
+
+        :param table: The table to update
+        :type table: str
+
+        :param set_: The values to set
+        :type set_: dict
+
+        :param where: The conditions the rows to update must match
+        :type where: dict or list or orator.query.QueryBuilder
+
+        :param batch_size: The number of keys of each batch
+        :type batch_size: int
+
+        :param sleep: The number of seconds to wait between batches
+        :type sleep: float
+
+        :param key: The column the batches are built from
+        :type key: str
+
+        :param max_lag: The maximum replication lag, in seconds,
+                        before waiting for the replicas to catch up
+        :type max_lag: float
+
+        :return: The number of updated rows
+        :rtype: int
+        """
+        backfill = Backfill(
+            self._connection,
+            table,
+            set_,
+            where=where,
+            batch_size=batch_size,
+            sleep=sleep,
+            key=key,
+            max_lag=max_lag,
+            name="%s.%s" % (self.__class__.__name__, table),
+            notify=self.note,
+        )
+
+        return backfill.run()
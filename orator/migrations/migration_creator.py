@@ -18,7 +18,7 @@ def mkdir_p(path):
 
 
 class MigrationCreator(object):
-    def create(self, name, path, table=None, create=False):
+    def create(self, name, path, table=None, create=False, stub=None):
         """
         Create a new migration at the given path.
 
@@ -30,6 +30,8 @@ class MigrationCreator(object):
         :type table: str
         :param create: Whether it's a create migration or not
         :type create: bool
+        :param stub: The migration template, chosen from the table by default
+        :type stub: str
 
         :rtype: str
         """
@@ -42,7 +44,8 @@ class MigrationCreator(object):
             with open(parent, "w"):
                 pass
 
-        stub = self._get_stub(table, create)
+        if stub is None:
+            stub = self._get_stub(table, create)
 
         with open(path, "w") as fh:
             fh.write(self._populate_stub(name, stub, table))
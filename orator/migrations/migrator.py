@@ -1,13 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import glob
 import inflection
 import logging
-from pygments import highlight
-from pygments.lexers.sql import SqlLexer
+import threading
 from ..utils import decode, load_module
-from ..utils.command_formatter import CommandFormatter
 
 
 class MigratorHandler(logging.NullHandler):
@@ -21,6 +20,17 @@ class MigratorHandler(logging.NullHandler):
 
 
 class Migrator(object):
+
+    # The migrations modules are loaded one at a time
+    # since migrators can be run concurrently.
+    _load_lock = threading.Lock()
+
+    # The path of the loaded migrations package
+    _package = None
+
+    # The file of the squashed migrations
+    SCHEMA_FILE = "schema.sql"
+
     def __init__(self, repository, resolver):
         """
         :type repository: DatabaseMigrationRepository
@@ -30,6 +40,7 @@ class Migrator(object):
         self._resolver = resolver
         self._connection = None
         self._notes = []
+        self._files = {}
 
     def run(self, path, pretend=False):
         """
@@ -44,7 +55,12 @@ class Migrator(object):
 
         files = self._get_migration_files(path)
 
-        ran = self._repository.get_ran()
+        ran = set(self._repository.get_ran())
+
+        # A fresh database is created from the squashed schema, if any,
+        # rather than by running each of the squashed migrations.
+        if not ran:
+            ran = self._load_schema(path, pretend)
 
         migrations = [f for f in files if f not in ran]
 
@@ -172,6 +188,90 @@ class Migrator(object):
             + "<fg=cyan>%s</>" % migration_file
         )
 
+    def squash(self, path, prune=False):
+        """
+        Dump the schema of the database into a single file
+        replacing the migrations which have been run.
+
+        :param path: The path
+        :type path: str
+
+        :param prune: Whether to delete the squashed migration files
+        :type prune: bool
+
+        :return: The squashed migrations
+        :rtype: list
+        """
+        connection = self._repository.get_connection()
+
+        migrations = sorted(self._repository.get_ran())
+        statements = connection.dump_schema(
+            exclude=[connection.get_table_prefix() + self._repository.get_table_name()]
+        )
+
+        with open(os.path.join(path, self.SCHEMA_FILE), "w") as fh:
+            fh.write("-- Squashed migrations\n")
+
+            for migration in migrations:
+                fh.write("-- %s\n" % migration)
+
+            fh.write("\n")
+            fh.write(";\n\n".join(statements))
+            fh.write(";\n")
+
+        if prune:
+            for migration in migrations:
+                migration_file = os.path.join(path, "%s.py" % migration)
+
+                if os.path.exists(migration_file):
+                    os.remove(migration_file)
+
+            self._files.pop(path, None)
+
+        return migrations
+
+    def _load_schema(self, path, pretend=False):
+        """
+        Load the squashed schema, if any, and log its migrations.
+
+        :param path: The path
+        :type path: str
+
+        :type pretend: bool
+
+        :return: The squashed migrations
+        :rtype: set
+        """
+        schema_file = os.path.join(path, self.SCHEMA_FILE)
+        if not os.path.exists(schema_file):
+            return set()
+
+        migrations = []
+        with open(schema_file) as fh:
+            line = fh.readline()
+            while line.startswith("-- "):
+                if line.strip() != "-- Squashed migrations":
+                    migrations.append(line[3:].strip())
+
+                line = fh.readline()
+
+            sql = fh.read()
+
+        if not pretend:
+            connection = self._repository.get_connection()
+            connection.load_schema(sql)
+
+            batch = self._repository.get_next_batch_number()
+            for migration in migrations:
+                self._repository.log(migration, batch)
+
+        self._note(
+            decode("[<info>OK</>] <info>Loaded the squashed schema</info> ")
+            + "<fg=cyan>%s</> (%d migrations)" % (self.SCHEMA_FILE, len(migrations))
+        )
+
+        return set(migrations)
+
     def _get_migration_files(self, path):
         """
         Get all of the migration files in a given path.
@@ -180,14 +280,14 @@ class Migrator(object):
 
         :rtype: list
         """
-        files = glob.glob(os.path.join(path, "[0-9]*_*.py"))
+        if path in self._files:
+            return self._files[path]
 
-        if not files:
-            return []
+        files = glob.glob(os.path.join(path, "[0-9]*_*.py"))
 
-        files = list(map(lambda f: os.path.basename(f).replace(".py", ""), files))
+        files = sorted(os.path.basename(f)[:-3] for f in files)
 
-        files = sorted(files)
+        self._files[path] = files
 
         return files
 
@@ -201,6 +301,10 @@ class Migrator(object):
         :param method: The method to execute
         :type method: str
         """
+        from pygments import highlight
+        from pygments.lexers.sql import SqlLexer
+        from ..utils.command_formatter import CommandFormatter
+
         self._note("")
         names = []
         for query in self._get_queries(migration, method):
@@ -259,15 +363,21 @@ class Migrator(object):
             with open(parent, "w"):
                 pass
 
-        load_module("migrations", parent)
+        with self._load_lock:
+            # The parent module is only loaded again
+            # when the migrations come from another path.
+            if Migrator._package != parent or "migrations" not in sys.modules:
+                load_module("migrations", parent)
+                Migrator._package = parent
 
-        # Loading module
-        mod = load_module("migrations.%s" % name, migration_file)
+            # Loading module
+            mod = load_module("migrations.%s" % name, migration_file)
 
-        klass = getattr(mod, inflection.camelize(name))
+            klass = getattr(mod, inflection.camelize(name))
 
         instance = klass()
         instance.set_connection(self.get_repository().get_connection())
+        instance.set_notifier(self._note)
 
         return instance
 
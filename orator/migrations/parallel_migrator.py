@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from collections import namedtuple, OrderedDict
+from multiprocessing.pool import ThreadPool
+from .database_migration_repository import DatabaseMigrationRepository
+from .migrator import Migrator
+
+
+MigrationResult = namedtuple(
+    "MigrationResult", ["connection", "status", "migrations", "notes", "error"]
+)
+
+
+class ParallelMigrator(object):
+    """
+    Runs the migrations against several connections concurrently,
+    like the databases of the tenants or the shards sharing a schema.
+
+    Each connection has its own migrations repository and is used
+    by a single worker thread.
+    """
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    def __init__(self, resolver, table="migrations", workers=4):
+        """
+        :param resolver: The connection resolver
+        :type resolver: orator.database_manager.DatabaseManager
+
+        :param table: The migrations table
+        :type table: str
+
+        :param workers: The maximum number of connections migrated at once
+        :type workers: int
+        """
+        self._resolver = resolver
+        self._table = table
+        self._workers = workers
+
+    def run(self, path, connections, pretend=False, fail_fast=False):
+        """
+        Run the outstanding migrations on each connection.
+
+        :param path: The path of the migrations
+        :type path: str
+
+        :param connections: The names of the connections
+        :type connections: list
+
+        :param pretend: Whether we execute the migrations as dry-run
+        :type pretend: bool
+
+        :param fail_fast: Whether to stop migrating the connections
+                          which have not started yet after a failure
+        :type fail_fast: bool
+
+        :return: The result of each connection, in the given order
+        :rtype: list of MigrationResult
+        """
+        failed = threading.Event()
+
+        def migrate(connection):
+            if fail_fast and failed.is_set():
+                return MigrationResult(connection, self.SKIPPED, [], [], None)
+
+            result = self._run(path, connection, pretend)
+            if result.status == self.FAILED:
+                failed.set()
+
+            return result
+
+        return self._map(migrate, connections)
+
+    def _run(self, path, connection, pretend=False):
+        """
+        Run the outstanding migrations on a connection.
+
+        :rtype: MigrationResult
+        """
+        migrator = self.get_migrator(connection)
+        repository = migrator.get_repository()
+        opened = connection in self._resolver.get_connections()
+        before = None
+        ran = []
+
+        try:
+            if not migrator.repository_exists():
+                repository.create_repository()
+
+            before = set(repository.get_ran())
+
+            migrator.run(path, pretend)
+        except Exception as e:
+            status = self.FAILED
+            error = e
+        else:
+            status = self.SUCCEEDED
+            error = None
+
+        try:
+            # The migrations which ran before a failure are reported as well
+            if before is not None:
+                ran = [m for m in sorted(repository.get_ran()) if m not in before]
+        except Exception:
+            pass
+        finally:
+            if not opened:
+                self._resolver.purge(connection)
+
+        return MigrationResult(connection, status, ran, migrator.get_notes(), error)
+
+    def status(self, connections):
+        """
+        Get the ran migrations of each connection.
+
+        :param connections: The names of the connections
+        :type connections: list
+
+        :return: The ran migrations by connection, None when the migrations
+                 repository does not exist or the error raised while checking
+        :rtype: OrderedDict
+        """
+
+        def get_ran(connection):
+            migrator = self.get_migrator(connection)
+            opened = connection in self._resolver.get_connections()
+
+            try:
+                if not migrator.repository_exists():
+                    return None
+
+                return migrator.get_repository().get_ran()
+            except Exception as e:
+                return e
+            finally:
+                if not opened:
+                    self._resolver.purge(connection)
+
+        return OrderedDict(zip(connections, self._map(get_ran, connections)))
+
+    def get_migrator(self, connection):
+        """
+        Get a migrator bound to a connection.
+
+        :param connection: The name of the connection
+        :type connection: str
+
+        :rtype: Migrator
+        """
+        repository = DatabaseMigrationRepository(
+            self._resolver, self._table, connection=connection
+        )
+
+        return Migrator(repository, self._resolver)
+
+    def _map(self, func, connections):
+        pool = ThreadPool(max(1, min(self._workers, len(connections))))
+
+        try:
+            return pool.map(func, connections, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
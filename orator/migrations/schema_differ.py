@@ -0,0 +1,669 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import hashlib
+
+from collections import namedtuple, OrderedDict
+from ..connectors.connection_factory import ConnectionFactory
+from ..dbal.comparator import Comparator
+from ..query.expression import QueryExpression
+from ..schema.blueprint import Blueprint
+from ..utils import load_module, basestring, lazy_import
+from .stubs import DIFF_STUB
+
+json = lazy_import("simplejson")
+
+
+# A schema builder call: "create" or "table" with the blueprint calls, or "drop"
+Operation = namedtuple("Operation", ["action", "table", "calls"])
+
+# A blueprint method call and the fluent modifiers chained to it
+Call = namedtuple("Call", ["method", "args", "modifiers"])
+
+
+class SchemaDiffer(object):
+    """
+    Compares the schema of a database with a declared schema
+    and generates the migration going from the former to the latter.
+
+    The declared schema is a Python file defining a ``define(schema)``
+    function which creates the tables with the given schema builder.
+    It is built on an empty "shadow" database of the same kind, which is
+    introspected and emptied afterwards. The result is saved as a snapshot
+    so that the schema is only built again when the file changes.
+    """
+
+    # The tables managed by orator itself
+    ignored_tables = ["migrations", "backfills"]
+
+    # The column types and the blueprint methods creating them
+    column_types = {
+        "integer": "integer",
+        "bigint": "big_integer",
+        "smallint": "small_integer",
+        "boolean": "boolean",
+        "text": "text",
+        "date": "date",
+        "datetime": "datetime",
+        "time": "time",
+        "float": "float",
+        "json": "json",
+        "blob": "binary",
+        "binary": "binary",
+    }
+
+    def __init__(self, connection, shadow=None, snapshot_path=None):
+        """
+        :param connection: The connection of the database to migrate
+        :type connection: orator.connections.Connection
+
+        :param shadow: The connection of an empty database to build the
+                       declared schema on, an in-memory database by default
+                       for SQLite
+        :type shadow: orator.connections.Connection
+
+        :param snapshot_path: The file caching the declared schema snapshot
+        :type snapshot_path: str
+        """
+        self._connection = connection
+        self._shadow = shadow
+        self._snapshot_path = snapshot_path
+
+    def diff(self, schema_path):
+        """
+        Get the operations migrating the database to the declared schema,
+        and the ones reverting them.
+
+        :param schema_path: The declared schema file
+        :type schema_path: str
+
+        :return: The "up" and "down" operations
+        :rtype: tuple
+        """
+        manager = self._connection.get_schema_manager()
+        ignored = [self._connection.get_table_prefix() + t for t in self.ignored_tables]
+
+        current = manager.get_snapshot_tables(manager.get_snapshot())
+        for table in ignored:
+            current.pop(table, None)
+
+        declared = self.get_declared_tables(schema_path)
+
+        return (
+            self.get_operations(current, declared),
+            self.get_operations(declared, current),
+        )
+
+    def get_declared_tables(self, schema_path):
+        """
+        Get the tables of the declared schema.
+
+        :param schema_path: The declared schema file
+        :type schema_path: str
+
+        :rtype: OrderedDict
+        """
+        with open(schema_path, "rb") as fh:
+            checksum = hashlib.sha1(
+                fh.read()
+                + self._connection.get_database_platform().__class__.__name__.encode()
+            ).hexdigest()
+
+        snapshot = self._load_snapshot(checksum)
+        if snapshot is None:
+            snapshot = self._build_snapshot(schema_path)
+
+            self._save_snapshot(checksum, snapshot)
+
+        manager = self._connection.get_schema_manager()
+
+        return manager.get_snapshot_tables(snapshot)
+
+    def _build_snapshot(self, schema_path):
+        """
+        Build the declared schema on the shadow database and describe it.
+
+        :rtype: OrderedDict
+        """
+        module = load_module("orator_declared_schema", schema_path)
+
+        shadow = self._get_shadow()
+        manager = shadow.get_schema_manager()
+
+        if manager.introspect():
+            raise RuntimeError("The shadow database must be empty")
+
+        shadow.begin_transaction()
+        try:
+            module.define(shadow.get_schema_builder())
+
+            snapshot = manager.get_snapshot()
+        finally:
+            shadow.rollback()
+
+        # Some databases commit schema changes implicitly
+        tables = manager.get_snapshot_tables(manager.get_snapshot())
+        for table in reversed(self._sort_tables(list(tables.values()))):
+            shadow.get_schema_builder().drop(self._get_name(shadow, table))
+
+        return snapshot
+
+    def _get_shadow(self):
+        if self._shadow is not None:
+            return self._shadow
+
+        if self._connection.get_config("driver") != "sqlite":
+            raise RuntimeError("A shadow database is required to build the schema")
+
+        return ConnectionFactory().make(
+            {
+                "driver": "sqlite",
+                "database": ":memory:",
+                "prefix": self._connection.get_table_prefix(),
+            }
+        )
+
+    def _load_snapshot(self, checksum):
+        if self._snapshot_path is None or not os.path.exists(self._snapshot_path):
+            return
+
+        with open(self._snapshot_path) as fh:
+            data = json.load(fh, object_pairs_hook=OrderedDict)
+
+        if data.get("checksum") == checksum:
+            return data["tables"]
+
+    def _save_snapshot(self, checksum, snapshot):
+        if self._snapshot_path is None:
+            return
+
+        with open(self._snapshot_path, "w") as fh:
+            json.dump(
+                {"checksum": checksum, "tables": snapshot}, fh, indent=2, default=str
+            )
+
+    def get_operations(self, from_tables, to_tables):
+        """
+        Get the operations turning a set of tables into another.
+
+        :param from_tables: The current tables
+        :type from_tables: OrderedDict
+
+        :param to_tables: The wanted tables
+        :type to_tables: OrderedDict
+
+        :rtype: list of Operation
+        """
+        comparator = Comparator()
+        operations = []
+
+        created = [t for name, t in to_tables.items() if name not in from_tables]
+        for table in self._sort_tables(created):
+            operations.append(
+                Operation(
+                    "create",
+                    self._get_name(self._connection, table),
+                    self._get_create_calls(table),
+                )
+            )
+
+        for name, table in from_tables.items():
+            if name not in to_tables:
+                continue
+
+            diff = comparator.diff_table(table, to_tables[name])
+            if diff:
+                # SQLite rebuilds the table to remove columns, dropping its
+                # indexes, before adding the new columns, so the removals
+                # are applied separately, the indexes and foreign keys first
+                for calls in self._get_alter_calls(diff, to_tables[name]):
+                    if calls:
+                        operations.append(
+                            Operation(
+                                "table", self._get_name(self._connection, table), calls
+                            )
+                        )
+
+        dropped = [t for name, t in from_tables.items() if name not in to_tables]
+        for table in reversed(self._sort_tables(dropped)):
+            operations.append(
+                Operation("drop", self._get_name(self._connection, table), [])
+            )
+
+        return operations
+
+    def _get_create_calls(self, table):
+        calls = []
+
+        for column in table.get_columns().values():
+            calls.append(self._get_column_call(column, table))
+
+        for index in table.get_indexes().values():
+            if not self._is_increments_key(index, table):
+                calls.append(self._get_index_call(index, table))
+
+        for foreign_key in table.get_foreign_keys().values():
+            calls.append(self._get_foreign_key_call(foreign_key))
+
+        return calls
+
+    def _get_alter_calls(self, diff, to_table):
+        """
+        Get the blueprint calls applying the differences of a table.
+
+        :type diff: orator.dbal.table_diff.TableDiff
+
+        :param to_table: The wanted table
+        :type to_table: orator.dbal.table.Table
+
+        :return: The calls dropping indexes and foreign keys, the calls
+                 removing and renaming columns, and the calls adding
+                 and changing columns, indexes and foreign keys
+        :rtype: tuple
+        """
+        calls = []
+
+        for foreign_key in diff.removed_foreign_keys + diff.changed_foreign_keys:
+            calls.append(Call("drop_foreign", (_unquote(foreign_key.get_name()),), []))
+
+        dropped = list(diff.removed_indexes.values()) + list(
+            diff.changed_indexes.values()
+        )
+        dropped += [
+            diff.from_table.get_index(name) for name in diff.renamed_indexes.keys()
+        ]
+        for index in dropped:
+            calls.append(self._get_drop_index_call(index))
+
+        drops, calls = calls, []
+
+        if diff.removed_columns:
+            calls.append(
+                Call(
+                    "drop_column",
+                    tuple(
+                        _unquote(c.get_name()) for c in diff.removed_columns.values()
+                    ),
+                    [],
+                )
+            )
+
+        for old_name, column in diff.renamed_columns.items():
+            calls.append(
+                Call("rename_column", (old_name, _unquote(column.get_name())), [])
+            )
+
+        removals, calls = calls, []
+
+        for column in diff.added_columns.values():
+            calls.append(self._get_column_call(column, to_table))
+
+        for column_diff in diff.changed_columns.values():
+            call = self._get_column_call(column_diff.column, to_table)
+            call.modifiers.append(("change", ()))
+            calls.append(call)
+
+        added = list(diff.added_indexes.values()) + list(diff.renamed_indexes.values())
+        for index in diff.changed_indexes.values():
+            if index.is_primary():
+                added.append(to_table.get_primary_key())
+            else:
+                added.append(to_table.get_index(index.get_name()))
+
+        for index in added:
+            if not self._is_increments_key(index, to_table):
+                calls.append(self._get_index_call(index, to_table))
+
+        for foreign_key in diff.added_foreign_keys + diff.changed_foreign_keys:
+            calls.append(self._get_foreign_key_call(foreign_key))
+
+        return drops, removals, calls
+
+    def _get_column_call(self, column, table):
+        """
+        Get the blueprint call adding a column.
+
+        :type column: orator.dbal.column.Column
+
+        :type table: orator.dbal.table.Table
+
+        :rtype: Call
+        """
+        name = _unquote(column.get_name())
+        options = column.to_dict()
+        type_ = options["type"]
+        modifiers = []
+
+        if self._is_increments(column, table):
+            method = "big_increments" if type_ == "bigint" else "increments"
+
+            return Call(method, (name,), modifiers)
+
+        if type_ == "string":
+            method = "char" if options["fixed"] else "string"
+            args = (name,)
+
+            # The blueprint default length is omitted
+            if options["length"] and int(options["length"]) != 255:
+                args += (int(options["length"]),)
+        elif type_ == "decimal":
+            method = "decimal"
+            args = (name, int(options["precision"]), int(options["scale"]))
+        elif type_ == "enum":
+            method = "enum"
+            values = re.findall(
+                r"'((?:[^']|'')*)'", column.get_extra().get("definition", "")
+            )
+            args = (name, [v.replace("''", "'") for v in values])
+        elif type_ in self.column_types:
+            method = self.column_types[type_]
+            args = (name,)
+        else:
+            raise RuntimeError(
+                'The type of the column "%s" (%s) is not supported' % (name, type_)
+            )
+
+        if options["unsigned"]:
+            modifiers.append(("unsigned", ()))
+
+        if not column.get_notnull():
+            modifiers.append(("nullable", ()))
+
+        default = column.get_default()
+        if default is not None:
+            if isinstance(default, basestring) and re.match(
+                r"^(CURRENT_\w+|\w+\(.*\))$", default, re.I
+            ):
+                default = QueryExpression(default)
+            else:
+                default = self._convert_default(default, type_)
+
+            modifiers.append(("default", (default,)))
+
+        return Call(method, args, modifiers)
+
+    def _convert_default(self, default, type_):
+        """
+        Convert an introspected default value to the type of its column.
+
+        :param default: The default value, as returned by the database
+        :type default: str
+
+        :param type_: The type of the column
+        :type type_: str
+
+        :rtype: mixed
+        """
+        if not isinstance(default, basestring):
+            return default
+
+        try:
+            if type_ in ["integer", "bigint", "smallint"]:
+                return int(default)
+
+            if type_ == "float":
+                return float(default)
+        except ValueError:
+            return default
+
+        if type_ == "boolean" and default.lower() in ["0", "1", "false", "true"]:
+            return default.lower() in ["1", "true"]
+
+        return default
+
+    def _is_increments(self, column, table):
+        if column.get_type() not in ["integer", "bigint"]:
+            return False
+
+        if column.get_autoincrement():
+            return True
+
+        # SQLite integer primary keys always autoincrement
+        primary = table.get_primary_key()
+
+        return (
+            column.has_platform_option("pk")
+            and primary is not None
+            and [c.lower() for c in primary.get_columns()]
+            == [column.get_name().lower()]
+        )
+
+    def _is_increments_key(self, index, table):
+        if not index.is_primary() or len(index.get_columns()) != 1:
+            return False
+
+        return self._is_increments(table.get_column(index.get_columns()[0]), table)
+
+    def _get_index_call(self, index, table):
+        columns = [_unquote(c) for c in index.get_columns()]
+        name = _unquote(index.get_name())
+
+        if index.is_primary():
+            method = "primary"
+        elif index.is_unique():
+            method = "unique"
+        else:
+            method = "index"
+
+        args = (columns if len(columns) > 1 else columns[0],)
+
+        # The names the blueprint would give the index are omitted
+        default = "%s_%s_%s" % (
+            self._get_name(self._connection, table),
+            "_".join(columns),
+            method,
+        )
+        if name.lower() not in ["primary", default.lower()]:
+            args += (name,)
+
+        return Call(method, args, [])
+
+    def _get_drop_index_call(self, index):
+        name = _unquote(index.get_name())
+
+        if index.is_primary():
+            if name.lower() == "primary":
+                return Call("drop_primary", (), [])
+
+            return Call("drop_primary", (name,), [])
+
+        return Call("drop_unique" if index.is_unique() else "drop_index", (name,), [])
+
+    def _get_foreign_key_call(self, foreign_key):
+        """
+        :type foreign_key: orator.dbal.foreign_key_constraint.ForeignKeyConstraint
+
+        :rtype: Call
+        """
+        columns = [_unquote(c) for c in foreign_key.get_local_columns()]
+        foreign_columns = [_unquote(c) for c in foreign_key.get_foreign_columns()]
+        foreign_table = _unquote(foreign_key.get_foreign_table_name())
+
+        prefix = self._connection.get_table_prefix()
+        if prefix and foreign_table.startswith(prefix):
+            foreign_table = foreign_table[len(prefix) :]
+
+        args = (columns if len(columns) > 1 else columns[0],)
+
+        # SQLite does not name foreign keys, they are named after their columns
+        name = _unquote(foreign_key.get_name())
+        if name != "%s_%s_%s" % (
+            "_".join(columns),
+            foreign_table,
+            "_".join(foreign_columns),
+        ):
+            args += (name,)
+
+        modifiers = [
+            (
+                "references",
+                (foreign_columns if len(foreign_columns) > 1 else foreign_columns[0],),
+            ),
+            ("on", (foreign_table,)),
+        ]
+
+        for action in ["on_delete", "on_update"]:
+            value = (
+                foreign_key.get_option(action)
+                if foreign_key.has_option(action)
+                else None
+            )
+
+            if value and value.upper() not in ["NO ACTION", "RESTRICT"]:
+                modifiers.append((action, (value.lower(),)))
+
+        return Call("foreign", args, modifiers)
+
+    def _sort_tables(self, tables):
+        """
+        Sort tables so that the tables referenced by foreign keys come first.
+
+        :type tables: list
+
+        :rtype: list
+        """
+        by_name = OrderedDict((t.get_name(), t) for t in tables)
+        sorted_tables = []
+        visited = set()
+
+        def visit(table):
+            if table.get_name() in visited:
+                return
+
+            visited.add(table.get_name())
+
+            for foreign_key in table.get_foreign_keys().values():
+                referenced = by_name.get(_unquote(foreign_key.get_foreign_table_name()))
+
+                if referenced is not None:
+                    visit(referenced)
+
+            sorted_tables.append(table)
+
+        for table in by_name.values():
+            visit(table)
+
+        return sorted_tables
+
+    def _get_name(self, connection, table):
+        name = _unquote(table.get_name())
+        prefix = connection.get_table_prefix()
+
+        if prefix and name.startswith(prefix):
+            name = name[len(prefix) :]
+
+        return name
+
+    def to_sql(self, operations):
+        """
+        Get the SQL statements executing operations on the database.
+
+        :type operations: list of Operation
+
+        :rtype: list
+        """
+        # The schema builder sets up the schema grammar
+        grammar = self._connection.get_schema_builder()._grammar
+        statements = []
+
+        for operation in operations:
+            blueprint = Blueprint(operation.table)
+
+            if operation.action == "create":
+                blueprint.create()
+            elif operation.action == "drop":
+                blueprint.drop()
+
+            for call in operation.calls:
+                result = getattr(blueprint, call.method)(*call.args)
+
+                for method, args in call.modifiers:
+                    result = getattr(result, method)(*args)
+
+            statements += blueprint.to_sql(self._connection, grammar)
+
+        return statements
+
+    def to_stub(self, up, down):
+        """
+        Get the migration stub executing operations.
+
+        :param up: The operations of the migration
+        :type up: list of Operation
+
+        :param down: The operations reverting the migration
+        :type down: list of Operation
+
+        :rtype: str
+        """
+        imports = ""
+        if any(
+            isinstance(arg, QueryExpression)
+            for operation in up + down
+            for call in operation.calls
+            for _, args in call.modifiers
+            for arg in args
+        ):
+            imports = "from orator import QueryExpression\n"
+
+        return (
+            DIFF_STUB.replace("DIFF_IMPORTS\n", imports)
+            .replace("UP_OPERATIONS", self._render(up))
+            .replace("DOWN_OPERATIONS", self._render(down))
+        )
+
+    def _render(self, operations, indent=" " * 8):
+        if not operations:
+            return indent + "pass"
+
+        blocks = []
+
+        for operation in operations:
+            if operation.action == "drop":
+                blocks.append(
+                    "%sself.schema.drop(%s)" % (indent, _literal(operation.table))
+                )
+
+                continue
+
+            lines = [
+                "%swith self.schema.%s(%s) as table:"
+                % (indent, operation.action, _literal(operation.table))
+            ]
+
+            for call in operation.calls:
+                line = "%s    table.%s(%s)" % (
+                    indent,
+                    call.method,
+                    ", ".join(_literal(arg) for arg in call.args),
+                )
+
+                for method, args in call.modifiers:
+                    line += ".%s(%s)" % (
+                        method,
+                        ", ".join(_literal(arg) for arg in args),
+                    )
+
+                lines.append(line)
+
+            blocks.append("\n".join(lines))
+
+        return "\n\n".join(blocks)
+
+
+def _unquote(name):
+    return name.strip('"`')
+
+
+def _literal(value):
+    if isinstance(value, QueryExpression):
+        return "QueryExpression(%s)" % _literal(value.get_value())
+
+    if isinstance(value, (list, tuple)):
+        return "[%s]" % ", ".join(_literal(v) for v in value)
+
+    if isinstance(value, basestring):
+        return "'%s'" % value.replace("\\", "\\\\").replace("'", "\\'")
+
+    return repr(value)
@@ -57,3 +57,22 @@ class DummyClass(Migration):
         with self.schema.table('dummy_table') as table:
             pass
 """
+
+DIFF_STUB = """from orator.migrations import Migration
+DIFF_IMPORTS
+
+
+class DummyClass(Migration):
+
+    def up(self):
+        \"\"\"
+        Run the migrations.
+        \"\"\"
+UP_OPERATIONS
+
+    def down(self):
+        \"\"\"
+        Revert the migrations.
+        \"\"\"
+DOWN_OPERATIONS
+"""
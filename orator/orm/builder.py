@@ -5,6 +5,7 @@ from collections import OrderedDict
 from ..exceptions.orm import ModelNotFound
 from ..utils import Null, basestring
 from ..query.expression import QueryExpression
+from ..query.export import get_exporter
 from ..pagination import Paginator, LengthAwarePaginator
 from ..support import Collection
 from .scopes import Scope
@@ -14,6 +15,10 @@ class Builder(object):
 
     _passthru = [
         "to_sql",
+        "explain",
+        "copy_to",
+        "to_columns",
+        "to_records",
         "lists",
         "insert",
         "insert_get_id",
@@ -23,6 +28,7 @@ class Builder(object):
         "max",
         "avg",
         "sum",
+        "aggregates",
         "exists",
         "get_bindings",
         "raw",
@@ -218,6 +224,77 @@ class Builder(object):
 
         return collection
 
+    def get_tree(self, parent_key="parent_id", relation="children", columns=None):
+        """
+        Execute the query and load the whole subtrees of the matching models
+        in a single query, with a recursive common table expression.
+
+        The children of each model are set as the given relation,
+        so that walking the trees does not run any other query.
+        The orders of the query apply to the children of each level.
+
+        :param parent_key: The column referencing the parent model
+        :type parent_key: str
+
+        :param relation: The name of the relation holding the children
+        :type relation: str
+
+        :param columns: The columns to get
+        :type columns: list
+
+        :return: The roots of the loaded trees
+        :rtype: orator.Collection
+        """
+        if columns is None:
+            columns = ["*"]
+
+        table = self._model.get_table()
+        key = self._model.get_key_name()
+        tree = "%s_tree" % table
+
+        columns = [c if "." in c else "%s.%s" % (table, c) for c in columns]
+
+        anchor = copy.copy(self.apply_scopes().get_query()).select(*columns)
+        recursive = (
+            self._model.new_query()
+            .apply_scopes()
+            .get_query()
+            .select(*columns)
+            .join(tree, "%s.%s" % (tree, key), "=", "%s.%s" % (table, parent_key))
+        )
+
+        # The rows are sorted once the whole trees are loaded
+        query = self._query.new_query().from_(tree)
+        query.orders, anchor.orders = anchor.orders, []
+        query.set_bindings(anchor.get_raw_bindings()["order"], "order")
+        anchor.set_bindings([], "order")
+
+        results = query.with_recursive(tree, anchor, recursive).get().all()
+
+        models = []
+        keys = set()
+        for model in self._model.hydrate(results, self._model.get_connection_name()):
+            # A model matching the query may belong to the tree of another one
+            if model.get_key() not in keys:
+                keys.add(model.get_key())
+                models.append(model)
+
+        if len(models) > 0:
+            models = self.eager_load_relations(models)
+
+        children = {}
+        for model in models:
+            children.setdefault(model.get_attribute(parent_key), []).append(model)
+
+        for model in models:
+            model.set_relation(
+                relation, self._model.new_collection(children.get(model.get_key(), []))
+            )
+
+        return self._model.new_collection(
+            [model for model in models if model.get_attribute(parent_key) not in keys]
+        )
+
     def pluck(self, column):
         """
         Pluck a single column from the database.
@@ -257,6 +334,70 @@ class Builder(object):
 
             yield collection
 
+    def export(self, fp, format="csv", chunk_size=1000, header=True):
+        """
+        Execute the query and write the serialized models to a file.
+
+        The hidden attributes are skipped and the casts applied
+        as when serializing the models, but the rows are streamed
+        without hydrating models when there are no accessors, appends
+        or eager loaded relationships.
+
+        :param fp: The text file to write to
+        :type fp: file
+
+        :param format: The format of the file (csv or ndjson)
+        :type format: str
+
+        :param chunk_size: The number of rows fetched at once
+        :type chunk_size: int
+
+        :param header: Whether to write the columns names first (csv only)
+        :type header: bool
+
+        :return: The number of exported rows
+        :rtype: int
+        """
+        exporter = get_exporter(fp, format, header)
+
+        if self._eager_load or not self._model.can_serialize_rows():
+            return self._export_models(exporter, chunk_size)
+
+        columns, _, chunks = (
+            self.apply_scopes().get_query().select_tuples(chunk_size, server_side=True)
+        )
+
+        columns, serialize = self._model.get_row_serializer(columns)
+        exporter.set_columns(columns)
+
+        count = 0
+        for chunk in chunks:
+            count += exporter.write(map(serialize, chunk))
+
+        return count
+
+    def _export_models(self, exporter, chunk_size):
+        """
+        Write the serialized models to an exporter.
+
+        :type exporter: orator.query.export.Exporter
+        :type chunk_size: int
+
+        :rtype: int
+        """
+        columns = None
+        count = 0
+        for models in self.chunk(chunk_size):
+            rows = [model.serialize() for model in models]
+
+            if columns is None and rows:
+                columns = list(rows[0].keys())
+                exporter.set_columns(columns)
+
+            count += exporter.write([row.get(c) for c in columns] for row in rows)
+
+        return count
+
     def lists(self, column, key=None):
         """
         Get a list with the values of a given column
@@ -286,7 +427,14 @@ class Builder(object):
 
                 results[i] = self._model.new_from_builder(fill).column
 
-    def paginate(self, per_page=None, current_page=None, columns=None):
+    def paginate(
+        self,
+        per_page=None,
+        current_page=None,
+        columns=None,
+        count_strategy="exact",
+        count_ttl=60,
+    ):
         """
         Paginate the given query.
 
@@ -299,18 +447,29 @@ class Builder(object):
         :param columns: The columns to return
         :type columns: list
 
+        :param count_strategy: How to get the total number of records,
+                               "exact", "estimate" or "cached"
+        :type count_strategy: str
+
+        :param count_ttl: The number of seconds the "cached" counts are kept
+        :type count_ttl: int
+
         :return: The paginator
         """
         if columns is None:
             columns = ["*"]
 
-        total = self.to_base().get_count_for_pagination()
+        total, approximate = self.to_base().get_total_for_pagination(
+            count_strategy, count_ttl
+        )
 
         page = current_page or Paginator.resolve_current_page()
         per_page = per_page or self._model.get_per_page()
         self._query.for_page(page, per_page)
 
-        return LengthAwarePaginator(self.get(columns).all(), total, per_page, page)
+        return LengthAwarePaginator(
+            self.get(columns).all(), total, per_page, page, approximate=approximate
+        )
 
     def simple_paginate(self, per_page=None, current_page=None, columns=None):
         """
@@ -1144,22 +1303,16 @@ class Builder(object):
         return self._macros.get(name)
 
     def __dynamic(self, method):
-        from .utils import scope
+        scopes = {}
+        if self._model is not None:
+            scopes = self._model.get_meta().scopes
 
-        scope_method = "scope_%s" % method
         is_scope = False
         is_macro = False
 
-        # New scope definition check
-        if hasattr(self._model, method) and isinstance(
-            getattr(self._model, method), scope
-        ):
-            is_scope = True
-            attribute = getattr(self._model, method)
-            scope_method = method
-        # Old scope definition check
-        elif hasattr(self._model, scope_method):
+        if method in scopes:
             is_scope = True
+            scope_method = scopes[method]
             attribute = getattr(self._model, scope_method)
         elif method in self._macros:
             is_macro = True
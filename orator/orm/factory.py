@@ -2,7 +2,6 @@
 
 import os
 import inflection
-from faker import Faker
 from functools import wraps
 from .factory_builder import FactoryBuilder
 
@@ -14,6 +13,8 @@ class Factory(object):
         :type faker: faker.Generator
         """
         if faker is None:
+            from faker import Faker
+
             self._faker = Faker()
         else:
             self._faker = faker
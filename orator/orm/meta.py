@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import inspect
+import inflection
+
+from .utils import accessor, mutator, relation, scope
+
+
+class ModelMeta(object):
+    """
+    The metadata of a model class.
+
+    It is built once, when the model class is created,
+    so that the values derived from the model declaration
+    are not computed again each time they are needed.
+    It is built again when the declaration is reassigned.
+    """
+
+    # The model attributes the metadata is derived from
+    # and which can be overridden on a model instance.
+    ATTRIBUTES = frozenset(
+        [
+            "__primary_key__",
+            "__fillable__",
+            "__guarded__",
+            "__hidden__",
+            "__visible__",
+            "__casts__",
+            "__dates__",
+        ]
+    )
+
+    JSON_CASTS = frozenset(["list", "dict", "json", "object"])
+
+    def __init__(self, model):
+        """
+        :param model: The model class
+        :type model: type
+        """
+        self.model = model
+        self.table = model.__table__ or inflection.tableize(model.__name__)
+        self.foreign_key = "%s_id" % inflection.singularize(self.table)
+
+        self.accessors = {}
+        self.mutators = {}
+        for value in model.__dict__.values():
+            if isinstance(value, accessor):
+                self.accessors[value.attribute] = value
+            elif isinstance(value, mutator):
+                self.mutators[value.attribute] = value
+
+        self.relations = {}
+        self.scopes = {}
+        dates_definitions = 0
+        for klass in reversed(inspect.getmro(model)):
+            if "get_dates" in klass.__dict__:
+                dates_definitions += 1
+
+            for name, value in klass.__dict__.items():
+                if isinstance(value, relation):
+                    self.relations[name] = value
+                elif isinstance(value, scope):
+                    self.scopes[name] = name
+                elif name.startswith("scope_") and callable(value):
+                    self.scopes[name[6:]] = name
+
+        # When get_dates() is overridden we can't know the dates beforehand
+        self._custom_dates = dates_definitions > 1
+
+        self.mixin_boots = []
+        for mixin in model.__bases__:
+            method = "boot_%s" % inflection.underscore(mixin.__name__)
+
+            # We bypass the metaclass lookup which would otherwise
+            # try to instantiate models (like pivots) to build a query.
+            try:
+                self.mixin_boots.append(type.__getattribute__(mixin, method))
+            except AttributeError:
+                continue
+
+        # The names under which the model events are dispatched
+        self.event_names = {}
+
+        self._load_attributes(model)
+
+    def _load_attributes(self, source):
+        """
+        Compute the values derived from the overridable model attributes.
+
+        :param source: The model class or a model instance
+        """
+        self.key_name = source.__primary_key__
+
+        self.casts = dict(
+            (key, value.lower().strip()) for key, value in source.__casts__.items()
+        )
+        self.json_casts = frozenset(
+            key for key, value in self.casts.items() if value in self.JSON_CASTS
+        )
+
+        if self._custom_dates:
+            self.dates = None
+        else:
+            self.dates = frozenset(
+                list(source.__dates__) + [source.CREATED_AT, source.UPDATED_AT]
+            )
+
+        self.fillable = frozenset(source.__fillable__)
+        self.guarded = frozenset(source.__guarded__)
+        self.guards_all = list(source.__guarded__) == ["*"]
+        self.totally_guarded = not self.fillable and self.guards_all
+
+        self.hidden = frozenset(source.__hidden__)
+        self.visible = frozenset(source.__visible__)
+
+    def event_name(self, event):
+        """
+        Get the name under which a model event is dispatched.
+
+        :param event: The event
+        :type event: str
+
+        :rtype: str
+        """
+        try:
+            return self.event_names[event]
+        except KeyError:
+            name = self.event_names[event] = "%s: %s" % (event, self.model.__name__)
+
+            return name
+
+    def for_instance(self, instance):
+        """
+        Get the metadata of a model instance
+        which overrides some of the model attributes.
+
+        :param instance: The model instance
+        :type instance: orator.orm.Model
+
+        :rtype: ModelMeta
+        """
+        meta = copy.copy(self)
+        meta._load_attributes(instance)
+
+        return meta
+
+    def __repr__(self):
+        return "<ModelMeta %s>" % self.model.__name__
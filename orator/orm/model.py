@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
 
-import simplejson as json
-import pendulum
 import inflection
 import inspect
+import threading
 import uuid
 import datetime
 from warnings import warn
+from contextlib import contextmanager
 from six import add_metaclass
 from collections import OrderedDict
-from ..utils import basestring, deprecated
+from ..utils import basestring, deprecated, lazy_import
 from ..exceptions.orm import MassAssignmentError, RelatedClassNotFound
 from ..query import QueryBuilder
 from .builder import Builder
@@ -27,10 +27,14 @@ from .relations import (
     MorphToMany,
 )
 from .relations.wrapper import Wrapper, BelongsToManyWrapper
-from .utils import mutator, accessor
+from .meta import ModelMeta
+from .touches import TouchBatch
 from .scopes import Scope
 from ..events import Event
 
+json = lazy_import("simplejson")
+pendulum = lazy_import("pendulum")
+
 
 class ModelRegister(dict):
     def __init__(self, *args, **kwargs):
@@ -49,16 +53,47 @@ class ModelRegister(dict):
         super(ModelRegister, self).__delitem__(key)
 
 
+class ModelState(threading.local):
+    """
+    The state of the models which is specific to each thread,
+    like the blocks disabling the events or batching the touches.
+    """
+
+    def __init__(self):
+        self.touch_batches = []
+        self.ignore_touches = []
+        self.ignore_events = []
+
+
 class MetaModel(type):
 
     __register__ = {}
 
     def __init__(cls, *args, **kwargs):
-        name = cls.__table__ or inflection.tableize(cls.__name__)
-        cls._register[name] = cls
+        cls._meta = ModelMeta(cls)
+        cls._register[cls._meta.table] = cls
 
         super(MetaModel, cls).__init__(*args, **kwargs)
 
+    def __setattr__(cls, key, value):
+        super(MetaModel, cls).__setattr__(key, value)
+
+        # The metadata derived from a reassigned declaration is stale,
+        # for the class and the subclasses inheriting the declaration
+        if key == "__table__" or key in ModelMeta.ATTRIBUTES:
+            cls._rebuild_meta()
+
+    def _rebuild_meta(cls):
+        table = cls._meta.table
+        if cls._register.get(table) is cls:
+            del cls._register[table]
+
+        type.__setattr__(cls, "_meta", ModelMeta(cls))
+        cls._register[cls._meta.table] = cls
+
+        for subclass in cls.__subclasses__():
+            subclass._rebuild_meta()
+
     def __getattr__(cls, item):
         try:
             return type.__getattribute__(cls, item)
@@ -104,8 +139,7 @@ class Model(object):
     _global_scopes = {}
     _registered = []
 
-    _accessor_cache = {}
-    _mutator_cache = {}
+    _state = ModelState()
 
     __resolver = None
     __columns__ = []
@@ -162,23 +196,12 @@ class Model(object):
         """
         The booting method of the model.
         """
-        cls._accessor_cache[cls] = {}
-        cls._mutator_cache[cls] = {}
-
-        for name, method in cls.__dict__.items():
-            if isinstance(method, accessor):
-                cls._accessor_cache[cls][method.attribute] = method
-            elif isinstance(method, mutator):
-                cls._mutator_cache[cls][method.attribute] = method
-
         cls._boot_mixins()
 
     @classmethod
     def _boot_columns(cls):
         connection = cls.resolve_connection()
-        columns = connection.get_schema_manager().list_table_columns(
-            cls.__table__ or inflection.tableize(cls.__name__)
-        )
+        columns = connection.get_schema_manager().list_table_columns(cls._meta.table)
         cls.__columns__ = list(columns.keys())
 
     @classmethod
@@ -186,13 +209,8 @@ class Model(object):
         """
         Boot the mixins
         """
-        for mixin in cls.__bases__:
-            # if mixin == Model:
-            #    continue
-
-            method = "boot_%s" % inflection.underscore(mixin.__name__)
-            if hasattr(mixin, method):
-                getattr(mixin, method)(cls)
+        for boot in cls._meta.mixin_boots:
+            boot(cls)
 
     @classmethod
     def add_global_scope(cls, scope, implementation=None):
@@ -273,6 +291,9 @@ class Model(object):
         if _attributes is not None:
             attributes.update(_attributes)
 
+        if not attributes:
+            return self
+
         totally_guarded = self.totally_guarded()
 
         for key, value in self._fillable_from_dict(attributes).items():
@@ -315,8 +336,9 @@ class Model(object):
         :return: The fillable attributes
         :rtype: dict
         """
-        if self.__fillable__ and not self.__unguarded__:
-            return {x: attributes[x] for x in attributes if x in self.__fillable__}
+        fillable = self._meta.fillable
+        if fillable and not self.__unguarded__:
+            return {x: attributes[x] for x in attributes if x in fillable}
 
         return attributes
 
@@ -1456,6 +1478,34 @@ class Model(object):
         for event in cls.get_observable_events():
             cls.__dispatcher__.forget("%s: %s" % (event, cls.__name__))
 
+    @classmethod
+    @contextmanager
+    def without_events(cls):
+        """
+        Disable the dispatching of the model events during the block.
+
+        Called on Model, it disables the events of every model.
+        """
+        cls._state.ignore_events.append(cls)
+
+        try:
+            yield
+        finally:
+            cls._state.ignore_events.remove(cls)
+
+    @classmethod
+    def is_ignoring_events(cls):
+        """
+        Determine if the model events are currently disabled.
+
+        :rtype: bool
+        """
+        for klass in cls._state.ignore_events:
+            if issubclass(cls, klass):
+                return True
+
+        return False
+
     @classmethod
     def _register_model_event(cls, event, callback):
         """
@@ -1728,14 +1778,120 @@ class Model(object):
         """
         Touch the owning relations of the model.
         """
+        if self.is_ignoring_touch():
+            return
+
+        batch = self.get_touch_batch()
+
         for relation in self.__touches__:
-            if hasattr(self, relation):
+            if batch is not None:
+                self._add_owners_to_touch_batch(relation, batch)
+            elif hasattr(self, relation):
                 _relation = getattr(self, relation)
 
                 if _relation:
                     _relation.touch()
                     _relation.touch_owners()
 
+    def _add_owners_to_touch_batch(self, relation, batch):
+        """
+        Add the owners of the given relation to a touch batch.
+
+        :param relation: The relation to touch
+        :type relation: str
+
+        :type batch: orator.orm.touches.TouchBatch
+        """
+        if not hasattr(self, relation):
+            return
+
+        owners = getattr(self, relation)
+
+        if isinstance(owners, Wrapper):
+            related = owners._relation
+
+            # The owner of a "belongs to" relationship
+            # can be touched without being retrieved.
+            if isinstance(related, BelongsTo) and not isinstance(related, MorphTo):
+                batch.add(
+                    related.get_related(),
+                    self._attributes.get(related.get_foreign_key()),
+                    related.get_other_key(),
+                )
+
+                return
+
+            owners = owners.__wrapped__
+
+        if isinstance(owners, Collection):
+            for owner in owners:
+                batch.add(owner)
+        elif isinstance(owners, Model):
+            batch.add(owners)
+
+    @classmethod
+    @contextmanager
+    def batch_touches(cls):
+        """
+        Defer the touching of owners until the end of the block.
+
+        Each distinct owner is then touched only once,
+        with a single UPDATE statement per table.
+        """
+        if cls._state.touch_batches:
+            # Nested blocks are part of the outermost batch
+            yield cls._state.touch_batches[-1]
+
+            return
+
+        batch = TouchBatch()
+        cls._state.touch_batches.append(batch)
+
+        try:
+            yield batch
+
+            batch.flush()
+        finally:
+            cls._state.touch_batches.remove(batch)
+
+    @classmethod
+    def get_touch_batch(cls):
+        """
+        Get the current touch batch, if any.
+
+        :rtype: orator.orm.touches.TouchBatch or None
+        """
+        if cls._state.touch_batches:
+            return cls._state.touch_batches[-1]
+
+    @classmethod
+    @contextmanager
+    def without_touching(cls):
+        """
+        Disable the touching of the model and its owners during the block.
+
+        Called on Model, it disables touching for every model.
+        """
+        cls._state.ignore_touches.append(cls)
+
+        try:
+            yield
+        finally:
+            cls._state.ignore_touches.remove(cls)
+
+    @classmethod
+    def is_ignoring_touch(cls):
+        """
+        Determine if the model is currently ignoring touches.
+
+        :rtype: bool
+        """
+        for klass in cls._state.ignore_touches:
+            if issubclass(cls, klass):
+                return True
+
+        return False
+
     def touches(self, relation):
         """
         Determine if a model touches a given relation.
@@ -1756,10 +1912,13 @@ class Model(object):
         if not self.__dispatcher__:
             return True
 
+        if self._state.ignore_events and self.is_ignoring_events():
+            return True
+
         # We will append the names of the class to the event to distinguish it from
         # other model events that are fired, allowing us to listen on each model
         # event set individually instead of catching event for all the models.
-        event = "%s: %s" % (event, self.__class__.__name__)
+        event = self._meta.event_name(event)
 
         return self.__dispatcher__.fire(event, self)
 
@@ -1792,7 +1951,7 @@ class Model(object):
 
         :rtype: bool
         """
-        if not self.__timestamps__:
+        if not self.__timestamps__ or self.is_ignoring_touch():
             return False
 
         self._update_timestamps()
@@ -1981,6 +2140,14 @@ class Model(object):
 
         return Pivot(parent, attributes, table, exists)
 
+    def get_meta(self):
+        """
+        Get the metadata of the model.
+
+        :rtype: orator.orm.meta.ModelMeta
+        """
+        return self._meta
+
     def get_table(self):
         """
         Get the table associated with the model.
@@ -2018,7 +2185,7 @@ class Model(object):
         :return: The primary key name
         :rtype: str
         """
-        return self.__primary_key__
+        return self._meta.key_name
 
     def set_key_name(self, name):
         """
@@ -2081,7 +2248,11 @@ class Model(object):
 
         :rtype: str
         """
-        return "%s_id" % inflection.singularize(self.get_table())
+        table = self.get_table()
+        if table == self._meta.table:
+            return self._meta.foreign_key
+
+        return "%s_id" % inflection.singularize(table)
 
     def get_hidden(self):
         """
@@ -2205,13 +2376,14 @@ class Model(object):
         if self.__unguarded__:
             return True
 
-        if key in self.__fillable__:
+        fillable = self._meta.fillable
+        if key in fillable:
             return True
 
         if self.is_guarded(key):
             return False
 
-        return not self.__fillable__ and not key.startswith("_")
+        return not fillable and not key.startswith("_")
 
     def is_guarded(self, key):
         """
@@ -2223,7 +2395,9 @@ class Model(object):
         :return: Whether the attribute is guarded or not
         :rtype: bool
         """
-        return key in self.__guarded__ or self.__guarded__ == ["*"]
+        meta = self._meta
+
+        return key in meta.guarded or meta.guards_all
 
     def totally_guarded(self):
         """
@@ -2231,7 +2405,7 @@ class Model(object):
 
         :rtype: bool
         """
-        return len(self.__fillable__) == 0 and self.__guarded__ == ["*"]
+        return self._meta.totally_guarded
 
     def _remove_table_from_key(self, key):
         """
@@ -2312,7 +2486,7 @@ class Model(object):
         # Next we will handle any casts that have been setup for this model and cast
         # the values to their appropriate type. If the attribute has a mutator we
         # will not perform the cast on those attributes to avoid any confusion.
-        for key, value in self.__casts__.items():
+        for key in self._meta.casts:
             if key not in attributes or key in mutated_attributes:
                 continue
 
@@ -2353,8 +2527,9 @@ class Model(object):
         """
         attributes = {}
 
+        hidden = self._meta.hidden
         for key, value in self._get_dictable_relations().items():
-            if key in self.get_hidden():
+            if key in hidden:
                 continue
 
             relation = None
@@ -2385,15 +2560,70 @@ class Model(object):
 
         :rtype: dict
         """
-        if len(self.__visible__) > 0:
-            return {x: values[x] for x in values.keys() if x in self.__visible__}
+        meta = self._meta
+        if meta.visible:
+            return {x: values[x] for x in values.keys() if x in meta.visible}
 
         return {
             x: values[x]
             for x in values.keys()
-            if x not in self.__hidden__ and not x.startswith("_")
+            if x not in meta.hidden and not x.startswith("_")
         }
 
+    def can_serialize_rows(self):
+        """
+        Determine whether raw rows can be serialized without hydrating models,
+        that is when there are no accessors, appends or custom dates.
+
+        :rtype: bool
+        """
+        meta = self._meta
+
+        return not (meta.accessors or self.__appends__ or meta.dates is None)
+
+    def get_row_serializer(self, columns):
+        """
+        Get a function serializing raw rows like attributes_to_dict() would.
+
+        :param columns: The columns of the rows
+        :type columns: list
+
+        :return: The serialized columns and the function
+                 converting a row to a list of serialized values
+        :rtype: tuple
+        """
+        meta = self._meta
+        keys = list(self._get_dictable_items(dict(zip(columns, columns))))
+        indexes = []
+        visible = []
+        transforms = []
+        for i, column in enumerate(columns):
+            if column not in keys or column in visible:
+                continue
+
+            indexes.append(i)
+            visible.append(column)
+
+            if column in meta.casts:
+                transforms.append((len(indexes) - 1, self._get_row_caster(column)))
+            elif column in meta.dates:
+                transforms.append((len(indexes) - 1, self._format_date))
+
+        def serialize(row):
+            values = [row[i] for i in indexes]
+            for i, transform in transforms:
+                values[i] = transform(values[i])
+
+            return values
+
+        return visible, serialize
+
+    def _get_row_caster(self, key):
+        if key in self._meta.dates:
+            return lambda value: self._cast_attribute(key, self._format_date(value))
+
+        return lambda value: self._cast_attribute(key, value)
+
     def get_attribute(self, key, original=None):
         """
         Get an attribute from the model.
@@ -2436,7 +2666,7 @@ class Model(object):
 
         if self._has_cast(key):
             value = self._cast_attribute(key, value)
-        elif key in self.get_dates():
+        elif self._is_date_attribute(key):
             if value is not None:
                 return self.as_datetime(value)
 
@@ -2488,7 +2718,7 @@ class Model(object):
         if hasattr(value, "to_dict"):
             return value.to_dict()
 
-        if key in self.get_dates():
+        if self._is_date_attribute(key):
             return self._format_date(value)
 
         return value
@@ -2502,7 +2732,7 @@ class Model(object):
 
         :rtype: bool
         """
-        return key in self.__casts__
+        return key in self._meta.casts
 
     def _has_set_mutator(self, key):
         """
@@ -2513,11 +2743,11 @@ class Model(object):
 
         :rtype: bool
         """
-        klass = self.__class__
-        if key not in self._mutator_cache[klass]:
+        mutators = self._meta.mutators
+        if key not in mutators:
             return False
 
-        return self._mutator_cache[klass][key].mutator is not None
+        return mutators[key].mutator is not None
 
     def _is_json_castable(self, key):
         """
@@ -2528,12 +2758,7 @@ class Model(object):
 
         :rtype: bool
         """
-        if self._has_cast(key):
-            type = self._get_cast_type(key)
-
-            return type in ["list", "dict", "json", "object"]
-
-        return False
+        return key in self._meta.json_casts
 
     def _get_cast_type(self, key):
         """
@@ -2544,7 +2769,7 @@ class Model(object):
 
         :rtype: str
         """
-        return self.__casts__[key].lower().strip()
+        return self._meta.casts[key]
 
     def _cast_attribute(self, key, value):
         """
@@ -2585,6 +2810,21 @@ class Model(object):
 
         return self.__dates__ + defaults
 
+    def _is_date_attribute(self, key):
+        """
+        Determine whether an attribute should be converted to a date.
+
+        :param key: The attribute to check
+        :type key: str
+
+        :rtype: bool
+        """
+        dates = self._meta.dates
+        if dates is None:
+            return key in self.get_dates()
+
+        return key in dates
+
     def from_datetime(self, value):
         """
         Convert datetime to a storable string.
@@ -2667,7 +2907,7 @@ class Model(object):
         if self._has_set_mutator(key):
             return super(Model, self).__setattr__(key, value)
 
-        if key in self.get_dates() and value:
+        if self._is_date_attribute(key) and value:
             value = self.from_datetime(value)
 
         if self._is_json_castable(key):
@@ -2946,25 +3186,23 @@ class Model(object):
 
         :return: list
         """
-        klass = self.__class__
-
-        if klass in self._accessor_cache:
-            return self._accessor_cache[klass]
-
-        return []
+        return self._meta.accessors
 
     def __getattr__(self, item):
         return self.get_attribute(item)
 
     def __setattr__(self, key, value):
-        if key in [
-            "_attributes",
-            "_exists",
-            "_relations",
-            "_original",
-        ] or key.startswith("__"):
+        if key in ["_attributes", "_exists", "_relations", "_original", "_meta"]:
             return object.__setattr__(self, key, value)
 
+        if key.startswith("__"):
+            object.__setattr__(self, key, value)
+
+            if key in ModelMeta.ATTRIBUTES:
+                self._meta = self._meta.for_instance(self)
+
+            return
+
         if self._has_set_mutator(key):
             return self.set_attribute(key, value)
 
@@ -3,12 +3,14 @@
 import hashlib
 import time
 import inflection
+from collections import OrderedDict
 from ...exceptions.orm import ModelNotFound
 from ...query.expression import QueryExpression
 from ..collection import Collection
 import orator.orm.model
 from .relation import Relation
 from .result import Result
+from .wrapper import LazyPivot
 
 
 class BelongsToMany(Relation):
@@ -21,6 +23,10 @@ class BelongsToMany(Relation):
     _pivot_columns = []
     _pivot_wheres = []
 
+    # The maximum number of bindings of a single pivot statement.
+    # SQLite versions prior to 3.32 do not accept more than 999.
+    max_bindings = 999
+
     def __init__(
         self, query, parent, table, foreign_key, other_key, relation_name=None
     ):
@@ -160,32 +166,54 @@ class BelongsToMany(Relation):
         """
         Hydrate the pivot table relationship on the models.
 
+        The pivot models are only built when they are first accessed.
+
         :type models: list
         """
+        plan = self._get_pivot_plan()
+
         for model in models:
-            pivot = self.new_existing_pivot(self._clean_pivot_attributes(model))
+            attributes = self._clean_pivot_attributes(model, plan)
 
-            model.set_relation("pivot", pivot)
+            model.set_relation("pivot", LazyPivot(self, attributes))
 
-    def _clean_pivot_attributes(self, model):
+    def _clean_pivot_attributes(self, model, plan=None):
         """
         Get the pivot attributes from a model.
 
         :type model: orator.Model
+
+        :param plan: The aliased pivot columns and their original name
+        :type plan: list
         """
+        if plan is None:
+            plan = self._get_pivot_plan()
+
         values = {}
-        delete_keys = []
+        attributes = model.get_attributes()
+
+        for alias, column in plan:
+            if alias in attributes:
+                values[column] = attributes.pop(alias)
 
-        for key, value in model.get_attributes().items():
-            if key.find("pivot_") == 0:
-                values[key[6:]] = value
+        return values
+
+    def _get_pivot_plan(self):
+        """
+        Get the aliased pivot columns selected by the relation
+        along with the name of the pivot column.
 
-                delete_keys.append(key)
+        :rtype: list
+        """
+        plan = []
 
-        for key in delete_keys:
-            delattr(model, key)
+        for column in [self._foreign_key, self._other_key] + self._pivot_columns:
+            alias = "pivot_%s" % column
 
-        return values
+            if (alias, column) not in plan:
+                plan.append((alias, column))
+
+        return plan
 
     def add_constraints(self):
         """
@@ -264,16 +292,10 @@ class BelongsToMany(Relation):
 
         :rtype: list
         """
-        defaults = [self._foreign_key, self._other_key]
-
-        columns = []
-
-        for column in defaults + self._pivot_columns:
-            value = "%s.%s AS pivot_%s" % (self._table, column, column)
-            if value not in columns:
-                columns.append("%s.%s AS pivot_%s" % (self._table, column, column))
-
-        return columns
+        return [
+            "%s.%s AS %s" % (self._table, column, alias)
+            for alias, column in self._get_pivot_plan()
+        ]
 
     def _has_pivot_column(self, column):
         """
@@ -380,7 +402,14 @@ class BelongsToMany(Relation):
         dictionary = {}
 
         for result in results:
-            key = getattr(result.pivot, foreign)
+            pivot = result.pivot
+
+            # Reading the raw attributes avoids building the pivot model
+            if isinstance(pivot, LazyPivot):
+                key = pivot._pivot_attributes.get(foreign)
+            else:
+                key = getattr(pivot, foreign)
+
             if key not in dictionary:
                 dictionary[key] = []
 
@@ -571,28 +600,32 @@ class BelongsToMany(Relation):
 
     def sync(self, ids, detaching=True):
         """
-        Sync the intermediate tables with a list of IDs or collection of models
+        Sync the intermediate tables with a list of IDs or collection of models.
+
+        The current state of the pivot table is retrieved with a single query
+        and the changes are applied with batched statements in a transaction.
         """
         changes = {"attached": [], "detached": [], "updated": []}
 
         if isinstance(ids, Collection):
             ids = ids.model_keys()
 
-        current = self._new_pivot_query().lists(self._other_key).all()
-
         records = self._format_sync_list(ids)
 
-        detach = [x for x in current if x not in records.keys()]
+        with self._get_connection().transaction():
+            current = self._get_current_pivots(records)
 
-        if detaching and len(detach) > 0:
-            self.detach(detach)
+            detach = [x for x in current if x not in records]
 
-            changes["detached"] = detach
+            if detaching and len(detach) > 0:
+                self.detach(detach, False)
 
-        changes.update(self._attach_new(records, current, False))
+                changes["detached"] = detach
 
-        if len(changes["attached"]) or len(changes["updated"]):
-            self.touch_if_touching()
+            changes.update(self._attach_new(records, current, False))
+
+            if changes["attached"] or changes["updated"] or changes["detached"]:
+                self.touch_if_touching()
 
         return changes
 
@@ -600,7 +633,7 @@ class BelongsToMany(Relation):
         """
         Format the sync list so that it is keyed by ID.
         """
-        results = {}
+        results = OrderedDict()
 
         for attributes in records:
             if not isinstance(attributes, dict):
@@ -613,30 +646,86 @@ class BelongsToMany(Relation):
 
         return results
 
+    def _get_current_pivots(self, records):
+        """
+        Get the current pivot records keyed by ID,
+        with the columns the given records would update.
+
+        :rtype: OrderedDict
+        """
+        columns = []
+        for attributes in records.values():
+            for column in attributes:
+                if column not in columns:
+                    columns.append(column)
+
+        query = self._new_pivot_query()
+
+        if not columns:
+            return OrderedDict((id, {}) for id in query.lists(self._other_key))
+
+        current = OrderedDict()
+        for record in query.get([self._other_key] + columns):
+            record = dict(record)
+
+            current[record.pop(self._other_key)] = record
+
+        return current
+
     def _attach_new(self, records, current, touch=True):
         """
-        Attach all of the IDs that aren't in the current dict.
+        Attach all of the IDs that aren't in the current dict
+        and update the pivot records that have changed.
         """
         changes = {"attached": [], "updated": []}
 
+        attach = []
+        updates = OrderedDict()
+
         for id, attributes in records.items():
             if id not in current:
-                self.attach(id, attributes, touch)
+                attach.append({id: attributes})
 
                 changes["attached"].append(id)
-            elif len(attributes) > 0 and self.update_existing_pivot(
-                id, attributes, touch
+            elif len(attributes) > 0 and self._pivot_has_changed(
+                current[id], attributes
             ):
+                updates[id] = attributes
+
                 changes["updated"].append(id)
 
+        if attach:
+            self.attach(attach, touch=False)
+
+        if updates:
+            self.update_existing_pivots(updates, False)
+
+        if touch and (attach or updates):
+            self.touch_if_touching()
+
         return changes
 
+    def _pivot_has_changed(self, current, attributes):
+        """
+        Determine if the given attributes differ from a pivot record.
+
+        :type current: dict
+        :type attributes: dict
+
+        :rtype: bool
+        """
+        for key, value in attributes.items():
+            if key not in current or current[key] != value:
+                return True
+
+        return False
+
     def update_existing_pivot(self, id, attributes, touch=True):
         """
         Update an existing pivot record on the table.
         """
         if self.updated_at() in self._pivot_columns:
-            attributes = self.set_timestamps_on_attach(attributes, True)
+            attributes = self._set_timestamps_on_attach(dict(attributes), True)
 
         updated = self.new_pivot_statement_for_id(id).update(attributes)
 
@@ -645,6 +734,49 @@ class BelongsToMany(Relation):
 
         return updated
 
+    def update_existing_pivots(self, records, touch=True):
+        """
+        Update existing pivot records on the table.
+
+        Records sharing the same attributes are updated with a single statement.
+
+        :param records: The attributes to update keyed by ID
+        :type records: dict
+
+        :rtype: int
+        """
+        groups = OrderedDict()
+
+        for id, attributes in records.items():
+            try:
+                key = tuple(sorted(attributes.items()))
+                hash(key)
+            except TypeError:
+                # Unhashable values, like JSON ones, can't be grouped
+                key = (id,)
+
+            if key not in groups:
+                groups[key] = (attributes, [])
+
+            groups[key][1].append(id)
+
+        updated = 0
+
+        for attributes, ids in groups.values():
+            if self.updated_at() in self._pivot_columns:
+                attributes = self._set_timestamps_on_attach(dict(attributes), True)
+
+            for chunk in self._chunk(ids, len(attributes)):
+                query = self._new_pivot_query()
+                query.where_in(self._other_key, chunk)
+
+                updated += query.update(attributes)
+
+        if touch:
+            self.touch_if_touching()
+
+        return updated
+
     def attach(self, id, attributes=None, touch=True):
         """
         Attach a model to the parent.
@@ -652,12 +784,20 @@ class BelongsToMany(Relation):
         if isinstance(id, orator.orm.Model):
             id = id.get_key()
 
-        query = self.new_pivot_statement()
-
         if not isinstance(id, list):
             id = [id]
 
-        query.insert(self._create_attach_records(id, attributes))
+        records = self._create_attach_records(id, attributes)
+
+        # Records are grouped by columns so that each group
+        # can be inserted with multi-rows INSERT statements.
+        groups = OrderedDict()
+        for record in records:
+            groups.setdefault(tuple(sorted(record.keys())), []).append(record)
+
+        for columns, group in groups.items():
+            for chunk in self._chunk(group, len(columns)):
+                self.new_pivot_statement().insert(chunk)
 
         if touch:
             self.touch_if_touching()
@@ -694,11 +834,15 @@ class BelongsToMany(Relation):
         """
         Get the attach record ID and extra attributes.
         """
+        if isinstance(value, orator.orm.Model):
+            return value.get_key(), attributes
+
         if isinstance(value, dict):
             key = list(value.keys())[0]
-            attributes.update(value[key])
+            extra = dict(attributes or {})
+            extra.update(value[key])
 
-            return [key, attributes]
+            return key, extra
 
         return value, attributes
 
@@ -741,29 +885,67 @@ class BelongsToMany(Relation):
         if ids is None:
             ids = []
 
-        query = self._new_pivot_query()
-
         if not isinstance(ids, list):
             ids = [ids]
 
-        if len(ids) > 0:
-            query.where_in(self._other_key, ids)
+        results = 0
+
+        for chunk in self._chunk(ids) or [None]:
+            query = self._new_pivot_query()
+
+            if chunk is not None:
+                query.where_in(self._other_key, chunk)
+
+            results += query.delete()
 
         if touch:
             self.touch_if_touching()
 
-        results = query.delete()
-
         return results
 
+    def _chunk(self, items, width=1):
+        """
+        Split a list of items so that the statement using them
+        does not exceed the maximum number of bindings.
+
+        :param items: The items to split
+        :type items: list
+
+        :param width: The number of bindings per item
+        :type width: int
+
+        :rtype: list
+        """
+        # Keeping room for the pivot constraints
+        available = self.max_bindings - len(self._pivot_wheres) - 2
+        size = max(1, available // max(1, width))
+
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def _get_connection(self):
+        """
+        Get the connection used by the relationship.
+
+        :rtype: orator.connections.Connection
+        """
+        return self._query.get_query().get_connection()
+
     def touch_if_touching(self):
         """
         Touch if the parent model is being touched.
         """
         if self._touching_parent():
-            self.get_parent().touch()
+            batch = self.get_parent().get_touch_batch()
+
+            if batch is not None:
+                batch.add(self.get_parent())
+            else:
+                self.get_parent().touch()
 
-        if self.get_parent().touches(self._relation_name):
+        if (
+            self.get_parent().touches(self._relation_name)
+            and not self.get_related().is_ignoring_touch()
+        ):
             self.touch()
 
     def _touching_parent(self):
@@ -853,6 +1035,9 @@ class BelongsToMany(Relation):
     def get_foreign_key(self):
         return "%s.%s" % (self._table, self._foreign_key)
 
+    def _get_eager_partition_key(self):
+        return self.get_foreign_key()
+
     def get_other_key(self):
         return "%s.%s" % (self._table, self._other_key)
 
@@ -191,6 +191,9 @@ class HasManyThrough(Relation):
     def get_has_compare_key(self):
         return self._far_parent.get_qualified_key_name()
 
+    def _get_eager_partition_key(self):
+        return "%s.%s" % (self._parent.get_table(), self._first_key)
+
     def _new_instance(self, model):
         return HasManyThrough(
             self.new_query(), model, self._parent, self._first_key, self._second_key
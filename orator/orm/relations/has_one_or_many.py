@@ -317,6 +317,9 @@ class HasOneOrMany(Relation):
     def get_foreign_key(self):
         return self._foreign_key
 
+    def _get_eager_partition_key(self):
+        return self._foreign_key
+
     def get_plain_foreign_key(self):
         segments = self.get_foreign_key().split(".")
 
@@ -70,9 +70,40 @@ class Relation(object):
         """
         Get the relationship for eager loading.
 
+        The limit and offset of the query apply to the related models
+        of each parent rather than to all of them. This requires window
+        functions (PostgreSQL, MySQL 8.0, MariaDB 10.2 or SQLite 3.25):
+        on older servers they apply to all the related models.
+
         :rtype: Collection
         """
-        return self.get()
+        query = self.get_base_query()
+        key = self._get_eager_partition_key()
+
+        if key is None or (query.limit_ is None and query.offset_ is None):
+            return self.get()
+
+        if not query.get_connection().supports_window_functions():
+            return self.get()
+
+        query.limit_per_group(key)
+
+        results = self.get()
+
+        for model in results:
+            model.get_attributes().pop(query.limit_per_group_["column"], None)
+            model.sync_original()
+
+        return results
+
+    def _get_eager_partition_key(self):
+        """
+        Get the column identifying the parent of the eagerly loaded models,
+        if the limits can be applied for each parent.
+
+        :rtype: str or None
+        """
+        return
 
     def touch(self):
         """
@@ -50,3 +50,32 @@ class BelongsToManyWrapper(Wrapper):
         self._relation.with_pivot(*columns)
 
         return self
+
+
+class LazyPivot(Proxy):
+    """
+    Pivot of a many-to-many related model
+    which is only built when it is first accessed.
+    """
+
+    _relation = None
+    _pivot_attributes = None
+
+    def __init__(self, relation, attributes):
+        """
+        :param relation: The relation the pivot belongs to
+        :type relation: orator.orm.relations.BelongsToMany
+
+        :param attributes: The pivot attributes
+        :type attributes: dict
+        """
+        super(LazyPivot, self).__init__(self._get_pivot)
+
+        self._relation = relation
+        self._pivot_attributes = attributes
+
+    def _get_pivot(self):
+        return self._relation.new_existing_pivot(self._pivot_attributes)
+
+    def __repr__(self):
+        return repr(self.__wrapped__)
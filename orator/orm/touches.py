@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+
+
+class TouchBatch(object):
+    """
+    Collects the models whose timestamps must be touched
+    so that each of them is touched only once.
+    """
+
+    # The maximum number of keys of a single UPDATE statement
+    chunk_size = 500
+
+    def __init__(self):
+        self._pending = OrderedDict()
+        self._touched = set()
+
+    def add(self, model, key=None, column=None):
+        """
+        Add a model to touch.
+
+        :param model: The model instance or a model of the same table
+        :type model: orator.orm.Model
+
+        :param key: The value identifying the model to touch.
+                    Defaults to the model's key.
+        :type key: mixed
+
+        :param column: The column identified by the key.
+                       Defaults to the model's key name.
+        :type column: str
+        """
+        if column is None:
+            column = model.get_key_name()
+            key = model.get_key()
+            instance = model
+        else:
+            instance = None
+
+        if key is None:
+            return
+
+        group = (model.__class__, model.get_connection_name(), column)
+
+        if (group, key) in self._touched:
+            return
+
+        keys = self._pending.setdefault(group, OrderedDict())
+
+        if instance is not None or key not in keys:
+            keys[key] = instance
+
+    def is_empty(self):
+        return len(self._pending) == 0
+
+    def flush(self):
+        """
+        Touch the pending models, with one UPDATE per table,
+        and cascade to their owners.
+        """
+        while self._pending:
+            pending, self._pending = self._pending, OrderedDict()
+
+            for group, models in pending.items():
+                for key in models:
+                    self._touched.add((group, key))
+
+                self._touch(group, models)
+
+    def _touch(self, group, models):
+        """
+        Touch a group of models of the same table.
+
+        :type group: tuple
+        :type models: OrderedDict
+        """
+        model_class, connection, column = group
+
+        instance = model_class().set_connection(connection)
+
+        if not instance.uses_timestamps() or instance.is_ignoring_touch():
+            return
+
+        updated_at = instance.get_updated_at_column()
+        time = instance.fresh_timestamp()
+        keys = list(models.keys())
+
+        for i in range(0, len(keys), self.chunk_size):
+            instance.new_query().where_in(column, keys[i : i + self.chunk_size]).update(
+                {updated_at: instance.from_datetime(time)}
+            )
+
+        for model in models.values():
+            if model is not None:
+                model.set_updated_at(time)
+                model.sync_original_attribute(updated_at)
+
+        if not instance.__touches__:
+            return
+
+        # The owners of the touched models must be touched as well,
+        # so we retrieve the models we do not have in a single query.
+        missing = [key for key, model in models.items() if model is None]
+        if missing:
+            for i in range(0, len(missing), self.chunk_size):
+                chunk = missing[i : i + self.chunk_size]
+
+                for model in instance.new_query().where_in(column, chunk).get():
+                    models[model.get_attribute(column)] = model
+
+        for model in models.values():
+            if model is not None:
+                model.touch_owners()
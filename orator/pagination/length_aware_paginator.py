@@ -9,7 +9,9 @@ from ..utils import deprecated
 
 
 class LengthAwarePaginator(BasePaginator):
-    def __init__(self, items, total, per_page, current_page=None, options=None):
+    def __init__(
+        self, items, total, per_page, current_page=None, options=None, approximate=False
+    ):
         """
         Constructor
 
@@ -27,12 +29,16 @@ class LengthAwarePaginator(BasePaginator):
 
         :param options: Extra options to set
         :type options: dict
+
+        :param approximate: Whether the total is an estimate or a cached count
+        :type approximate: bool
         """
         if options is not None:
             for key, value in options.items():
                 setattr(self, key, value)
 
         self.total = total
+        self.approximate = approximate
         self.per_page = per_page
         self.last_page = int(math.ceil(total / per_page))
         self.current_page = self._set_current_page(current_page, self.last_page)
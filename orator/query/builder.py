@@ -2,6 +2,7 @@
 
 import re
 import copy
+import time
 import datetime
 
 from itertools import chain
@@ -9,6 +10,8 @@ from collections import OrderedDict
 
 from .expression import QueryExpression
 from .join_clause import JoinClause
+from .columns import ColumnsBuilder
+from .export import get_exporter
 from ..pagination import Paginator, LengthAwarePaginator
 from ..utils import basestring, Null
 from ..exceptions import ArgumentError
@@ -46,6 +49,13 @@ class QueryBuilder(object):
         "not similar to",
     ]
 
+    # The strategies getting the total number of rows of a paginated query
+    count_strategies = ["exact", "estimate", "cached"]
+
+    # Maximum number of cached counts kept by connection
+    # before the cache is flushed.
+    COUNT_CACHE_SIZE = 1024
+
     def __init__(self, connection, grammar, processor):
         """
         Constructor
@@ -63,9 +73,10 @@ class QueryBuilder(object):
         self._processor = processor
         self._connection = connection
         self._bindings = OrderedDict()
-        for type in ["select", "join", "where", "having", "order"]:
+        for type in ["expressions", "select", "join", "where", "having", "order"]:
             self._bindings[type] = []
 
+        self.expressions = []
         self.aggregate_ = None
         self.columns = []
         self.distinct_ = False
@@ -82,6 +93,7 @@ class QueryBuilder(object):
         self.union_offset = None
         self.union_orders = []
         self.lock_ = None
+        self.limit_per_group_ = None
 
         self._backups = {}
 
@@ -150,6 +162,52 @@ class QueryBuilder(object):
             "(%s) AS %s" % (query, self._grammar.wrap(as_)), bindings
         )
 
+    def select_window(self, function, as_, partition_by=None, order_by=None):
+        """
+        Add a window function expression to the query
+
+        :param function: The window function, like "ROW_NUMBER()"
+        :type function: str
+
+        :param as_: The alias of the expression
+        :type as_: str
+
+        :param partition_by: The columns dividing the rows into partitions
+        :type partition_by: str or list
+
+        :param order_by: The columns ordering the rows of each partition,
+                         or (column, direction) tuples
+        :type order_by: str or list
+
+        :return: The current QueryBuilder instance
+        :rtype: QueryBuilder
+        """
+        if isinstance(partition_by, basestring):
+            partition_by = [partition_by]
+
+        if isinstance(order_by, (basestring, tuple)):
+            order_by = [order_by]
+
+        orders = []
+        for order in order_by or []:
+            if isinstance(order, tuple):
+                column, direction = order
+            else:
+                column, direction = order, "asc"
+
+            orders.append({"column": column, "direction": direction.lower()})
+
+        return self.add_select(
+            QueryExpression(
+                "%s %s AS %s"
+                % (
+                    function,
+                    self._grammar.compile_over(self, partition_by, orders),
+                    self._grammar.wrap(as_),
+                )
+            )
+        )
+
     def add_select(self, *column):
         """
         Add a new select column to query
@@ -192,6 +250,78 @@ class QueryBuilder(object):
 
         return self
 
+    def with_(self, name, query, columns=None, recursive=False):
+        """
+        Add a common table expression to the query
+
+        :param name: The name of the expression
+        :type name: str
+
+        :param query: The query of the expression
+        :type query: QueryBuilder or str
+
+        :param columns: The names of the expression columns
+        :type columns: list
+
+        :param recursive: Whether the expression references itself
+        :type recursive: bool
+
+        :return: The current QueryBuilder instance
+        :rtype: QueryBuilder
+        """
+        if isinstance(query, QueryBuilder):
+            bindings = query.get_bindings()
+
+            query = query.to_sql()
+        elif isinstance(query, basestring):
+            bindings = []
+        else:
+            raise ArgumentError("Invalid common table expression")
+
+        self.expressions.append(
+            {"name": name, "query": query, "columns": columns, "recursive": recursive}
+        )
+
+        self.add_binding(bindings, "expressions")
+
+        return self
+
+    def with_recursive(self, name, anchor, recursive, columns=None, all=True):
+        """
+        Add a recursive common table expression to the query
+
+        :param name: The name of the expression
+        :type name: str
+
+        :param anchor: The query selecting the initial rows
+        :type anchor: QueryBuilder
+
+        :param recursive: The query selecting the next rows
+                          by joining the expression itself
+        :type recursive: QueryBuilder
+
+        :param columns: The names of the expression columns
+        :type columns: list
+
+        :param all: Whether to keep the duplicate rows,
+                    a "UNION ALL" is cheaper than a "UNION"
+        :type all: bool
+
+        :return: The current QueryBuilder instance
+        :rtype: QueryBuilder
+        """
+        query = "%s %s %s" % (
+            anchor.to_sql(),
+            "UNION ALL" if all else "UNION",
+            recursive.to_sql(),
+        )
+
+        self.with_(name, query, columns, recursive=True)
+
+        return self.add_binding(
+            anchor.get_bindings() + recursive.get_bindings(), "expressions"
+        )
+
     def join(self, table, one=None, operator=None, two=None, type="inner", where=False):
         """
         Add a join clause to the query
@@ -343,6 +473,48 @@ class QueryBuilder(object):
         """
         return self.join_where(table, one, operator, two, "right")
 
+    def join_lateral(self, query, as_, type="inner"):
+        """
+        Add a lateral join to a subquery, which can reference
+        the columns of the preceding tables
+
+        :param query: The subquery
+        :type query: QueryBuilder
+
+        :param as_: The alias of the subquery
+        :type as_: str
+
+        :param type: The join type
+        :type type: str
+
+        :return: The current QueryBuilder instance
+        :rtype: QueryBuilder
+        """
+        join = JoinClause(
+            QueryExpression(
+                "LATERAL (%s) AS %s" % (query.to_sql(), self._grammar.wrap_table(as_))
+            ),
+            type,
+        )
+        join.bindings = query.get_bindings()
+
+        return self.join(join)
+
+    def left_join_lateral(self, query, as_):
+        """
+        Add a left lateral join to a subquery
+
+        :param query: The subquery
+        :type query: QueryBuilder
+
+        :param as_: The alias of the subquery
+        :type as_: str
+
+        :return: The current QueryBuilder instance
+        :rtype: QueryBuilder
+        """
+        return self.join_lateral(query, as_, "left")
+
     def where(self, column, operator=Null(), value=None, boolean="and"):
         """
         Add a where clause to the query
@@ -903,6 +1075,25 @@ class QueryBuilder(object):
     def take(self, value):
         return self.limit(value)
 
+    def limit_per_group(self, *columns):
+        """
+        Apply the limit and offset of the query to each group of rows
+        sharing the values of the given columns rather than to all the rows.
+
+        The rows of each group are numbered in the order of the query
+        with a window function, the number is selected as "orator_row".
+        Window functions require MySQL 8.0, MariaDB 10.2 or SQLite 3.25.
+
+        :param columns: The columns of the groups
+        :type columns: tuple
+
+        :return: The current QueryBuilder instance
+        :rtype: QueryBuilder
+        """
+        self.limit_per_group_ = {"columns": list(columns), "column": "orator_row"}
+
+        return self
+
     def for_page(self, page, per_page=15):
         return self.skip((page - 1) * per_page).take(per_page)
 
@@ -976,6 +1167,163 @@ class QueryBuilder(object):
         """
         return self._grammar.compile_select(self)
 
+    def explain(self, analyze=False, format="json"):
+        """
+        Get the execution plan of the query
+
+        :param analyze: Whether to actually execute the query to get real statistics
+        :type analyze: bool
+
+        :param format: The format of the plan requested from the database (json or text)
+        :type format: str
+
+        :return: The normalized execution plan
+        :rtype: orator.query.plan.QueryPlan
+        """
+        if format not in ("json", "text"):
+            raise ArgumentError("Invalid explain format: %s" % format)
+
+        sql = self._grammar.compile_explain(self, analyze, format)
+
+        results = self._connection.select(
+            sql, self.get_bindings(), not self._use_write_connection
+        )
+
+        return self._processor.process_explain(self, results, analyze, format)
+
+    def copy_to(self, destination, format="csv", header=False):
+        """
+        Write the results of the query with a COPY statement
+
+        The rows are streamed from the database
+        without being loaded in memory.
+
+        :param destination: A file-like object or a callback receiving the data
+        :type destination: file or callable
+
+        :param format: The format of the data (csv, text or binary)
+        :type format: str
+
+        :param header: Whether to write the columns names first (csv only)
+        :type header: bool
+        """
+        if format not in ("csv", "text", "binary"):
+            raise ArgumentError("Invalid copy format: %s" % format)
+
+        sql = self._grammar.compile_copy_to(self, format, header)
+
+        self._connection.copy_to(sql, self.get_bindings(), destination)
+
+    def to_columns(self, dtype_map=None, chunk_size=1000):
+        """
+        Execute the query and get the results as columns
+
+        The rows are fetched as tuples, by chunks, and stored
+        in NumPy arrays when NumPy is installed, or ``array.array``
+        otherwise, without building a dictionary per row.
+
+        :param dtype_map: The NumPy dtypes, or array typecodes, of the columns.
+                          They are inferred from the values by default.
+        :type dtype_map: dict
+
+        :param chunk_size: The number of rows fetched at once
+        :type chunk_size: int
+
+        :return: The columns by name
+        :rtype: OrderedDict
+        """
+        return self._get_columns(ColumnsBuilder(dtype_map), chunk_size)
+
+    def to_records(self, dtype_map=None, chunk_size=1000):
+        """
+        Execute the query and get the results as a NumPy structured array
+
+        :param dtype_map: The NumPy dtypes of the columns.
+                          They are inferred from the values by default.
+        :type dtype_map: dict
+
+        :param chunk_size: The number of rows fetched at once
+        :type chunk_size: int
+
+        :rtype: numpy.recarray
+        """
+        import numpy
+
+        columns = self._get_columns(ColumnsBuilder(dtype_map, numpy), chunk_size)
+
+        return numpy.rec.fromarrays(list(columns.values()), names=list(columns))
+
+    def _get_columns(self, builder, chunk_size):
+        columns, count, chunks = self.select_tuples(chunk_size)
+
+        return builder.build(columns, chunks, count)
+
+    def export(self, fp, format="csv", chunk_size=1000, header=True):
+        """
+        Execute the query and write the results to a file.
+
+        The rows are streamed from a server-side cursor, when supported,
+        straight to the file.
+
+        :param fp: The text file to write to. CSV files should be opened
+                   with ``newline=""`` on Python 3.
+        :type fp: file
+
+        :param format: The format of the file (csv or ndjson)
+        :type format: str
+
+        :param chunk_size: The number of rows fetched at once
+        :type chunk_size: int
+
+        :param header: Whether to write the columns names first (csv only)
+        :type header: bool
+
+        :return: The number of exported rows
+        :rtype: int
+        """
+        exporter = get_exporter(fp, format, header)
+
+        columns, _, chunks = self.select_tuples(chunk_size, server_side=True)
+        exporter.set_columns(columns)
+
+        count = 0
+        for chunk in chunks:
+            count += exporter.write(chunk)
+
+        return count
+
+    def select_tuples(self, chunk_size, server_side=False):
+        """
+        Execute the query and fetch the rows as tuples, by chunks
+
+        :param chunk_size: The number of rows fetched at once
+        :type chunk_size: int
+
+        :param server_side: Whether to use a server-side cursor, if supported
+        :type server_side: bool
+
+        :return: The names of the columns, the number of rows if known
+                 and an iterator over the chunks of rows
+        :rtype: tuple
+        """
+        original = self.columns
+
+        if not original:
+            self.columns = ["*"]
+
+        try:
+            sql = self.to_sql()
+        finally:
+            self.columns = original
+
+        return self._connection.select_tuples(
+            chunk_size,
+            sql,
+            self.get_bindings(),
+            not self._use_write_connection,
+            server_side,
+        )
+
     def find(self, id, columns=None):
         """
         Execute a query for a single record by id
@@ -1064,7 +1412,14 @@ class QueryBuilder(object):
             self.to_sql(), self.get_bindings(), not self._use_write_connection
         )
 
-    def paginate(self, per_page=15, current_page=None, columns=None):
+    def paginate(
+        self,
+        per_page=15,
+        current_page=None,
+        columns=None,
+        count_strategy="exact",
+        count_ttl=60,
+    ):
         """
         Paginate the given query.
 
@@ -1077,6 +1432,15 @@ class QueryBuilder(object):
         :param columns: The columns to return
         :type columns: list
 
+        :param count_strategy: How to get the total number of records:
+                               "exact" counts them, "estimate" uses the
+                               statistics of the database and "cached"
+                               reuses the count of the same query
+        :type count_strategy: str
+
+        :param count_ttl: The number of seconds the "cached" counts are kept
+        :type count_ttl: int
+
         :return: The paginator
         :rtype: LengthAwarePaginator
         """
@@ -1085,11 +1449,13 @@ class QueryBuilder(object):
 
         page = current_page or Paginator.resolve_current_page()
 
-        total = self.get_count_for_pagination()
+        total, approximate = self.get_total_for_pagination(count_strategy, count_ttl)
 
         results = self.for_page(page, per_page).get(columns)
 
-        return LengthAwarePaginator(results, total, per_page, page)
+        return LengthAwarePaginator(
+            results, total, per_page, page, approximate=approximate
+        )
 
     def simple_paginate(self, per_page=15, current_page=None, columns=None):
         """
@@ -1125,6 +1491,118 @@ class QueryBuilder(object):
 
         return total
 
+    def get_total_for_pagination(self, count_strategy="exact", count_ttl=60):
+        """
+        Get the total number of rows of the paginated query.
+
+        :param count_strategy: The count strategy, "exact", "estimate" or "cached"
+        :type count_strategy: str
+
+        :param count_ttl: The number of seconds the "cached" counts are kept
+        :type count_ttl: int
+
+        :return: The total and whether it is approximate
+        :rtype: tuple
+        """
+        if count_strategy not in self.count_strategies:
+            raise ArgumentError("Invalid count strategy: %s" % count_strategy)
+
+        if count_strategy == "exact":
+            return self.get_count_for_pagination(), False
+
+        self._backup_fields_for_count()
+
+        try:
+            if count_strategy == "estimate":
+                total = self.estimate_count()
+
+                # The exact count is the fallback of the databases without estimates
+                if total is not None:
+                    return total, True
+
+                return self.count(), False
+
+            return self._get_cached_count(count_ttl)
+        finally:
+            self._restore_fields_for_count()
+
+    def estimate_count(self):
+        """
+        Get an estimate of the number of rows of the query
+        from the statistics of the database, without counting them.
+
+        The statistics of the table are used when the query selects
+        a whole table, the estimate of the query plan otherwise.
+
+        :return: The estimate, None if the database does not provide one
+        :rtype: int or None
+        """
+        query = self._clone()
+
+        if query._selects_whole_table():
+            sql = self._grammar.compile_table_rows_estimate(query)
+
+            if sql is not None:
+                results = self._connection.select(
+                    sql,
+                    [self._connection.get_table_prefix() + query.from__],
+                    not self._use_write_connection,
+                )
+
+                # Tables which were never analyzed have no statistics
+                if results and results[0]["estimate"] is not None:
+                    estimate = int(results[0]["estimate"])
+                    if estimate >= 0:
+                        return estimate
+
+        rows = query.explain().estimated_rows
+        if rows is not None:
+            return int(rows)
+
+    def _selects_whole_table(self):
+        return (
+            isinstance(self.from__, basestring)
+            and not self.expressions
+            and not self.distinct_
+            and not self.joins
+            and not self.wheres
+            and not self.groups
+            and not self.havings
+            and not self.unions
+            and self.limit_ is None
+            and self.offset_ is None
+            and self.limit_per_group_ is None
+        )
+
+    def _get_cached_count(self, ttl):
+        """
+        Get the count of the query, reusing the count of the same query
+        with the same bindings if it has not expired.
+
+        :return: The count and whether it was cached
+        :rtype: tuple
+        """
+        cache = self._connection.get_count_cache()
+
+        # The pages of a query share its count
+        query = self._clone()
+        query.limit_ = query.offset_ = None
+        key = (query.to_sql(), repr(query.get_bindings()))
+        now = time.time()
+
+        cached = cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1], True
+
+        total = self.count()
+
+        if len(cache) >= self.COUNT_CACHE_SIZE:
+            cache.clear()
+
+        cache[key] = (now + ttl, total)
+
+        return total, False
+
     def _backup_fields_for_count(self):
         for field, binding in [("orders", "order"), ("limit", None), ("offset", None)]:
             self._backups[field] = {}
@@ -1327,18 +1805,115 @@ class QueryBuilder(object):
         if not columns:
             columns = ["*"]
 
-        self.aggregate_ = {"function": func, "columns": columns}
+        # The aggregate is run on a copy so that the query can be shared
+        query = self._clone()
+        query.aggregate_ = {"function": func, "columns": columns}
 
-        previous_columns = self.columns
+        results = self._processor.process_select(self, query._run_select())
 
-        results = self.get(*columns).all()
+        if len(results) > 0:
+            return dict((k.lower(), v) for k, v in results[0].items())["aggregate"]
 
-        self.aggregate_ = None
+    def aggregates(self, group_by=None, **aggregates):
+        """
+        Execute several aggregate functions with a single query
 
-        self.columns = previous_columns
+            query.aggregates(count="*", sum="amount", max=["amount", "created_at"])
 
-        if len(results) > 0:
-            return dict((k.lower(), v) for k, v in results[0].items())["aggregate"]
+        :param group_by: The columns to group the rows by
+        :type group_by: str or list
+
+        :param aggregates: The columns to execute each function for,
+                           the results of a function executed for several
+                           columns are keyed like "max_amount"
+        :type aggregates: dict
+
+        :return: The results, by values of the group by columns,
+                 in their order, if the rows are grouped
+        :rtype: dict or OrderedDict
+        """
+        if not aggregates:
+            raise ArgumentError("No aggregate functions given")
+
+        if isinstance(group_by, basestring):
+            group_by = [group_by]
+
+        group_by = group_by or []
+
+        metrics = []
+        for func, columns in sorted(aggregates.items()):
+            if isinstance(columns, (list, tuple)):
+                for column in columns:
+                    metrics.append(
+                        ("%s_%s" % (func, column.split(".")[-1]), func, column)
+                    )
+            else:
+                metrics.append((func, func, columns))
+
+        query = self._clone()
+
+        select = []
+        for i, column in enumerate(group_by):
+            select.append("%s AS %s" % (self._grammar.wrap(column), "group_%d" % i))
+
+        for i, (_, func, column) in enumerate(metrics):
+            select.append(
+                "%s AS %s"
+                % (
+                    self._grammar.compile_aggregate_function(query, func, [column]),
+                    "aggregate_%d" % i,
+                )
+            )
+
+        query.columns = [QueryExpression(", ".join(select))]
+        query.distinct_ = False
+
+        # The aggregates cover every row: the orders may reference columns
+        # which are not grouped and a limit would drop some groups.
+        query.orders = []
+        query.limit_ = None
+        query.offset_ = None
+        query.set_bindings([], "order")
+
+        if group_by:
+            query.groups = query.groups + group_by
+
+            for column in group_by:
+                query.order_by(column)
+
+        results = OrderedDict()
+        for row in self._processor.process_select(self, query._run_select()):
+            row = dict((k.lower(), v) for k, v in row.items())
+
+            values = {}
+            for i, (name, func, _) in enumerate(metrics):
+                value = row["aggregate_%d" % i]
+                if func.lower() == "count" and value is not None:
+                    value = int(value)
+
+                values[name] = value
+
+            if not group_by:
+                return values
+
+            key = tuple(row["group_%d" % i] for i in range(len(group_by)))
+            results[key if len(key) > 1 else key[0]] = values
+
+        return results
+
+    def _clone(self):
+        """
+        Get a shallow copy of the query, with its own bindings
+
+        :rtype: QueryBuilder
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._bindings = OrderedDict(
+            (type, list(values)) for type, values in self._bindings.items()
+        )
+
+        return new
 
     def insert(self, _values=None, **values):
         """
@@ -1414,10 +1989,13 @@ class QueryBuilder(object):
 
         values = OrderedDict(sorted(values.items()))
 
-        bindings = list(values.values()) + self.get_bindings()
-
         sql = self._grammar.compile_update(self, values)
 
+        # The bindings of the common table expressions precede the values
+        bindings = self.get_bindings()
+        expressions = len(self._bindings["expressions"])
+        bindings[expressions:expressions] = list(values.values())
+
         return self._connection.update(sql, self._clean_bindings(bindings))
 
     def increment(self, column, amount=1, extras=None):
@@ -1547,8 +2125,24 @@ class QueryBuilder(object):
         return self._connection.raw(value)
 
     def get_bindings(self):
+        values = self._bindings.values()
+
+        # The orders of a limit per group are compiled in the select clause
+        if self.limit_per_group_ is not None:
+            values = [
+                self._bindings[type]
+                for type in [
+                    "expressions",
+                    "select",
+                    "order",
+                    "join",
+                    "where",
+                    "having",
+                ]
+            ]
+
         bindings = []
-        for value in chain(*self._bindings.values()):
+        for value in chain(*values):
             if isinstance(value, datetime.date):
                 value = value.strftime(self._grammar.get_date_format())
 
@@ -1594,6 +2188,7 @@ class QueryBuilder(object):
         :param query: The query to merge with
         :type query: QueryBuilder
         """
+        self.expressions += query.expressions
         self.columns += query.columns
         self.joins += query.joins
         self.wheres += query.wheres
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+
+import array
+
+from collections import OrderedDict
+
+from ..utils import long, PY2
+
+
+class ColumnsBuilder(object):
+    """
+    Builds columnar arrays from chunks of rows.
+
+    The columns are NumPy arrays when NumPy is installed,
+    and ``array.array`` otherwise, or lists for the values
+    which can't be stored in typed arrays, like strings.
+    """
+
+    # The typecodes of the array module by inferred type
+    TYPECODES = {"bool": "b", "int": "l" if PY2 else "q", "float": "d"}
+
+    # The NumPy dtypes by inferred type
+    DTYPES = {"bool": "bool", "int": "int64", "float": "float64", "object": "object"}
+
+    def __init__(self, dtype_map=None, numpy=None):
+        """
+        :param dtype_map: The typecodes or NumPy dtypes of the columns,
+                          inferred from the values if not given
+        :type dtype_map: dict
+
+        :param numpy: The NumPy module to use, None to detect it
+                      and False to build ``array.array`` columns
+        """
+        if numpy is None:
+            try:
+                import numpy
+            except ImportError:
+                numpy = False
+
+        self._dtype_map = dtype_map or {}
+        self._numpy = numpy
+
+    def build(self, columns, chunks, count=None):
+        """
+        Build the columns.
+
+        :param columns: The names of the columns
+        :type columns: list
+
+        :param chunks: The chunks of rows, as tuples
+        :type chunks: iterable
+
+        :param count: The number of rows, if known beforehand,
+                      to preallocate the NumPy arrays
+        :type count: int
+
+        :rtype: OrderedDict
+        """
+        buffers = [None] * len(columns)
+        size = 0
+
+        for chunk in chunks:
+            # Transposing the chunk is done in C, without a per row object
+            values = list(zip(*chunk))
+
+            for i, column in enumerate(columns):
+                if buffers[i] is None:
+                    buffers[i] = self._create_buffer(column, values[i], count)
+
+                buffers[i] = buffers[i].extend(values[i], size)
+
+            size += len(chunk)
+
+        result = OrderedDict()
+        for i, column in enumerate(columns):
+            if buffers[i] is None:
+                buffers[i] = self._create_buffer(column, (), 0)
+
+            result[column] = buffers[i].finish(size)
+
+        return result
+
+    def _create_buffer(self, column, values, count):
+        dtype = self._dtype_map.get(column)
+        explicit = dtype is not None
+
+        if dtype is None:
+            dtype = self.infer_type(values)
+
+        if self._numpy:
+            if not explicit:
+                dtype = self.DTYPES[dtype]
+
+            return NumpyBuffer(self._numpy, dtype, explicit, count)
+
+        if not explicit:
+            dtype = self.TYPECODES.get(dtype)
+
+        return ArrayBuffer(dtype, explicit)
+
+    @classmethod
+    def infer_type(cls, values):
+        """
+        Infer the type of a column from some of its values.
+
+        Integers with missing values are stored as floats.
+
+        :rtype: str
+        """
+        types = set()
+        has_none = False
+
+        for value in values:
+            if value is None:
+                has_none = True
+            elif isinstance(value, bool):
+                types.add("bool")
+            elif isinstance(value, (int, long)):
+                types.add("int")
+            elif isinstance(value, float):
+                types.add("float")
+            else:
+                return "object"
+
+        if types == {"bool"} and not has_none:
+            return "bool"
+
+        if types == {"int"} and not has_none:
+            return "int"
+
+        if types and types <= {"int", "float"}:
+            return "float"
+
+        return "object"
+
+    @classmethod
+    def is_numeric(cls, values):
+        """
+        Determine if values, missing or not, can be stored as floats.
+
+        :rtype: bool
+        """
+        for value in values:
+            if value is None:
+                continue
+
+            if isinstance(value, bool) or not isinstance(value, (int, long, float)):
+                return False
+
+        return True
+
+
+class ArrayBuffer(object):
+    """
+    A column stored in an ``array.array``, or a list
+    for the values which can't be stored in a typed array.
+    """
+
+    def __init__(self, typecode, explicit=False):
+        self._explicit = explicit
+
+        if typecode is None:
+            self._data = []
+        else:
+            self._data = array.array(typecode)
+
+    def extend(self, values, size):
+        data = self._data
+
+        if isinstance(data, list):
+            data.extend(values)
+
+            return self
+
+        try:
+            # The values are converted beforehand
+            # so that a failure leaves the column untouched.
+            data.extend(array.array(data.typecode, self._fill(values)))
+        except (TypeError, OverflowError):
+            if self._explicit:
+                raise
+
+            return self._degrade(values)
+
+        return self
+
+    def _fill(self, values):
+        if self._data.typecode == "d":
+            return [float("nan") if v is None else v for v in values]
+
+        return values
+
+    def _degrade(self, values):
+        # The values do not fit the inferred type anymore,
+        # integers become floats and anything else a list.
+        if self._data.typecode != "d" and ColumnsBuilder.is_numeric(values):
+            buffer = ArrayBuffer("d")
+            buffer._data.fromlist([float(v) for v in self._data])
+        else:
+            buffer = ArrayBuffer(None)
+            buffer._data.extend(self._data.tolist())
+
+        return buffer.extend(values, len(self._data))
+
+    def finish(self, size):
+        return self._data
+
+
+class NumpyBuffer(object):
+    """
+    A column stored in a NumPy array, preallocated
+    and grown geometrically when the number of rows is not known.
+    """
+
+    def __init__(self, numpy, dtype, explicit=False, count=None):
+        self._numpy = numpy
+        self._explicit = explicit
+        self._data = numpy.empty(count or 1024, dtype=dtype)
+
+    def extend(self, values, size):
+        data = self._data
+        end = size + len(values)
+
+        if end > len(data):
+            data = self._data = self._numpy.resize(data, max(end, 2 * len(data)))
+
+        try:
+            data[size:end] = self._convert(values)
+        except (TypeError, ValueError, OverflowError):
+            if self._explicit:
+                raise
+
+            return self._degrade(values, size)
+
+        return self
+
+    def _fill(self, values):
+        if self._data.dtype.kind == "f":
+            return [float("nan") if v is None else v for v in values]
+
+        if self._data.dtype.kind in "iub" and None in values:
+            raise TypeError("Missing values can't be stored in integer arrays")
+
+        return values
+
+    def _convert(self, values):
+        """
+        Convert values to an array which can be stored in the column.
+
+        NumPy casts the assigned values unsafely, truncating floats
+        stored in integer arrays for instance, so the cast is checked
+        beforehand, like the ``array`` module does.
+        """
+        values = self._fill(values)
+        dtype = self._data.dtype
+
+        if dtype.kind == "O" or not len(values):
+            return values
+
+        chunk = self._numpy.asarray(values)
+
+        if chunk.dtype.kind == "O":
+            # Explicit types, like dates, may be built from objects
+            if self._explicit:
+                return values
+
+            raise TypeError("The values can't be stored in %s arrays" % dtype)
+
+        # An explicit type may narrow the values, not change their kind
+        casting = "same_kind" if self._explicit else "safe"
+        if not self._numpy.can_cast(chunk.dtype, dtype, casting):
+            raise TypeError(
+                "%s values can't be stored in %s arrays" % (chunk.dtype, dtype)
+            )
+
+        return chunk
+
+    def _degrade(self, values, size):
+        if self._data.dtype.kind in "iu" and ColumnsBuilder.is_numeric(values):
+            dtype = "float64"
+        else:
+            dtype = "object"
+
+        buffer = NumpyBuffer(self._numpy, dtype, count=len(self._data))
+        buffer._data[:size] = self._data[:size]
+
+        return buffer.extend(values, size)
+
+    def finish(self, size):
+        data = self._data[:size]
+
+        if len(self._data) != size:
+            # We release the unused memory
+            data = data.copy()
+
+        return data
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import datetime
+
+from ..exceptions import ArgumentError
+from ..utils import PY2, unicode, decode, lazy_import
+
+json = lazy_import("simplejson")
+
+
+def get_exporter(fp, format="csv", header=True):
+    """
+    Get the exporter writing rows to a file in a given format.
+
+    :param fp: The text file to write to
+    :type fp: file
+
+    :param format: The format of the file (csv or ndjson)
+    :type format: str
+
+    :param header: Whether to write the columns names first (csv only)
+    :type header: bool
+
+    :rtype: Exporter
+    """
+    if format == "csv":
+        return CsvExporter(fp, header)
+
+    if format == "ndjson":
+        return NdjsonExporter(fp)
+
+    raise ArgumentError("Invalid export format: %s" % format)
+
+
+class Exporter(object):
+    def __init__(self, fp):
+        self._fp = fp
+        self._columns = None
+
+    def set_columns(self, columns):
+        """
+        Set the columns of the rows to write.
+
+        :type columns: list
+        """
+        self._columns = list(columns)
+
+    def write(self, rows):
+        """
+        Write rows.
+
+        :param rows: The rows, as sequences of values ordered like the columns
+        :type rows: iterable
+
+        :return: The number of written rows
+        :rtype: int
+        """
+        raise NotImplementedError()
+
+
+class CsvExporter(Exporter):
+    def __init__(self, fp, header=True):
+        super(CsvExporter, self).__init__(fp)
+
+        self._writer = csv.writer(fp)
+        self._header = header
+
+    def set_columns(self, columns):
+        super(CsvExporter, self).set_columns(columns)
+
+        if self._header:
+            self._writer.writerow(self._encode(self._columns))
+
+    def write(self, rows):
+        count = 0
+        writerow = self._writer.writerow
+
+        if PY2:
+            for row in rows:
+                writerow(self._encode(_dump_json(row)))
+                count += 1
+        else:
+            for row in rows:
+                writerow(_dump_json(row))
+                count += 1
+
+        return count
+
+    def _encode(self, row):
+        # The csv module of Python 2 only handles bytes
+        if not PY2:
+            return row
+
+        return [
+            value.encode("utf-8") if isinstance(value, unicode) else value
+            for value in row
+        ]
+
+
+class NdjsonExporter(Exporter):
+    def write(self, rows):
+        count = 0
+        columns = self._columns
+        write = self._fp.write
+
+        for row in rows:
+            write(json.dumps(dict(zip(columns, row)), default=_default))
+            write("\n")
+            count += 1
+
+        return count
+
+
+def _dump_json(row):
+    # The JSON and array columns are written like in NDJSON files
+    for value in row:
+        if isinstance(value, (dict, list)):
+            return [
+                json.dumps(v, default=_default) if isinstance(v, (dict, list)) else v
+                for v in row
+            ]
+
+    return row
+
+
+def _default(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, (bytes, bytearray)):
+        return decode(bytes(value))
+
+    if hasattr(value, "serialize"):
+        return value.serialize()
+
+    return str(value)
@@ -9,6 +9,7 @@ from ...utils import basestring
 class QueryGrammar(Grammar):
 
     _select_components = [
+        "expressions",
         "aggregate_",
         "columns",
         "from__",
@@ -27,8 +28,76 @@ class QueryGrammar(Grammar):
         if not query.columns:
             query.columns = ["*"]
 
+        if query.limit_per_group_ is not None:
+            return self._compile_limit_per_group(query)
+
         return self._concatenate(self._compile_components(query)).strip()
 
+    def compile_over(self, query, partition_by=None, orders=None):
+        """
+        Compile the window of a window function
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param partition_by: The columns dividing the rows into partitions
+        :type partition_by: list
+
+        :param orders: The orders of the rows of each partition
+        :type orders: list
+
+        :return: The compiled window
+        :rtype: str
+        """
+        window = []
+
+        if partition_by:
+            window.append("PARTITION BY %s" % self.columnize(partition_by))
+
+        if orders:
+            window.append(self._compile_orders(query, orders))
+
+        return "OVER (%s)" % " ".join(window)
+
+    def _compile_limit_per_group(self, query):
+        sql = self._compile_components(query)
+        column = self.wrap(query.limit_per_group_["column"])
+
+        # The rows of each group are numbered in the order of the query
+        # and the ones outside of the limit and offset are filtered out
+        # by an outer query.
+        sql["columns"] = "SELECT %s, ROW_NUMBER() %s AS %s" % (
+            self.columnize(query.columns),
+            self.compile_over(query, query.limit_per_group_["columns"], query.orders),
+            column,
+        )
+
+        aggregate = sql.pop("aggregate_", None)
+        for component in ["expressions", "orders", "limit_", "offset_", "lock_"]:
+            sql.pop(component, None)
+
+        conditions = []
+        offset = int(query.offset_ or 0)
+
+        if offset:
+            conditions.append("%s > %d" % (column, offset))
+
+        if query.limit_ is not None:
+            conditions.append("%s <= %d" % (column, offset + int(query.limit_)))
+
+        outer = [
+            aggregate or "SELECT *",
+            "FROM (%s) AS %s" % (self._concatenate(sql), self.wrap("orator_rows")),
+        ]
+
+        if conditions:
+            outer.append("WHERE %s" % " AND ".join(conditions))
+
+        if not aggregate:
+            outer.append("ORDER BY %s" % column)
+
+        return self._prepend_expressions(query, " ".join(outer))
+
     def _compile_components(self, query):
         sql = {}
 
@@ -44,13 +113,81 @@ class QueryGrammar(Grammar):
 
         return sql
 
-    def _compile_aggregate(self, query, aggregate):
-        column = self.columnize(aggregate["columns"])
+    def compile_explain(self, query, analyze=False, format="json"):
+        """
+        Compile an explain statement for a select query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param analyze: Whether to actually execute the query
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        if analyze:
+            return "EXPLAIN ANALYZE %s" % self.compile_select(query)
+
+        return "EXPLAIN %s" % self.compile_select(query)
+
+    def _compile_expressions(self, query, expressions):
+        if not expressions:
+            return ""
+
+        compiled = []
+        for expression in expressions:
+            name = self.wrap_table(expression["name"])
+
+            if expression["columns"]:
+                name = "%s (%s)" % (name, self.columnize(expression["columns"]))
+
+            compiled.append("%s AS (%s)" % (name, expression["query"]))
+
+        # The RECURSIVE keyword applies to the whole clause
+        if any(expression["recursive"] for expression in expressions):
+            return "WITH RECURSIVE %s" % ", ".join(compiled)
+
+        return "WITH %s" % ", ".join(compiled)
+
+    def _prepend_expressions(self, query, sql):
+        expressions = self._compile_expressions(query, query.expressions)
+
+        if expressions:
+            return "%s %s" % (expressions, sql)
+
+        return sql
+
+    def compile_aggregate_function(self, query, function, columns):
+        """
+        Compile an aggregate function call
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param function: The aggregate function
+        :type function: str
+
+        :param columns: The columns to execute the function for
+        :type columns: list
+
+        :return: The compiled function call
+        :rtype: str
+        """
+        column = self.columnize(columns)
 
         if query.distinct_ and column != "*":
             column = "DISTINCT %s" % column
 
-        return "SELECT %s(%s) AS aggregate" % (aggregate["function"].upper(), column)
+        return "%s(%s)" % (function.upper(), column)
+
+    def _compile_aggregate(self, query, aggregate):
+        return "SELECT %s AS aggregate" % self.compile_aggregate_function(
+            query, aggregate["function"], aggregate["columns"]
+        )
 
     def _compile_columns(self, query, columns):
         # If the query is actually performing an aggregating select, we will let that
@@ -88,12 +225,16 @@ class QueryGrammar(Grammar):
             for binding in join.bindings:
                 query.add_binding(binding, "join")
 
-            # Once we have constructed the clauses, we'll need to take the boolean connector
-            # off of the first clause as it obviously will not be required on that clause
-            # because it leads the rest of the clauses, thus not requiring any boolean.
-            clauses[0] = self._remove_leading_boolean(clauses[0])
+            if clauses:
+                # Once we have constructed the clauses, we'll need to take the boolean connector
+                # off of the first clause as it obviously will not be required on that clause
+                # because it leads the rest of the clauses, thus not requiring any boolean.
+                clauses[0] = self._remove_leading_boolean(clauses[0])
 
-            clauses = " ".join(clauses)
+                clauses = " ".join(clauses)
+            else:
+                # Lateral joins are constrained by the subquery itself
+                clauses = "TRUE"
 
             type = join.type
 
@@ -326,6 +467,24 @@ class QueryGrammar(Grammar):
 
         return "%s%s" % (joiner, union["query"].to_sql())
 
+    def compile_table_rows_estimate(self, query):
+        """
+        Compile a query getting the estimated number of rows of a table
+        from the statistics of the database, bound to the table name
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :return: The compiled query, None if there are no statistics
+        :rtype: str or None
+        """
+        return
+
+    def compile_copy_to(self, query, format="csv", header=False):
+        raise NotImplementedError(
+            "COPY is not supported by %s" % self.__class__.__name__
+        )
+
     def compile_insert(self, query, values):
         """
         Compile an insert SQL statement
@@ -389,7 +548,9 @@ class QueryGrammar(Grammar):
         # intended records are updated by the SQL statements we generate to run.
         where = self._compile_wheres(query)
 
-        return ("UPDATE %s%s SET %s %s" % (table, joins, columns, where)).strip()
+        sql = ("UPDATE %s%s SET %s %s" % (table, joins, columns, where)).strip()
+
+        return self._prepend_expressions(query, sql)
 
     def compile_delete(self, query):
         table = self.wrap_table(query.from__)
@@ -399,11 +560,25 @@ class QueryGrammar(Grammar):
         else:
             where = ""
 
-        return ("DELETE FROM %s %s" % (table, where)).strip()
+        sql = ("DELETE FROM %s %s" % (table, where)).strip()
+
+        return self._prepend_expressions(query, sql)
 
     def compile_truncate(self, query):
         return {"TRUNCATE %s" % self.wrap_table(query.from__): []}
 
+    def supports_savepoints(self):
+        return True
+
+    def compile_savepoint(self, name):
+        return "SAVEPOINT %s" % name
+
+    def compile_savepoint_release(self, name):
+        return "RELEASE SAVEPOINT %s" % name
+
+    def compile_savepoint_rollback(self, name):
+        return "ROLLBACK TO SAVEPOINT %s" % name
+
     def _compile_lock(self, query, value):
         if isinstance(value, basestring):
             return value
@@ -7,6 +7,7 @@ from ...utils import basestring
 class MySQLQueryGrammar(QueryGrammar):
 
     _select_components = [
+        "expressions",
         "aggregate_",
         "columns",
         "from__",
@@ -35,10 +36,114 @@ class MySQLQueryGrammar(QueryGrammar):
         sql = super(MySQLQueryGrammar, self).compile_select(query)
 
         if query.unions:
+            # The common table expressions apply to the whole union
+            expressions = self._compile_expressions(query, query.expressions)
+            if expressions:
+                sql = sql[len(expressions) + 1 :]
+
             sql = "(%s) %s" % (sql, self._compile_unions(query))
 
+            if expressions:
+                sql = "%s %s" % (expressions, sql)
+
         return sql
 
+    def compile_explain(self, query, analyze=False, format="json"):
+        """
+        Compile an explain statement for a select query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param analyze: Whether to actually execute the query
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        sql = self.compile_select(query)
+
+        # EXPLAIN ANALYZE (MySQL 8.0.18+) only supports the tree format
+        if analyze:
+            return "EXPLAIN ANALYZE %s" % sql
+
+        if format == "json":
+            return "EXPLAIN FORMAT=JSON %s" % sql
+
+        return "EXPLAIN %s" % sql
+
+    def compile_table_rows_estimate(self, query):
+        """
+        Compile a query getting the estimated number of rows of a table
+        from the statistics of the database, bound to the table name
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :return: The compiled query
+        :rtype: str
+        """
+        return (
+            "SELECT table_rows AS estimate FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s" % self.get_marker()
+        )
+
+    def compile_load_data(self, table, columns, replace=False, charset="utf8"):
+        """
+        Compile a LOAD DATA LOCAL INFILE statement
+
+        The path of the file is bound to the statement.
+
+        :param table: The table to load
+        :type table: str
+
+        :param columns: The columns of the rows
+        :type columns: list
+
+        :param replace: Whether to replace the existing rows with the same keys
+        :type replace: bool
+
+        :param charset: The character set of the file
+        :type charset: str
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        return "LOAD DATA LOCAL INFILE %s %s INTO TABLE %s CHARACTER SET %s (%s)" % (
+            self.get_marker(),
+            "REPLACE" if replace else "IGNORE",
+            self.wrap_table(table),
+            charset,
+            self.columnize(columns),
+        )
+
+    def compile_bulk_insert(self, query, values, replace=False):
+        """
+        Compile an insert statement ignoring or replacing
+        the rows conflicting with existing ones, like LOAD DATA does
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param values: The values to insert
+        :type values: list
+
+        :param replace: Whether to replace the existing rows with the same keys
+        :type replace: bool
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        sql = self.compile_insert(query, values)
+
+        if replace:
+            return "REPLACE%s" % sql[6:]
+
+        return "INSERT IGNORE%s" % sql[6:]
+
     def _compile_union(self, union):
         """
         Compile a single union statement
@@ -124,7 +229,7 @@ class MySQLQueryGrammar(QueryGrammar):
         else:
             sql = "DELETE FROM %s %s" % (table, wheres)
 
-        sql = sql.strip()
+        sql = self._prepend_expressions(query, sql.strip())
 
         if query.orders:
             sql += " %s" % self._compile_orders(query, query.orders)
@@ -27,6 +27,96 @@ class PostgresQueryGrammar(QueryGrammar):
 
     marker = "%s"
 
+    def compile_explain(self, query, analyze=False, format="json"):
+        """
+        Compile an explain statement for a select query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param analyze: Whether to actually execute the query
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        options = []
+
+        if analyze:
+            options.append("ANALYZE")
+
+        options.append("FORMAT %s" % format.upper())
+
+        return "EXPLAIN (%s) %s" % (", ".join(options), self.compile_select(query))
+
+    def compile_table_rows_estimate(self, query):
+        """
+        Compile a query getting the estimated number of rows of a table
+        from the statistics of the database, bound to the table name
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :return: The compiled query
+        :rtype: str
+        """
+        # The estimate is -1, or 0 before PostgreSQL 14, until the table is analyzed
+        return (
+            "SELECT CASE WHEN c.reltuples > 0 THEN c.reltuples::bigint END AS estimate "
+            "FROM pg_class c WHERE c.oid = to_regclass(%s)" % self.get_marker()
+        )
+
+    def compile_copy_from(self, table, columns, format="csv"):
+        """
+        Compile a COPY statement loading rows from the standard input
+
+        :param table: The table to load
+        :type table: str
+
+        :param columns: The columns of the rows
+        :type columns: list
+
+        :param format: The format of the data
+        :type format: str
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        return "COPY %s (%s) FROM STDIN WITH (FORMAT %s)" % (
+            self.wrap_table(table),
+            self.columnize(columns),
+            format,
+        )
+
+    def compile_copy_to(self, query, format="csv", header=False):
+        """
+        Compile a COPY statement writing the results of a query to the standard output
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param format: The format of the data
+        :type format: str
+
+        :param header: Whether to write the columns names first
+        :type header: bool
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        options = ["FORMAT %s" % format]
+
+        if header:
+            options.append("HEADER")
+
+        return "COPY (%s) TO STDOUT WITH (%s)" % (
+            self.compile_select(query),
+            ", ".join(options),
+        )
+
     def _compile_lock(self, query, value):
         """
         Compile the lock into SQL
@@ -69,7 +159,9 @@ class PostgresQueryGrammar(QueryGrammar):
 
         where = self._compile_update_wheres(query)
 
-        return ("UPDATE %s SET %s%s %s" % (table, columns, from_, where)).strip()
+        sql = ("UPDATE %s SET %s%s %s" % (table, columns, from_, where)).strip()
+
+        return self._prepend_expressions(query, sql)
 
     def _compile_update_columns(self, values):
         """
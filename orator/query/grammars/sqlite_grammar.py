@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from .grammar import QueryGrammar
+from ...exceptions import ArgumentError
 
 
 class SQLiteQueryGrammar(QueryGrammar):
@@ -23,6 +24,27 @@ class SQLiteQueryGrammar(QueryGrammar):
         ">>",
     ]
 
+    def compile_explain(self, query, analyze=False, format="json"):
+        """
+        Compile an explain statement for a select query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param analyze: Whether to actually execute the query
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        if analyze:
+            raise ArgumentError("SQLite does not support analyzing queries")
+
+        return "EXPLAIN QUERY PLAN %s" % self.compile_select(query)
+
     def compile_insert(self, query, values):
         """
         Compile insert statement into SQL
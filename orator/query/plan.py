@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+
+class QueryPlanNode(object):
+    """
+    A single step of a query execution plan.
+    """
+
+    def __init__(
+        self,
+        operation,
+        table=None,
+        index=None,
+        rows=None,
+        actual_rows=None,
+        cost=None,
+        sequential_scan=False,
+    ):
+        """
+        :param operation: The operation as reported by the database
+        :type operation: str
+
+        :param table: The table accessed by the operation
+        :type table: str or None
+
+        :param index: The index used by the operation
+        :type index: str or None
+
+        :param rows: The estimated number of rows
+        :type rows: int or None
+
+        :param actual_rows: The actual number of rows (when analyzed)
+        :type actual_rows: int or None
+
+        :param cost: The estimated cost
+        :type cost: float or None
+
+        :param sequential_scan: Whether the operation is a full table scan
+        :type sequential_scan: bool
+        """
+        self.operation = operation
+        self.table = table
+        self.index = index
+        self.rows = rows
+        self.actual_rows = actual_rows
+        self.cost = cost
+        self.sequential_scan = sequential_scan
+
+    def serialize(self):
+        return {
+            "operation": self.operation,
+            "table": self.table,
+            "index": self.index,
+            "rows": self.rows,
+            "actual_rows": self.actual_rows,
+            "cost": self.cost,
+            "sequential_scan": self.sequential_scan,
+        }
+
+    def __repr__(self):
+        return "<QueryPlanNode %s>" % self.serialize()
+
+
+class QueryPlan(object):
+    """
+    A normalized query execution plan.
+    """
+
+    def __init__(self, nodes, raw=None):
+        """
+        :param nodes: The plan nodes, in the order reported by the database
+        :type nodes: list of QueryPlanNode
+
+        :param raw: The raw plan as returned by the database
+        :type raw: mixed
+        """
+        self.nodes = nodes
+        self.raw = raw
+
+    @property
+    def estimated_rows(self):
+        """
+        The number of rows the database expects the query to return.
+
+        :rtype: int or None
+        """
+        for node in self.nodes:
+            if node.rows is not None:
+                return node.rows
+
+    @property
+    def sequential_scans(self):
+        """
+        The tables that are read with a full table scan.
+
+        :rtype: list
+        """
+        return self._unique(
+            node.table for node in self.nodes if node.sequential_scan and node.table
+        )
+
+    @property
+    def indexes(self):
+        """
+        The indexes used by the query.
+
+        :rtype: list
+        """
+        return self._unique(node.index for node in self.nodes if node.index)
+
+    @property
+    def tables_without_index(self):
+        """
+        The tables that are accessed without using any index.
+
+        :rtype: list
+        """
+        indexed = set(node.table for node in self.nodes if node.index)
+
+        return [table for table in self.sequential_scans if table not in indexed]
+
+    def has_sequential_scan(self, table=None):
+        """
+        Determine if the plan contains a full table scan.
+
+        :param table: Restrict the check to the given table
+        :type table: str
+
+        :rtype: bool
+        """
+        if table is None:
+            return len(self.sequential_scans) > 0
+
+        return table in self.sequential_scans
+
+    def uses_index(self, index=None, table=None):
+        """
+        Determine if the plan uses an index.
+
+        :param index: The name of the expected index
+        :type index: str
+
+        :param table: Restrict the check to the given table
+        :type table: str
+
+        :rtype: bool
+        """
+        for node in self.nodes:
+            if not node.index:
+                continue
+
+            if index is not None and node.index != index:
+                continue
+
+            if table is not None and node.table != table:
+                continue
+
+            return True
+
+        return False
+
+    def serialize(self):
+        return {
+            "nodes": [node.serialize() for node in self.nodes],
+            "estimated_rows": self.estimated_rows,
+            "sequential_scans": self.sequential_scans,
+            "indexes": self.indexes,
+            "tables_without_index": self.tables_without_index,
+        }
+
+    def _unique(self, values):
+        seen = []
+        for value in values:
+            if value not in seen:
+                seen.append(value)
+
+        return seen
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __repr__(self):
+        return "<QueryPlan %s>" % self.serialize()
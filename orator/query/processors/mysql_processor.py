@@ -1,9 +1,25 @@
 # -*- coding: utf-8 -*-
 
+import re
+
 from .processor import QueryProcessor
+from ..plan import QueryPlan, QueryPlanNode
+from ...utils import basestring, lazy_import
+
+json = lazy_import("simplejson")
 
 
 class MySQLQueryProcessor(QueryProcessor):
+
+    _plan_line = re.compile(
+        r"^\s*-> (?P<operation>[^:(]+?)"
+        r"(?: on (?P<table>[^\s(]+))?"
+        r"(?: using (?P<index>[^\s(]+))?"
+        r"(?:: .*?| over .*?| \(.*?)?"
+        r"  \(cost=(?P<cost>[\d.e+-]+) rows=(?P<rows>[\d.e+-]+)\)"
+        r"(?: \(actual time=\S+ rows=(?P<actual_rows>[\d.e+-]+) loops=\d+\))?"
+    )
+
     def process_insert_get_id(self, query, sql, values, sequence=None):
         """
         Process an "insert get ID" query.
@@ -60,3 +76,108 @@ class MySQLQueryProcessor(QueryProcessor):
         :return: list
         """
         return list(map(lambda x: x["column_name"], results))
+
+    def process_explain(self, query, results, analyze=False, format="json"):
+        """
+        Process the results of an explain query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param results: The query results
+        :type results: list
+
+        :param analyze: Whether the query has been analyzed
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The normalized plan
+        :rtype: QueryPlan
+        """
+        nodes = []
+
+        # Analyzed plans are only available in the tree format
+        if analyze:
+            plan = results[0]["EXPLAIN"]
+
+            for line in plan.splitlines():
+                match = self._plan_line.match(line)
+                if not match:
+                    continue
+
+                operation = match.group("operation")
+
+                nodes.append(
+                    QueryPlanNode(
+                        operation,
+                        table=match.group("table"),
+                        index=match.group("index"),
+                        rows=self._to_number(match.group("rows")),
+                        actual_rows=self._to_number(match.group("actual_rows")),
+                        cost=self._to_number(match.group("cost"), float),
+                        sequential_scan=operation == "Table scan",
+                    )
+                )
+
+            return QueryPlan(nodes, plan)
+
+        if format == "json":
+            plan = results[0]["EXPLAIN"]
+            if isinstance(plan, basestring):
+                plan = json.loads(plan)
+
+            self._collect_plan_nodes(plan, nodes)
+
+            return QueryPlan(nodes, plan)
+
+        for row in results:
+            nodes.append(
+                self._make_plan_node(row["type"], row["table"], row["key"], row["rows"])
+            )
+
+        return QueryPlan(nodes, results)
+
+    def _collect_plan_nodes(self, plan, nodes):
+        """
+        Extract the accessed tables of a JSON plan into a list of nodes.
+
+        :param plan: The JSON plan, or a part of it
+        :type plan: dict or list
+
+        :param nodes: The list of nodes to fill
+        :type nodes: list
+        """
+        if isinstance(plan, list):
+            for value in plan:
+                self._collect_plan_nodes(value, nodes)
+
+            return
+
+        if not isinstance(plan, dict):
+            return
+
+        for key, value in plan.items():
+            if key == "table" and isinstance(value, dict):
+                nodes.append(
+                    self._make_plan_node(
+                        value.get("access_type"),
+                        value.get("table_name"),
+                        value.get("key"),
+                        value.get("rows_examined_per_scan"),
+                        value.get("cost_info", {}).get("prefix_cost"),
+                    )
+                )
+
+            self._collect_plan_nodes(value, nodes)
+
+    def _make_plan_node(self, access_type, table, key, rows, cost=None):
+        return QueryPlanNode(
+            access_type,
+            table=table,
+            index=key,
+            rows=self._to_number(rows),
+            cost=self._to_number(cost, float),
+            sequential_scan=access_type == "ALL",
+        )
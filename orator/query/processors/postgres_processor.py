@@ -1,9 +1,24 @@
 # -*- coding: utf-8 -*-
 
+import re
+
 from .processor import QueryProcessor
+from ..plan import QueryPlan, QueryPlanNode
+from ...utils import basestring, lazy_import
+
+json = lazy_import("simplejson")
 
 
 class PostgresQueryProcessor(QueryProcessor):
+
+    _plan_line = re.compile(
+        r"^\s*(?:->\s+)?(?P<operation>[A-Z][\w ]*?)"
+        r"(?: using (?P<index>\S+))?"
+        r"(?: on (?P<table>\S+)(?: \S+)?)?"
+        r"  \(cost=[\d.]+\.\.(?P<cost>[\d.]+) rows=(?P<rows>\d+) width=\d+\)"
+        r"(?: \(actual time=[\d.]+\.\.[\d.]+ rows=(?P<actual_rows>\d+) loops=\d+\))?"
+    )
+
     def process_insert_get_id(self, query, sql, values, sequence=None):
         """
         Process an "insert get ID" query.
@@ -46,3 +61,90 @@ class PostgresQueryProcessor(QueryProcessor):
         :return: list
         """
         return list(map(lambda x: x["column_name"], results))
+
+    def process_explain(self, query, results, analyze=False, format="json"):
+        """
+        Process the results of an explain query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param results: The query results
+        :type results: list
+
+        :param analyze: Whether the query has been analyzed
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The normalized plan
+        :rtype: QueryPlan
+        """
+        nodes = []
+
+        if format == "json":
+            plan = results[0]["QUERY PLAN"]
+            if isinstance(plan, basestring):
+                plan = json.loads(plan)
+
+            for statement in plan:
+                self._collect_plan_nodes(statement["Plan"], nodes)
+
+            return QueryPlan(nodes, plan)
+
+        lines = [row["QUERY PLAN"] for row in results]
+
+        for line in lines:
+            match = self._plan_line.match(line)
+            if not match:
+                continue
+
+            operation = match.group("operation")
+            table = match.group("table")
+            index = match.group("index")
+
+            # Bitmap index scans are reported as "on <index>"
+            if operation.endswith("Bitmap Index Scan"):
+                table, index = None, table
+
+            nodes.append(
+                QueryPlanNode(
+                    operation,
+                    table=table,
+                    index=index,
+                    rows=self._to_number(match.group("rows")),
+                    actual_rows=self._to_number(match.group("actual_rows")),
+                    cost=self._to_number(match.group("cost"), float),
+                    sequential_scan=operation.endswith("Seq Scan"),
+                )
+            )
+
+        return QueryPlan(nodes, "\n".join(lines))
+
+    def _collect_plan_nodes(self, plan, nodes):
+        """
+        Flatten a JSON plan into a list of nodes.
+
+        :param plan: The JSON plan node
+        :type plan: dict
+
+        :param nodes: The list of nodes to fill
+        :type nodes: list
+        """
+        operation = plan["Node Type"]
+
+        nodes.append(
+            QueryPlanNode(
+                operation,
+                table=plan.get("Relation Name"),
+                index=plan.get("Index Name"),
+                rows=self._to_number(plan.get("Plan Rows")),
+                actual_rows=self._to_number(plan.get("Actual Rows")),
+                cost=self._to_number(plan.get("Total Cost"), float),
+                sequential_scan=operation.endswith("Seq Scan"),
+            )
+        )
+
+        for child in plan.get("Plans", []):
+            self._collect_plan_nodes(child, nodes)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from ..plan import QueryPlan
+
 
 class QueryProcessor(object):
     def process_select(self, query, results):
@@ -59,3 +61,38 @@ class QueryProcessor(object):
         :return: dict
         """
         return results
+
+    def process_explain(self, query, results, analyze=False, format="json"):
+        """
+        Process the results of an explain query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param results: The query results
+        :type results: list
+
+        :param analyze: Whether the query has been analyzed
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The normalized plan
+        :rtype: QueryPlan
+        """
+        return QueryPlan([], results)
+
+    def _to_number(self, value, type=int):
+        """
+        Convert a value reported in a plan into a number.
+
+        :rtype: int or float or None
+        """
+        if value is None:
+            return
+
+        try:
+            return type(float(value))
+        except (TypeError, ValueError):
+            return
@@ -1,9 +1,19 @@
 # -*- coding: utf-8 -*-
 
+import re
+
 from .processor import QueryProcessor
+from ..plan import QueryPlan, QueryPlanNode
 
 
 class SQLiteQueryProcessor(QueryProcessor):
+
+    _plan_detail = re.compile(
+        r"^(?P<operation>SCAN|SEARCH)(?: TABLE)? (?P<table>\S+)(?: AS \S+)?"
+        r"(?: USING (?:COVERING )?INDEX (?P<index>\S+)"
+        r"| USING (?P<primary>(?:INTEGER )?PRIMARY KEY))?"
+    )
+
     def process_column_listing(self, results):
         """
         Process the results of a column listing query
@@ -15,3 +25,48 @@ class SQLiteQueryProcessor(QueryProcessor):
         :return: list
         """
         return list(map(lambda x: x["name"], results))
+
+    def process_explain(self, query, results, analyze=False, format="json"):
+        """
+        Process the results of an explain query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param results: The query results
+        :type results: list
+
+        :param analyze: Whether the query has been analyzed
+        :type analyze: bool
+
+        :param format: The plan format (json or text)
+        :type format: str
+
+        :return: The normalized plan
+        :rtype: QueryPlan
+        """
+        nodes = []
+
+        for row in results:
+            detail = row["detail"]
+            match = self._plan_detail.match(detail)
+            table = match.group("table") if match else None
+
+            # Subqueries and constant rows are reported as scans as well
+            # but do not actually read from a table.
+            if not table or table in ("SUBQUERY", "CONSTANT") or table[0] == "(":
+                nodes.append(QueryPlanNode(detail))
+                continue
+
+            index = match.group("index") or match.group("primary")
+
+            nodes.append(
+                QueryPlanNode(
+                    detail,
+                    table=table,
+                    index=index,
+                    sequential_scan=match.group("operation") == "SCAN" and not index,
+                )
+            )
+
+        return QueryPlan(nodes, [row["detail"] for row in results])
@@ -27,6 +27,17 @@ class Blueprint(object):
         :type grammar: orator.query.grammars.QueryGrammar
         """
         for statement in self.to_sql(connection, grammar):
+            if (
+                grammar.has_non_transactional_statements
+                and connection.transaction_level() > 0
+                and not grammar.is_transactional(statement)
+            ):
+                raise RuntimeError(
+                    "%s can't be run inside a transaction, "
+                    "the migrations executing it must set transactional = False"
+                    % statement
+                )
+
             connection.statement(statement)
 
     def to_sql(self, connection, grammar):
@@ -162,27 +173,33 @@ class Blueprint(object):
         """
         return self._drop_index_command("drop_primary", "primary", index)
 
-    def drop_unique(self, index):
+    def drop_unique(self, index, **options):
         """
         Indicate that the given unique key should be dropped.
 
         :param index: The index
         :type index: str
 
+        :param options: The online options of the command
+                        (concurrently, algorithm or lock)
+
         :rtype: Fluent
         """
-        return self._drop_index_command("drop_unique", "unique", index)
+        return self._drop_index_command("drop_unique", "unique", index, **options)
 
-    def drop_index(self, index):
+    def drop_index(self, index, **options):
         """
         Indicate that the given index should be dropped.
 
         :param index: The index
         :type index: str
 
+        :param options: The online options of the command
+                        (concurrently, algorithm or lock)
+
         :rtype: Fluent
         """
-        return self._drop_index_command("drop_index", "index", index)
+        return self._drop_index_command("drop_index", "index", index, **options)
 
     def drop_foreign(self, index):
         """
@@ -195,6 +212,18 @@ class Blueprint(object):
         """
         return self._drop_index_command("drop_foreign", "foreign", index)
 
+    def validate_foreign(self, index):
+        """
+        Indicate that the given foreign key, added as not valid,
+        should be validated against the existing rows.
+
+        :param index: The index
+        :type index: str
+
+        :rtype: Fluent
+        """
+        return self._drop_index_command("validate_foreign", "foreign", index)
+
     def drop_timestamps(self):
         """
         Indicate that the timestamp columns should be dropped.
@@ -222,7 +251,7 @@ class Blueprint(object):
         """
         return self._add_command("rename", to=to)
 
-    def primary(self, columns, name=None):
+    def primary(self, columns, name=None, **options):
         """
         Specify the primary key(s) for the table
 
@@ -232,11 +261,13 @@ class Blueprint(object):
         :param name: The name of the primary key
         :type name: str
 
+        :param options: The online options of the command (algorithm or lock)
+
         :rtype: Fluent
         """
-        return self._index_command("primary", columns, name)
+        return self._index_command("primary", columns, name, **options)
 
-    def unique(self, columns, name=None):
+    def unique(self, columns, name=None, **options):
         """
         Specify a unique index on the table
 
@@ -246,11 +277,14 @@ class Blueprint(object):
         :param name: The name of the primary key
         :type name: str
 
+        :param options: The online options of the command
+                        (concurrently, algorithm or lock)
+
         :rtype: Fluent
         """
-        return self._index_command("unique", columns, name)
+        return self._index_command("unique", columns, name, **options)
 
-    def index(self, columns, name=None):
+    def index(self, columns, name=None, **options):
         """
         Specify an index on the table
 
@@ -260,9 +294,12 @@ class Blueprint(object):
         :param name: The name of the primary key
         :type name: str
 
+        :param options: The online options of the command
+                        (concurrently, algorithm or lock)
+
         :rtype: Fluent
         """
-        return self._index_command("index", columns, name)
+        return self._index_command("index", columns, name, **options)
 
     def foreign(self, columns, name=None):
         """
@@ -643,7 +680,7 @@ class Blueprint(object):
         self.string("%s_type" % name)
         self.index(["%s_id" % name, "%s_type" % name], index_name)
 
-    def _drop_index_command(self, command, type, index):
+    def _drop_index_command(self, command, type, index, **options):
         """
         Create a new drop index command on the blueprint.
 
@@ -656,6 +693,9 @@ class Blueprint(object):
         :param index: The index name
         :type index: str
 
+        :param options: The options of the command
+        :type options: dict
+
         :rtype: Fluent
         """
         columns = []
@@ -665,9 +705,9 @@ class Blueprint(object):
 
             index = self._create_index_name(type, columns)
 
-        return self._index_command(command, columns, index)
+        return self._index_command(command, columns, index, **options)
 
-    def _index_command(self, type, columns, index):
+    def _index_command(self, type, columns, index, **options):
         """
         Add a new index command to the blueprint.
 
@@ -680,6 +720,9 @@ class Blueprint(object):
         :param index: The index name
         :type index: str
 
+        :param options: The options of the command
+        :type options: dict
+
         :rtype: Fluent
         """
         if not isinstance(columns, list):
@@ -688,7 +731,7 @@ class Blueprint(object):
         if not index:
             index = self._create_index_name(type, columns)
 
-        return self._add_command(type, index=index, columns=columns)
+        return self._add_command(type, index=index, columns=columns, **options)
 
     def _create_index_name(self, type, columns):
         if not isinstance(columns, list):
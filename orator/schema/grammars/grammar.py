@@ -10,11 +10,26 @@ from ..blueprint import Blueprint
 
 
 class SchemaGrammar(Grammar):
+
+    # Whether some statements can't be executed inside a transaction
+    has_non_transactional_statements = False
+
     def __init__(self, connection):
         super(SchemaGrammar, self).__init__(marker=connection.get_marker())
 
         self._connection = connection
 
+    def is_transactional(self, sql):
+        """
+        Determine whether a statement can be executed inside a transaction.
+
+        :param sql: The statement
+        :type sql: str
+
+        :rtype: bool
+        """
+        return True
+
     def compile_rename_column(self, blueprint, command, connection):
         """
         Compile a rename column command.
@@ -4,6 +4,7 @@ from .grammar import SchemaGrammar
 from ..blueprint import Blueprint
 from ...query.expression import QueryExpression
 from ...support.fluent import Fluent
+from ...exceptions import ArgumentError
 
 
 class MySQLSchemaGrammar(SchemaGrammar):
@@ -29,6 +30,10 @@ class MySQLSchemaGrammar(SchemaGrammar):
 
     marker = "%s"
 
+    _algorithms = ["DEFAULT", "INSTANT", "INPLACE", "COPY"]
+
+    _locks = ["DEFAULT", "NONE", "SHARED", "EXCLUSIVE"]
+
     def compile_table_exists(self):
         """
         Compile the query to determine if a table exists
@@ -111,7 +116,13 @@ class MySQLSchemaGrammar(SchemaGrammar):
 
         table = self.wrap_table(blueprint)
 
-        return "ALTER TABLE %s ADD %s %s(%s)" % (table, type, command.index, columns)
+        return "ALTER TABLE %s ADD %s %s(%s)%s" % (
+            table,
+            type,
+            command.index,
+            columns,
+            self._compile_online_options(command),
+        )
 
     def compile_drop(self, blueprint, command, _):
         return "DROP TABLE %s" % self.wrap_table(blueprint)
@@ -130,14 +141,55 @@ class MySQLSchemaGrammar(SchemaGrammar):
         return "ALTER TABLE %s DROP PRIMARY KEY" % self.wrap_table(blueprint)
 
     def compile_drop_unique(self, blueprint, command, _):
-        table = self.wrap_table(blueprint)
-
-        return "ALTER TABLE %s DROP INDEX %s" % (table, command.index)
+        return self.compile_drop_index(blueprint, command, _)
 
     def compile_drop_index(self, blueprint, command, _):
         table = self.wrap_table(blueprint)
 
-        return "ALTER TABLE %s DROP INDEX %s" % (table, command.index)
+        return "ALTER TABLE %s DROP INDEX %s%s" % (
+            table,
+            command.index,
+            self._compile_online_options(command),
+        )
+
+    def _compile_online_options(self, command):
+        """
+        Compile the ALGORITHM and LOCK clauses of an ALTER TABLE statement.
+
+        Building an index concurrently defaults to an in-place
+        operation which does not lock the table.
+
+        :param command: The command
+        :type command: Fluent
+
+        :rtype: str
+        """
+        algorithm = command.get("algorithm")
+        lock = command.get("lock")
+
+        if command.get("concurrently"):
+            algorithm = algorithm or "INPLACE"
+            lock = lock or "NONE"
+
+        sql = ""
+
+        if algorithm:
+            sql += ", ALGORITHM=%s" % self._get_online_option(
+                "algorithm", algorithm, self._algorithms
+            )
+
+        if lock:
+            sql += ", LOCK=%s" % self._get_online_option("lock", lock, self._locks)
+
+        return sql
+
+    def _get_online_option(self, name, value, choices):
+        value = value.upper()
+
+        if value not in choices:
+            raise ArgumentError("Invalid %s: %s" % (name, value))
+
+        return value
 
     def compile_drop_foreign(self, blueprint, command, _):
         table = self.wrap_table(blueprint)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import re
+
 from .grammar import SchemaGrammar
 from ..blueprint import Blueprint
 from ...query.expression import QueryExpression
@@ -20,6 +22,19 @@ class PostgresSchemaGrammar(SchemaGrammar):
 
     marker = "%s"
 
+    has_non_transactional_statements = True
+
+    _non_transactional = re.compile(
+        r"^\s*(CREATE\s+(UNIQUE\s+)?INDEX\s+CONCURRENTLY"
+        r"|DROP\s+INDEX\s+CONCURRENTLY"
+        r"|REINDEX\s+.*\bCONCURRENTLY"
+        r"|VACUUM|(CREATE|DROP)\s+DATABASE|ALTER\s+SYSTEM)\b",
+        re.IGNORECASE,
+    )
+
+    def is_transactional(self, sql):
+        return self._non_transactional.match(sql) is None
+
     def compile_rename_column(self, blueprint, command, connection):
         """
         Compile a rename column command.
@@ -95,6 +110,16 @@ class PostgresSchemaGrammar(SchemaGrammar):
 
         table = self.wrap_table(blueprint)
 
+        if command.get("concurrently"):
+            # The index is built without locking writes,
+            # and then attached to the constraint.
+            return [
+                "CREATE UNIQUE INDEX CONCURRENTLY %s ON %s (%s)"
+                % (command.index, table, columns),
+                "ALTER TABLE %s ADD CONSTRAINT %s UNIQUE USING INDEX %s"
+                % (table, command.index, command.index),
+            ]
+
         return "ALTER TABLE %s ADD CONSTRAINT %s UNIQUE (%s)" % (
             table,
             command.index,
@@ -106,7 +131,25 @@ class PostgresSchemaGrammar(SchemaGrammar):
 
         table = self.wrap_table(blueprint)
 
-        return "CREATE INDEX %s ON %s (%s)" % (command.index, table, columns)
+        return "CREATE INDEX %s%s ON %s (%s)" % (
+            self._concurrently(command),
+            command.index,
+            table,
+            columns,
+        )
+
+    def compile_foreign(self, blueprint, command, _):
+        sql = super(PostgresSchemaGrammar, self).compile_foreign(blueprint, command, _)
+
+        if command.get("not_valid"):
+            sql += " NOT VALID"
+
+        return sql
+
+    def compile_validate_foreign(self, blueprint, command, _):
+        table = self.wrap_table(blueprint)
+
+        return "ALTER TABLE %s VALIDATE CONSTRAINT %s" % (table, command.index)
 
     def compile_drop(self, blueprint, command, _):
         return "DROP TABLE %s" % self.wrap_table(blueprint)
@@ -135,7 +178,13 @@ class PostgresSchemaGrammar(SchemaGrammar):
         return "ALTER TABLE %s DROP CONSTRAINT %s" % (table, command.index)
 
     def compile_drop_index(self, blueprint, command, _):
-        return "DROP INDEX %s" % command.index
+        return "DROP INDEX %s%s" % (self._concurrently(command), command.index)
+
+    def _concurrently(self, command):
+        if command.get("concurrently"):
+            return "CONCURRENTLY "
+
+        return ""
 
     def compile_drop_foreign(self, blueprint, command, _):
         table = self.wrap_table(blueprint)
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
-import simplejson as json
 from wrapt import ObjectProxy
-from ..utils import value
+from ..utils import value, lazy_import
+
+json = lazy_import("simplejson")
 
 
 class Dynamic(ObjectProxy):
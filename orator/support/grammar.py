@@ -1,14 +1,21 @@
 # -*- coding: utf-8 -*-
 
 from ..query.expression import QueryExpression
+from ..utils import basestring
 
 
 class Grammar(object):
 
     marker = "?"
 
+    # Maximum number of entries kept in each identifier cache
+    # before it is flushed.
+    cache_size = 1024
+
     def __init__(self, marker=None):
         self._table_prefix = ""
+        self._wrap_cache = {}
+        self._columnize_cache = {}
 
         if marker:
             self.marker = marker
@@ -26,6 +33,22 @@ class Grammar(object):
         if self.is_expression(value):
             return self.get_value(value)
 
+        if not isinstance(value, basestring):
+            return self._wrap(value, prefix_alias)
+
+        # The same identifiers are wrapped over and over again,
+        # so we keep the result of the wrapping per grammar.
+        # The cache is flushed whenever the table prefix changes.
+        key = (value, prefix_alias)
+        wrapped = self._wrap_cache.get(key)
+        if wrapped is None:
+            wrapped = self._wrap(value, prefix_alias)
+
+            self._remember(self._wrap_cache, key, wrapped)
+
+        return wrapped
+
+    def _wrap(self, value, prefix_alias=False):
         # If the value being wrapped has a column alias we will need
         # to separate out the pieces so we can wrap each of the segments
         # of the expression on it own, and then joins them
@@ -60,7 +83,24 @@ class Grammar(object):
         return '"%s"' % value.replace('"', '""')
 
     def columnize(self, columns):
-        return ", ".join(map(self.wrap, columns))
+        columns = tuple(columns)
+
+        if not all(isinstance(column, basestring) for column in columns):
+            return ", ".join(map(self.wrap, columns))
+
+        columnized = self._columnize_cache.get(columns)
+        if columnized is None:
+            columnized = ", ".join(map(self.wrap, columns))
+
+            self._remember(self._columnize_cache, columns, columnized)
+
+        return columnized
+
+    def _remember(self, cache, key, value):
+        if len(cache) >= self.cache_size:
+            cache.clear()
+
+        cache[key] = value
 
     def parameterize(self, values):
         return ", ".join(map(self.parameter, values))
@@ -86,6 +126,9 @@ class Grammar(object):
     def set_table_prefix(self, prefix):
         self._table_prefix = prefix
 
+        self._wrap_cache.clear()
+        self._columnize_cache.clear()
+
         return self
 
     def get_marker(self):
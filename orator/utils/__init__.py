@@ -3,10 +3,14 @@
 import sys
 import warnings
 import functools
+import importlib
+
+from lazy_object_proxy import Proxy
 
 PY2 = sys.version_info[0] == 2
 PY3K = sys.version_info[0] >= 3
 PY33 = sys.version_info >= (3, 3)
+PY37 = sys.version_info >= (3, 7)
 
 if PY2:
     import imp
@@ -63,6 +67,19 @@ class Null(object):
         return other is None
 
 
+def lazy_import(name):
+    """
+    Import a module on first attribute access.
+
+    This is used for heavy dependencies that are not needed
+    to simply import orator.
+
+    :param name: The name of the module
+    :type name: str
+    """
+    return Proxy(lambda: importlib.import_module(name))
+
+
 def deprecated(func):
     """This is a decorator which can be used to mark functions
     as deprecated. It will result in a warning being emitted
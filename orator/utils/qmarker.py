@@ -7,12 +7,37 @@ class Qmarker(object):
 
     RE_QMARK = re.compile(r"\?\?|\?|%")
 
+    # Maximum number of converted queries kept in memory
+    # before the cache is flushed.
+    CACHE_SIZE = 1024
+
+    # Queries longer than this (typically large batch inserts)
+    # are converted every time rather than being cached.
+    CACHE_MAX_QUERY_LENGTH = 4096
+
+    _cache = {}
+
     @classmethod
     def qmark(cls, query):
         """
         Convert a "qmark" query into "format" style.
         """
+        if len(query) > cls.CACHE_MAX_QUERY_LENGTH:
+            return cls._qmark(query)
+
+        converted = cls._cache.get(query)
+        if converted is None:
+            converted = cls._qmark(query)
 
+            if len(cls._cache) >= cls.CACHE_SIZE:
+                cls._cache.clear()
+
+            cls._cache[query] = converted
+
+        return converted
+
+    @classmethod
+    def _qmark(cls, query):
         def sub_sequence(m):
             s = m.group(0)
             if s == "??":
@@ -2,7 +2,7 @@
 
 import os
 from flexmock import flexmock
-from orator.migrations import Migrator
+from orator.migrations import Migrator, ParallelMigrator, MigrationResult
 from orator.commands.migrations import MigrateCommand
 from orator import DatabaseManager
 from .. import OratorCommandTestCase
@@ -103,3 +103,31 @@ class MigrateCommandTestCase(OratorCommandTestCase):
         command.should_receive("_get_config").and_return({})
 
         self.run_command(command, [("--force", True)])
+
+    def test_migrations_can_be_run_on_several_targets(self):
+        migrator_mock = flexmock(ParallelMigrator)
+        migrator_mock.should_receive("run").once().with_args(
+            os.path.join(os.getcwd(), "migrations"), ["foo", "bar"], False, True
+        ).and_return(
+            [
+                MigrationResult(
+                    "foo", "succeeded", ["1_foo"], ["Migrated 1_foo"], None
+                ),
+                MigrationResult("bar", "failed", [], [], Exception("Boom")),
+            ]
+        )
+
+        command = flexmock(MigrateCommand())
+        command.should_receive("_get_config").and_return({})
+        command.should_receive("confirm").and_return(True)
+
+        tester = self.run_command(
+            command, [("--targets", ["foo", "bar"]), ("--fail-fast", True)]
+        )
+
+        output = tester.get_display()
+        self.assertEqual(1, tester.status_code)
+        self.assertIn("Migrated 1_foo", output)
+        self.assertIn("Boom", output)
+        self.assertRegex(output, r"foo\s+\|\s+Succeeded\s+\|\s+1")
+        self.assertRegex(output, r"bar\s+\|\s+Failed\s+\|\s+0")
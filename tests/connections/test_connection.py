@@ -55,6 +55,80 @@ class ConnectionTestCase(OratorTestCase):
         connection.rollback.assert_called_once()
         self.assertFalse(connection.commit.called)
 
+    def test_nested_transactions_use_savepoints(self):
+        dbapi = flexmock(commit=lambda: None, rollback=lambda: None)
+        cursor = flexmock()
+        dbapi.should_receive("cursor").and_return(cursor)
+        cursor.should_receive("execute").with_args("SAVEPOINT trans2", []).twice()
+        cursor.should_receive("execute").with_args(
+            "RELEASE SAVEPOINT trans2", []
+        ).once()
+        cursor.should_receive("execute").with_args(
+            "ROLLBACK TO SAVEPOINT trans2", []
+        ).once()
+        dbapi.should_receive("commit").once()
+        connection = Connection(dbapi, "database")
+        connection.log_query = mock.MagicMock()
+
+        with connection.transaction():
+            with connection.transaction():
+                self.assertEqual(2, connection.transaction_level())
+
+            try:
+                with connection.transaction():
+                    raise Exception("foo")
+            except Exception:
+                pass
+
+            self.assertEqual(1, connection.transaction_level())
+
+        self.assertEqual(0, connection.transaction_level())
+        self.assertEqual(
+            [
+                "SAVEPOINT trans2",
+                "RELEASE SAVEPOINT trans2",
+                "SAVEPOINT trans2",
+                "ROLLBACK TO SAVEPOINT trans2",
+            ],
+            [c[0][0] for c in connection.log_query.call_args_list],
+        )
+
+    def test_transaction_is_retried_after_retryable_errors(self):
+        connection = Connection(flexmock(commit=lambda: None, rollback=lambda: None))
+        attempts = []
+
+        def callback(conn):
+            attempts.append(conn.transaction_level())
+
+            if len(attempts) < 3:
+                raise Exception("deadlock detected")
+
+            return "done"
+
+        with mock.patch("time.sleep") as sleep:
+            self.assertEqual("done", connection.transaction(callback, retries=2))
+
+        self.assertEqual([1, 1, 1], attempts)
+        self.assertEqual([mock.call(0.1), mock.call(0.2)], sleep.call_args_list)
+
+        attempts[:] = []
+        self.assertRaises(
+            Exception, connection.transaction, callback, retries=1, backoff=0
+        )
+        self.assertEqual(2, len(attempts))
+
+    def test_transaction_is_not_retried_after_other_errors(self):
+        connection = Connection(flexmock(commit=lambda: None, rollback=lambda: None))
+        attempts = []
+
+        def callback(conn):
+            attempts.append(conn)
+
+            raise ValueError("foo")
+
+        self.assertRaises(ValueError, connection.transaction, callback, retries=3)
+        self.assertEqual(1, len(attempts))
+
     def test_try_again_if_caused_by_lost_connection_is_called(self):
         connection = flexmock(Connection(None, "database"))
         cursor = flexmock()
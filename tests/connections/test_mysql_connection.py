@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import datetime
+
+from flexmock import flexmock
+
 from .. import OratorTestCase
 
 from orator.connections.mysql_connection import MySQLConnection
+from orator.exceptions.query import QueryException
 
 
 class MySQLConnectionTestCase(OratorTestCase):
@@ -20,3 +25,97 @@ class MySQLConnectionTestCase(OratorTestCase):
         connection = MySQLConnection(None, "database", "", {"use_qmark": False})
 
         self.assertIsNone(connection.get_marker())
+
+    def test_nested_transactions_do_not_change_autocommit(self):
+        dbapi = flexmock(commit=lambda: None, rollback=lambda: None)
+        dbapi.should_receive("autocommit").with_args(False).once()
+        dbapi.should_receive("autocommit").with_args(True).once()
+        cursor = flexmock()
+        cursor.should_receive("execute").with_args("SAVEPOINT trans2", []).once()
+        cursor.should_receive("execute").with_args(
+            "RELEASE SAVEPOINT trans2", []
+        ).once()
+        dbapi.should_receive("cursor").and_return(cursor)
+        connection = MySQLConnection(dbapi, "database", "", {})
+
+        with connection.transaction():
+            with connection.transaction():
+                self.assertEqual(2, connection.transaction_level())
+
+        self.assertEqual(0, connection.transaction_level())
+
+    def test_supports_window_functions(self):
+        connection = MySQLConnection(None, "database", "", {})
+
+        for version, supported in [
+            ((5, 7, 30, ""), False),
+            ((8, 0, 20, ""), True),
+            ((10, 1, 40, "mariadb"), False),
+            ((10, 3, 22, "mariadb"), True),
+        ]:
+            connection._server_version = version
+
+            self.assertEqual(supported, connection.supports_window_functions())
+
+    def test_load_data_streams_rows_to_a_file(self):
+        connection = flexmock(MySQLConnection(None, "database", "", {}))
+        query = (
+            "LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE `users` "
+            "CHARACTER SET utf8 (`id`, `name`, `born_at`, `active`, `tags`)"
+        )
+        loaded = []
+
+        def load(sql, bindings):
+            self.assertEqual(query, sql)
+
+            with open(bindings[0], "rb") as fh:
+                loaded.append(fh.read())
+
+            return len(loaded) - 1
+
+        connection.should_receive("affecting_statement").replace_with(load)
+        connection.should_receive("select").with_args(
+            "SHOW WARNINGS", [], False
+        ).and_return([{"Level": "Warning", "Code": 1062}])
+
+        result = connection.load_data(
+            "users",
+            (
+                [1, "foo\tbar\\", datetime.date(2019, 7, 15), True, ["a"]],
+                {"id": 2, "name": "baz\n", "born_at": None, "active": False},
+            ),
+            ["id", "name", "born_at", "active", "tags"],
+        )
+
+        self.assertEqual(
+            [
+                b"",
+                b'1\tfoo\\tbar\\\\\t2019-07-15 00:00:00.000000\t1\t["a"]\n'
+                b"2\tbaz\\n\t\\N\t0\t\\N\n",
+            ],
+            loaded,
+        )
+        self.assertEqual(1, result.rows)
+        self.assertEqual([{"Level": "Warning", "Code": 1062}], result.warnings)
+
+    def test_load_data_falls_back_to_inserts(self):
+        connection = flexmock(MySQLConnection(None, "database", "", {}))
+        connection.load_data_batch_size = 2
+        connection.should_receive("affecting_statement").with_args(str, list).and_raise(
+            QueryException("", [], Exception(1148, "not allowed"))
+        ).once()
+        connection.should_receive("affecting_statement").with_args(
+            "REPLACE INTO `users` (`id`, `name`) VALUES (%s, %s), (%s, %s)",
+            [1, "foo", 2, "bar"],
+        ).and_return(2).once()
+        connection.should_receive("affecting_statement").with_args(
+            "REPLACE INTO `users` (`id`, `name`) VALUES (%s, %s)", [3, "baz"]
+        ).and_return(1).once()
+        connection.should_receive("select").and_return([])
+
+        result = connection.load_data(
+            "users", [[1, "foo"], [2, "bar"], [3, "baz"]], ["id", "name"], True
+        )
+
+        self.assertEqual(3, result.rows)
+        self.assertFalse(connection._local_infile)
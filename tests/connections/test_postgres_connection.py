@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import datetime
+
+from flexmock import flexmock
+
 from .. import OratorTestCase
 
 from orator.connections.postgres_connection import PostgresConnection
+from orator.utils.qmarker import qmark
 
 
 class PostgresConnectionTestCase(OratorTestCase):
@@ -20,3 +25,148 @@ class PostgresConnectionTestCase(OratorTestCase):
         connection = PostgresConnection(None, "database", "", {"use_qmark": False})
 
         self.assertIsNone(connection.get_marker())
+
+    def test_qmark_conversion(self):
+        query = "SELECT * FROM users WHERE name = ? AND email LIKE '%@foo' AND id ?? ?"
+        expected = (
+            "SELECT * FROM users WHERE name = %s AND email LIKE '%%@foo' AND id ? %s"
+        )
+
+        self.assertEqual(expected, qmark(query))
+        # Conversions are memoized, a second call must give the same result
+        self.assertEqual(expected, qmark(query))
+
+    def test_nested_transactions_do_not_change_autocommit(self):
+        dbapi = TransactionalConnection()
+        connection = PostgresConnection(dbapi, "database")
+
+        with connection.transaction():
+            connection.statement("UPDATE users SET name = %s", ["foo"])
+
+            with connection.transaction():
+                connection.statement("UPDATE users SET name = %s", ["bar"])
+
+        self.assertTrue(dbapi.autocommit)
+        self.assertEqual(
+            [
+                "UPDATE users SET name = %s",
+                "SAVEPOINT trans2",
+                "UPDATE users SET name = %s",
+                "RELEASE SAVEPOINT trans2",
+                "COMMIT",
+            ],
+            dbapi.queries,
+        )
+
+    def test_copy_from_streams_rows(self):
+        cursor = flexmock()
+        connection = PostgresConnection(flexmock(cursor=lambda: cursor), "database")
+        consumed = []
+
+        def rows():
+            for i in range(3):
+                consumed.append(i)
+
+                yield {"id": i, "name": 'foo "%d"' % i, "born_at": None}
+
+        def copy_expert(query, file):
+            self.assertEqual(
+                'COPY "users" ("id", "name", "born_at") FROM STDIN WITH (FORMAT csv)',
+                query,
+            )
+            self.assertEqual([], consumed)
+            self.assertEqual('0,"foo ""0""",\n', file.read(15))
+            self.assertEqual([0], consumed)
+            self.assertEqual('1,"foo ""1""",\n2,"foo ""2""",\n', file.read(8192))
+            self.assertEqual("", file.read(8192))
+
+        cursor.copy_expert = copy_expert
+
+        self.assertEqual(
+            3, connection.copy_from("users", rows(), ["id", "name", "born_at"])
+        )
+
+    def test_copy_from_formats_values(self):
+        cursor = flexmock()
+        connection = PostgresConnection(flexmock(cursor=lambda: cursor), "database")
+        data = []
+        cursor.copy_expert = lambda query, file: data.append(file.read())
+
+        connection.copy_from(
+            "users",
+            [
+                [
+                    True,
+                    False,
+                    1.5,
+                    datetime.datetime(2019, 7, 15, 12),
+                    bytearray(b"ab"),
+                    {"k": [1]},
+                ]
+            ],
+            ["a", "b", "c", "d", "e", "f"],
+        )
+
+        self.assertEqual(
+            ['t,f,1.5,"2019-07-15 12:00:00.000000","\\x6162","{""k"": [1]}"\n'], data
+        )
+
+    def test_copy_to_passes_data_to_callback(self):
+        cursor = flexmock()
+        connection = PostgresConnection(flexmock(cursor=lambda: cursor), "database")
+        cursor.should_receive("mogrify").with_args(
+            "COPY (SELECT 1 WHERE 1 = %s) TO STDOUT", [1]
+        ).and_return("COPY (SELECT 1 WHERE 1 = 1) TO STDOUT")
+
+        def copy_expert(query, file):
+            self.assertEqual("COPY (SELECT 1 WHERE 1 = 1) TO STDOUT", query)
+            file.write("1\n")
+
+        cursor.copy_expert = copy_expert
+        received = []
+
+        connection.copy_to(
+            "COPY (SELECT 1 WHERE 1 = %s) TO STDOUT", [1], received.append
+        )
+
+        self.assertEqual(["1\n"], received)
+
+
+class TransactionalConnection(object):
+    """
+    A connection refusing to change autocommit
+    once a transaction is in progress, like psycopg2.
+    """
+
+    def __init__(self):
+        self._autocommit = True
+        self.in_transaction = False
+        self.queries = []
+
+    @property
+    def autocommit(self):
+        return self._autocommit
+
+    @autocommit.setter
+    def autocommit(self, value):
+        if self.in_transaction:
+            raise Exception("set_session cannot be used inside a transaction")
+
+        self._autocommit = value
+
+    def cursor(self):
+        return flexmock(execute=self.execute)
+
+    def execute(self, query, bindings=None):
+        if not self._autocommit:
+            self.in_transaction = True
+
+        self.queries.append(query)
+
+    def commit(self):
+        self.in_transaction = False
+        self.queries.append("COMMIT")
+
+    def rollback(self):
+        self.in_transaction = False
+        self.queries.append("ROLLBACK")
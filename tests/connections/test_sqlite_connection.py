@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+
+from .. import OratorTestCase
+
+from orator import DatabaseManager
+from orator.utils import PY2
+from orator.connectors.sqlite_connector import SQLiteConnector
+from orator.exceptions.connectors import ConnectorException
+
+
+class SQLiteConnectionTestCase(OratorTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_pragmas_are_set_at_connect_time(self):
+        connection = self._connect(journal_mode="WAL", busy_timeout=1000)
+
+        self.assertEqual("wal", self._pragma(connection, "journal_mode"))
+        self.assertEqual(1000, self._pragma(connection, "busy_timeout"))
+
+    def test_performance_preset(self):
+        connection = self._connect(preset="performance", synchronous="full")
+
+        self.assertEqual("wal", self._pragma(connection, "journal_mode"))
+        self.assertEqual(2, self._pragma(connection, "synchronous"))
+        self.assertEqual(2, self._pragma(connection, "temp_store"))
+        self.assertEqual(-64000, self._pragma(connection, "cache_size"))
+
+    def test_invalid_pragmas_are_rejected(self):
+        self.assertRaises(
+            ConnectorException, self._connect, journal_mode="wal; DROP TABLE users"
+        )
+        self.assertRaises(ConnectorException, self._connect, preset="unknown")
+
+    def test_shared_cache_in_memory_database(self):
+        if PY2:
+            return
+
+        config = {"driver": "sqlite", "database": ":memory:", "shared_cache": True}
+        first = DatabaseManager({"sqlite": config})
+        second = DatabaseManager({"sqlite": config})
+
+        first.statement("CREATE TABLE users (id INTEGER)")
+        first.table("users").insert(id=1)
+
+        self.assertEqual(1, second.table("users").count())
+
+    def _connect(self, **config):
+        config.update(
+            {"driver": "sqlite", "database": os.path.join(self.directory, "db.sqlite")}
+        )
+
+        return SQLiteConnector().connect(config)
+
+    def _pragma(self, connection, pragma):
+        return list(connection.execute("PRAGMA %s" % pragma).fetchone().values())[0]
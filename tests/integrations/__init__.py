@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import io
 import os
 import json
 import logging
@@ -224,6 +225,33 @@ class IntegrationTestCase(object):
         queries = formatter.logged_queries
         self.assertEqual(6, len(queries))
 
+    def test_belongs_to_many_sync_uses_batched_statements(self):
+        users = [
+            OratorTestUser.create(id=i, email="user%d@doe.com" % i) for i in range(1, 7)
+        ]
+        user = users[0]
+        user.friends().attach([2, 3, 4])
+
+        formatter.reset()
+
+        changes = user.friends().sync([3, {4: {"is_close": True}}, 5, 6])
+
+        self.assertEqual([5, 6], changes["attached"])
+        self.assertEqual([2], changes["detached"])
+        self.assertEqual([4], changes["updated"])
+        self.assertEqual(4, len(formatter.logged_queries))
+
+        friends = user.friends().order_by("test_users.id").get()
+        self.assertEqual([3, 4, 5, 6], friends.pluck("id").all())
+        self.assertTrue(friends[1].pivot.is_close)
+
+        formatter.reset()
+
+        changes = user.friends().sync([3, {4: {"is_close": True}}, 5, 6])
+
+        self.assertEqual({"attached": [], "detached": [], "updated": []}, changes)
+        self.assertEqual(1, len(formatter.logged_queries))
+
     def test_all_eager_loaded_transitive_relations_must_be_present(self):
         user = OratorTestUser.create(id=1, email="john@doe.com")
         post = user.posts().create(name="First Post")
@@ -390,6 +418,45 @@ class IntegrationTestCase(object):
         self.assertIsInstance(user.posts, Collection)
         self.assertEqual(user.posts().where("name", "Second Post").first().id, post2.id)
 
+    def test_eager_loading_limits_apply_to_each_parent(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        for name in ["Post 1", "Post 2"]:
+            post = user.posts().create(name=name)
+
+            for i in range(4):
+                post.comments().create(body="%s comment %d" % (name, i))
+
+        friend = OratorTestUser.create(email="jane@doe.com")
+        other = OratorTestUser.create(email="joe@doe.com")
+        user.friends().attach([friend.id, other.id])
+        friend.friends().attach([user.id, other.id])
+
+        formatter.reset()
+
+        posts = OratorTestPost.with_(
+            {"comments": lambda q: q.order_by("id", "desc").limit(2).offset(1)}
+        ).get()
+
+        self.assertEqual(2, len(formatter.logged_queries))
+        for post in posts:
+            self.assertEqual(
+                ["%s comment 2" % post.name, "%s comment 1" % post.name],
+                post.comments.lists("body"),
+            )
+            self.assertNotIn("orator_row", post.comments[0].to_dict())
+            self.assertFalse(post.comments[0].is_dirty())
+
+        users = (
+            OratorTestUser.with_({"friends": lambda q: q.order_by("email").limit(1)})
+            .where_in("id", [user.id, friend.id])
+            .order_by("id")
+            .get()
+        )
+
+        self.assertEqual(["jane@doe.com"], users[0].friends.lists("email"))
+        self.assertEqual(["joe@doe.com"], users[1].friends.lists("email"))
+        self.assertEqual(user.id, users[0].friends[0].pivot.user_id)
+
     def test_relationships_properties_accept_builder(self):
         user = OratorTestUser.create(id=1, email="john@doe.com")
         post1 = user.posts().create(name="First Post")
@@ -580,6 +647,75 @@ class IntegrationTestCase(object):
 
         self.assertEqual(count, self.connection().table("test_users").count())
 
+    def test_nested_transaction_is_rolled_back_to_its_savepoint(self):
+        with self.connection().transaction():
+            OratorTestUser.create(id=1, email="john@doe.com")
+
+            try:
+                with self.connection().transaction():
+                    OratorTestUser.create(id=2, email="jane@doe.com")
+
+                    raise RuntimeError("foo")
+            except RuntimeError:
+                pass
+
+        self.assertEqual([1], self.connection().table("test_users").lists("id").all())
+
+    def test_to_columns(self):
+        for i in range(3):
+            OratorTestUser.create(id=i + 1, email="user%d@doe.com" % i)
+
+        columns = (
+            self.connection()
+            .table("test_users")
+            .select("id", "email")
+            .order_by("id")
+            .to_columns(chunk_size=2)
+        )
+
+        self.assertEqual([1, 2, 3], list(columns["id"]))
+        self.assertEqual(
+            ["user0@doe.com", "user1@doe.com", "user2@doe.com"], list(columns["email"])
+        )
+
+    def test_export(self):
+        for i in range(3):
+            OratorTestUser.create(id=i + 1, email="user%d@doe.com" % i)
+
+        fp = io.StringIO()
+        count = (
+            self.connection()
+            .table("test_users")
+            .select("id", "email")
+            .order_by("id")
+            .export(fp, chunk_size=2)
+        )
+
+        self.assertEqual(3, count)
+        self.assertEqual(
+            "id,email\r\n1,user0@doe.com\r\n2,user1@doe.com\r\n3,user2@doe.com\r\n",
+            fp.getvalue(),
+        )
+
+    def test_model_export(self):
+        for i in range(3):
+            OratorTestUser.create(id=i + 1, email="user%d@doe.com" % i)
+
+        class User(OratorTestUser):
+            __hidden__ = ["email"]
+            __casts__ = {"id": "str"}
+
+        fp = io.StringIO()
+        count = User.order_by("id").export(fp, format="ndjson", chunk_size=2)
+        lines = [json.loads(line) for line in fp.getvalue().splitlines()]
+
+        self.assertEqual(3, count)
+        self.assertEqual(
+            [user.serialize() for user in User.order_by("id").get()], lines
+        )
+        self.assertEqual("1", lines[0]["id"])
+        self.assertNotIn("email", lines[0])
+
     def test_date(self):
         user = OratorTestUser.create(id=1, email="john@doe.com")
         photo1 = user.photos().create(name="Photo 1", taken_on=pendulum.date.today())
@@ -660,6 +796,114 @@ class IntegrationTestCase(object):
             comment2_updated_at, OratorTestComment.find(comment2.id).updated_at
         )
 
+    def test_batch_touches(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        post = user.posts().create(name="Post")
+        parent = post.comments().create(body="Parent")
+        parent_updated_at = OratorTestComment.find(parent.id).updated_at
+
+        formatter.reset()
+
+        with OratorTestComment.batch_touches():
+            for i in range(5):
+                post.comments().create(body="Child %d" % i, parent_id=parent.id)
+
+        # 5 inserts, 1 update of the parent and 1 select to cascade the touch
+        self.assertEqual(7, len(formatter.logged_queries))
+        self.assertTrue(
+            parent_updated_at < OratorTestComment.find(parent.id).updated_at
+        )
+
+    def test_without_touching(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        post = user.posts().create(name="Post")
+        parent = post.comments().create(body="Parent")
+        parent_updated_at = OratorTestComment.find(parent.id).updated_at
+
+        formatter.reset()
+
+        with Model.without_touching():
+            post.comments().create(body="Child", parent_id=parent.id)
+
+        self.assertEqual(1, len(formatter.logged_queries))
+        self.assertEqual(
+            parent_updated_at, OratorTestComment.find(parent.id).updated_at
+        )
+
+    def test_aggregates(self):
+        for email, names in [("john@doe.com", "ABC"), ("jane@doe.com", "BA")]:
+            user = OratorTestUser.create(email=email)
+            for name in names:
+                user.posts().create(name=name)
+
+        formatter.reset()
+
+        self.assertEqual(
+            {"count": 5, "max": "C"},
+            OratorTestPost.query().aggregates(count="*", max="name"),
+        )
+        self.assertEqual(
+            {"count": 0, "max": None},
+            OratorTestPost.where("name", "D").aggregates(count="*", max="name"),
+        )
+
+        result = (
+            self.connection()
+            .table("test_posts")
+            .order_by("name")
+            .limit(1)
+            .aggregates(group_by="user_id", count="id", min=["id", "name"])
+        )
+        self.assertEqual(2, len(result))
+        self.assertEqual(
+            {"count": 2, "min_id": 4, "min_name": "A"}, list(result.values())[1]
+        )
+        self.assertEqual(3, len(formatter.logged_queries))
+
+    def test_paginate_count_strategies(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        for name in "ABC":
+            user.posts().create(name=name)
+
+        for strategy in ["exact", "estimate", "cached"]:
+            paginator = OratorTestPost.order_by("name").paginate(
+                2, 2, count_strategy=strategy
+            )
+
+            self.assertEqual(3, paginator.total)
+            self.assertEqual(["C"], [post.name for post in paginator])
+
+        paginator = OratorTestPost.query().paginate(2, 1, count_strategy="cached")
+        self.assertTrue(paginator.approximate)
+
+    def test_get_tree(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        post = user.posts().create(name="Post")
+        root = post.comments().create(body="Root")
+        a = post.comments().create(body="A", parent_id=root.id)
+        post.comments().create(body="B", parent_id=root.id)
+        post.comments().create(body="A1", parent_id=a.id)
+        post.comments().create(body="Other")
+
+        formatter.reset()
+
+        roots = (
+            OratorTestComment.where("id", root.id)
+            .order_by("body", "desc")
+            .with_("post")
+            .get_tree()
+        )
+
+        self.assertEqual(["Root"], roots.lists("body"))
+        self.assertEqual(["B", "A"], roots[0].children.lists("body"))
+        self.assertEqual(["A1"], roots[0].children[1].children.lists("body"))
+        self.assertEqual("Post", roots[0].children[1].children[0].post.name)
+        # The trees and the eager loaded posts
+        self.assertEqual(2, len(formatter.logged_queries))
+
+        roots = OratorTestComment.where("body", "like", "A%").get_tree()
+        self.assertEqual(["A"], roots.lists("body"))
+
     def grammar(self):
         return self.connection().get_default_query_grammar()
 
@@ -32,3 +32,11 @@ class MySQLIntegrationTestCase(IntegrationTestCase, OratorTestCase):
 
     def get_marker(self):
         return "%s"
+
+    def test_load_data(self):
+        rows = ((i, "user%d@doe.com" % i) for i in range(1, 101))
+
+        result = self.connection().load_data("test_users", rows, ["id", "email"])
+
+        self.assertEqual(100, result.rows)
+        self.assertEqual(100, self.connection().table("test_users").count())
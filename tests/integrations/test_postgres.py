@@ -32,3 +32,18 @@ class PostgresIntegrationTestCase(IntegrationTestCase, OratorTestCase):
 
     def get_marker(self):
         return "%s"
+
+    def test_copy_from_and_copy_to(self):
+        rows = ((i, "user%d@doe.com" % i) for i in range(1, 101))
+
+        self.assertEqual(
+            100, self.connection().copy_from("test_users", rows, ["id", "email"])
+        )
+        self.assertEqual(100, self.connection().table("test_users").count())
+
+        data = []
+        self.connection().table("test_users").select("id", "email").where(
+            "id", "<=", 2
+        ).order_by("id").copy_to(data.append)
+
+        self.assertEqual("1,user1@doe.com\n2,user2@doe.com\n", "".join(data))
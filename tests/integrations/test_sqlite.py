@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from .. import OratorTestCase
-from . import IntegrationTestCase
+from . import IntegrationTestCase, OratorTestUser, OratorTestPost
 
 
 class SQLiteIntegrationTestCase(IntegrationTestCase, OratorTestCase):
@@ -11,3 +11,42 @@ class SQLiteIntegrationTestCase(IntegrationTestCase, OratorTestCase):
             "default": "sqlite",
             "sqlite": {"driver": "sqlite", "database": ":memory:"},
         }
+
+    def test_explain(self):
+        plan = (
+            self.connection()
+            .table("test_users")
+            .where("created_at", "<", "2019-01-01")
+            .explain()
+        )
+
+        self.assertTrue(plan.has_sequential_scan("test_users"))
+        self.assertEqual(["test_users"], plan.tables_without_index)
+        self.assertFalse(plan.uses_index())
+
+        plan = OratorTestUser.where("email", "john@doe.com").explain()
+
+        self.assertFalse(plan.has_sequential_scan())
+        self.assertTrue(plan.uses_index(table="test_users"))
+
+    def test_eager_loading_limits_without_window_functions(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        for name in ["Post 1", "Post 2"]:
+            post = user.posts().create(name=name)
+
+            for i in range(2):
+                post.comments().create(body="%s comment %d" % (name, i))
+
+        connection = self.connection()
+        self.assertTrue(connection.supports_window_functions())
+
+        connection._server_version = ("3", "24", "0", "")
+        try:
+            posts = OratorTestPost.with_(
+                {"comments": lambda q: q.order_by("id").limit(3)}
+            ).get()
+        finally:
+            connection._server_version = None
+
+        # The limit applies to the comments of all the posts
+        self.assertEqual([2, 1], [len(post.comments) for post in posts])
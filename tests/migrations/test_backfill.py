@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+from .. import OratorTestCase, mock
+from orator import DatabaseManager
+from orator.migrations import Migration
+
+
+class BackfillTestCase(OratorTestCase):
+    def setUp(self):
+        self.db = DatabaseManager(
+            {"sqlite": {"driver": "sqlite", "database": ":memory:"}}
+        )
+        self.connection = self.db.connection()
+
+        with self.connection.get_schema_builder().create("users") as table:
+            table.increments("id")
+            table.string("name")
+            table.boolean("active").nullable()
+
+        self.db.table("users").insert(
+            [{"name": "user%d" % i, "active": None} for i in range(10)]
+        )
+
+        self.notes = []
+        self.migration = BackfillMigration()
+        self.migration.set_connection(self.connection)
+        self.migration.set_notifier(self.notes.append)
+
+    def test_backfill_updates_rows_by_batches(self):
+        with mock.patch.object(
+            self.connection, "transaction", wraps=self.connection.transaction
+        ) as transaction:
+            updated = self.migration.backfill(
+                "users", {"active": True}, where={"name": "user3"}, batch_size=3
+            )
+
+        self.assertEqual(1, updated)
+        self.assertEqual(4, transaction.call_count)
+        self.assertEqual(
+            [4], self.db.table("users").where("active", True).lists("id").all()
+        )
+        self.assertEqual(0, self.db.table("backfills").count())
+        self.assertEqual(["Backfilled 1 rows of users"], self.notes)
+
+    def test_backfill_resumes_after_saved_progress(self):
+        self.migration.backfill("users", {"active": False}, batch_size=20)
+        self.db.table("backfills").insert(name="BackfillMigration.users", last_key="7")
+
+        updated = self.migration.backfill("users", {"active": True})
+
+        self.assertEqual(3, updated)
+        self.assertEqual(
+            [8, 9, 10], self.db.table("users").where("active", True).lists("id").all()
+        )
+        self.assertEqual("Resuming the backfill of users after 7", self.notes[1])
+
+    def test_backfill_waits_for_replicas(self):
+        self.connection.get_replication_lag = mock.MagicMock(side_effect=[5, 0.5, 0.5])
+
+        with mock.patch("time.sleep") as sleep:
+            self.migration.backfill("users", {"active": True}, sleep=0.1, max_lag=1)
+
+        self.assertEqual([mock.call(1), mock.call(0.1)], sleep.call_args_list)
+        self.assertEqual("Waiting for the replicas, 5.0 seconds behind", self.notes[0])
+
+    def test_backfill_can_not_be_run_inside_a_transaction(self):
+        with self.connection.transaction():
+            self.assertRaises(
+                RuntimeError, self.migration.backfill, "users", {"active": True}
+            )
+
+    def test_backfill_can_be_pretended(self):
+        with self.connection.pretend():
+            self.migration.backfill("users", {"active": True})
+
+        self.assertEqual(2, len(self.connection.get_logged_queries()))
+        self.assertEqual(0, self.db.table("users").where("active", True).count())
+        self.assertEqual([], self.notes)
+
+
+class BackfillMigration(Migration):
+    def up(self):
+        pass
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+
+from .. import OratorTestCase
+from orator import DatabaseManager
+from orator.migrations import ParallelMigrator
+
+
+MIGRATION = """from orator.migrations import Migration
+
+
+class Create{name}Table(Migration):
+    def up(self):
+        with self.schema.create("{table}") as table:
+            table.increments("id")
+
+    def down(self):
+        self.schema.drop("{table}")
+"""
+
+
+class ParallelMigratorTestCase(OratorTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "migrations")
+        os.mkdir(self.path)
+
+        for i, table in enumerate(["users", "posts"]):
+            filename = "2018_01_01_00000%d_create_%s_table.py" % (i, table)
+
+            with open(os.path.join(self.path, filename), "w") as fh:
+                fh.write(MIGRATION.format(name=table.capitalize(), table=table))
+
+        self.db = DatabaseManager(
+            {
+                name: {"driver": "sqlite", "database": self._database(name)}
+                for name in ["a", "b", "c"]
+            }
+        )
+        # The database of this connection can't be created
+        self.db._config["broken"] = {
+            "driver": "sqlite",
+            "database": os.path.join(self.directory, "missing", "db.sqlite"),
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_migrations_are_run_on_each_connection(self):
+        migrator = ParallelMigrator(self.db, workers=2)
+
+        results = migrator.run(self.path, ["a", "b", "broken", "c"])
+
+        self.assertEqual(["a", "b", "broken", "c"], [r.connection for r in results])
+        self.assertEqual(
+            ["succeeded", "succeeded", "failed", "succeeded"],
+            [r.status for r in results],
+        )
+        self.assertEqual(
+            [
+                "2018_01_01_000000_create_users_table",
+                "2018_01_01_000001_create_posts_table",
+            ],
+            results[0].migrations,
+        )
+        self.assertIsNotNone(results[2].error)
+
+        for name in ["a", "b", "c"]:
+            self.assertTrue(
+                self.db.connection(name).get_schema_builder().has_table("posts")
+            )
+
+        status = migrator.status(["a", "broken"])
+        self.assertEqual(2, len(status["a"]))
+        self.assertIsInstance(status["broken"], Exception)
+
+        results = migrator.run(self.path, ["a", "b"])
+        self.assertEqual([[], []], [r.migrations for r in results])
+        self.assertEqual(["<info>Nothing to migrate</info>"], results[0].notes)
+
+    def test_remaining_connections_are_skipped_after_a_failure(self):
+        migrator = ParallelMigrator(self.db, workers=1)
+
+        results = migrator.run(self.path, ["a", "broken", "b"], fail_fast=True)
+
+        self.assertEqual(
+            ["succeeded", "failed", "skipped"], [r.status for r in results]
+        )
+        self.assertFalse(
+            self.db.connection("b").get_schema_builder().has_table("users")
+        )
+
+    def _database(self, name):
+        return os.path.join(self.directory, "%s.sqlite" % name)
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+
+from .. import OratorTestCase, mock
+from orator import DatabaseManager
+from orator.migrations import SchemaDiffer, Migrator, DatabaseMigrationRepository
+
+
+SCHEMA = """
+def define(schema):
+    with schema.create("users") as table:
+        table.increments("id")
+        table.string("email").unique()
+        table.string("name").nullable()
+        table.integer("votes").default(0)
+
+    with schema.create("posts") as table:
+        table.increments("id")
+        table.integer("user_id")
+        table.text("body")
+        table.foreign("user_id").references("id").on("users").on_delete("cascade")
+"""
+
+
+class SchemaDifferTestCase(OratorTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.schema_path = os.path.join(self.directory, "schema.py")
+        self.snapshot_path = os.path.join(self.directory, ".schema_snapshot.json")
+
+        with open(self.schema_path, "w") as fh:
+            fh.write(SCHEMA)
+
+        self.db = DatabaseManager(
+            {
+                "sqlite": {
+                    "driver": "sqlite",
+                    "database": os.path.join(self.directory, "db.sqlite"),
+                }
+            }
+        )
+        self.connection = self.db.connection()
+        self.differ = SchemaDiffer(self.connection, snapshot_path=self.snapshot_path)
+
+    def tearDown(self):
+        self.db.disconnect()
+        shutil.rmtree(self.directory)
+
+    def test_missing_tables_are_created(self):
+        up, down = self.differ.diff(self.schema_path)
+
+        self.assertEqual([("create", "users"), ("create", "posts")], _actions(up))
+        self.assertEqual([("drop", "posts"), ("drop", "users")], _actions(down))
+        self.assertEqual(
+            ["increments", "string", "string", "integer", "unique"],
+            [c.method for c in up[0].calls],
+        )
+        self.assertEqual(("email",), up[0].calls[1].args)
+        self.assertEqual([("nullable", ())], up[0].calls[2].modifiers)
+        self.assertEqual([("default", (0,))], up[0].calls[3].modifiers)
+        self.assertEqual(
+            [("references", ("id",)), ("on", ("users",)), ("on_delete", ("cascade",))],
+            up[1].calls[-1].modifiers,
+        )
+
+    def test_executing_the_operations_applies_the_declared_schema(self):
+        up, down = self.differ.diff(self.schema_path)
+
+        for statement in self.differ.to_sql(up):
+            self.connection.statement(statement)
+
+        self.assertEqual(([], []), self.differ.diff(self.schema_path))
+
+        for statement in self.differ.to_sql(down):
+            self.connection.statement(statement)
+
+        self.assertFalse(self.connection.get_schema_builder().has_table("users"))
+
+    def test_changed_tables_are_altered(self):
+        with self.connection.get_schema_builder().create("users") as table:
+            table.increments("id")
+            table.string("email").unique()
+            table.string("name")
+            table.boolean("admin")
+
+        up, down = self.differ.diff(self.schema_path)
+
+        self.assertEqual(
+            [("create", "posts"), ("table", "users"), ("table", "users")], _actions(up)
+        )
+        self.assertEqual(
+            [("drop_column", ("admin",))], [(c.method, c.args) for c in up[1].calls]
+        )
+        self.assertEqual(
+            [("integer", ("votes",)), ("string", ("name",))],
+            [(c.method, c.args) for c in up[2].calls],
+        )
+        self.assertEqual([("nullable", ()), ("change", ())], up[2].calls[1].modifiers)
+        self.assertEqual([("table", "users"), ("table", "users")], _actions(down)[:2])
+        self.assertEqual(["drop_column"], [c.method for c in down[0].calls])
+        self.assertEqual(["boolean", "string"], [c.method for c in down[1].calls])
+
+    def test_columns_are_dropped_before_the_new_ones_are_added(self):
+        with open(self.schema_path, "w") as fh:
+            fh.write(
+                "def define(schema):\n"
+                '    with schema.create("users") as table:\n'
+                '        table.increments("id")\n'
+                '        table.string("email")\n'
+                '        table.string("name")\n'
+                '        table.integer("age")\n'
+            )
+
+        with self.connection.get_schema_builder().create("users") as table:
+            table.increments("id")
+            table.string("email")
+            table.string("nickname")
+
+        up, down = self.differ.diff(self.schema_path)
+        self._run_migration(self.differ.to_stub(up, down))
+
+        self.assertEqual(
+            ["id", "email", "name", "age"],
+            self.connection.get_schema_builder().get_column_listing("users"),
+        )
+        self.assertEqual(([], []), self.differ.diff(self.schema_path))
+
+    def test_indexes_are_dropped_before_the_columns(self):
+        with open(self.schema_path, "w") as fh:
+            fh.write(
+                "def define(schema):\n"
+                '    with schema.create("users") as table:\n'
+                '        table.increments("id")\n'
+                '        table.string("email").unique()\n'
+                '        table.integer("age")\n'
+            )
+
+        schema = self.connection.get_schema_builder()
+        with schema.create("users") as table:
+            table.increments("id")
+            table.string("email")
+            table.string("name")
+
+        up, down = self.differ.diff(self.schema_path)
+        self.assertEqual(
+            [["drop_unique"], ["drop_column"], ["string"]],
+            [[c.method for c in o.calls] for o in down],
+        )
+
+        migrator, path = self._run_migration(self.differ.to_stub(up, down))
+        self.assertEqual(([], []), self.differ.diff(self.schema_path))
+        self.assertIn(
+            "users_email_unique",
+            self.connection.get_schema_manager().list_table_indexes("users"),
+        )
+
+        migrator.rollback(path)
+        self.assertEqual(["id", "email", "name"], schema.get_column_listing("users"))
+        self.assertNotIn(
+            "users_email_unique",
+            self.connection.get_schema_manager().list_table_indexes("users"),
+        )
+
+    def test_the_declared_schema_snapshot_is_cached(self):
+        self.differ.diff(self.schema_path)
+
+        self.assertTrue(os.path.exists(self.snapshot_path))
+
+        differ = SchemaDiffer(self.connection, snapshot_path=self.snapshot_path)
+        with mock.patch.object(differ, "_build_snapshot") as build:
+            up, _ = differ.diff(self.schema_path)
+
+        self.assertFalse(build.called)
+        self.assertEqual(2, len(up))
+
+        with open(self.schema_path, "a") as fh:
+            fh.write("    schema.drop('posts')\n")
+
+        up, _ = SchemaDiffer(self.connection, snapshot_path=self.snapshot_path).diff(
+            self.schema_path
+        )
+        self.assertEqual([("create", "users")], _actions(up))
+
+    def test_generated_migration_can_be_run(self):
+        up, down = self.differ.diff(self.schema_path)
+        stub = self.differ.to_stub(up, down)
+
+        self.assertIn("with self.schema.create('users') as table:", stub)
+        self.assertIn("table.unique('email')", stub)
+        self.assertIn("table.integer('votes').default(0)", stub)
+        self.assertIn("self.schema.drop('posts')", stub)
+
+        migrator, path = self._run_migration(stub)
+        self.assertEqual(([], []), self.differ.diff(self.schema_path))
+
+        migrator.rollback(path)
+        self.assertFalse(self.connection.get_schema_builder().has_table("posts"))
+
+    def test_shadow_database_must_be_empty(self):
+        shadow = self.db.connection()
+        differ = SchemaDiffer(self.connection, shadow)
+
+        with self.connection.get_schema_builder().create("users") as table:
+            table.increments("id")
+
+        self.assertRaises(RuntimeError, differ.diff, self.schema_path)
+
+    def _run_migration(self, stub):
+        path = os.path.join(self.directory, "migrations")
+        os.mkdir(path)
+        with open(os.path.join(path, "2018_01_01_000000_update_schema.py"), "w") as fh:
+            fh.write(stub.replace("DummyClass", "UpdateSchema"))
+
+        repository = DatabaseMigrationRepository(self.db, "migrations")
+        repository.create_repository()
+        migrator = Migrator(repository, self.db)
+
+        migrator.run(path)
+
+        return migrator, path
+
+
+def _actions(operations):
+    return [(o.action, o.table) for o in operations]
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+
+from .. import OratorTestCase, mock
+from orator import DatabaseManager
+from orator.migrations import Migrator, DatabaseMigrationRepository
+
+
+MIGRATION = """from orator.migrations import Migration
+
+
+class Create{name}Table(Migration):
+    def up(self):
+        with self.schema.create("{table}") as table:
+            table.increments("id")
+            table.string("name").index()
+
+    def down(self):
+        self.schema.drop("{table}")
+"""
+
+
+class SquashTestCase(OratorTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "migrations")
+        os.mkdir(self.path)
+
+        for i, table in enumerate(["users", "posts"]):
+            self._write_migration(i, table)
+
+        self.db = DatabaseManager(
+            {
+                name: {
+                    "driver": "sqlite",
+                    "database": os.path.join(self.directory, "%s.sqlite" % name),
+                }
+                for name in ["old", "new"]
+            }
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_fresh_databases_are_created_from_the_squashed_schema(self):
+        migrator = self._get_migrator("old")
+        migrator.run(self.path)
+
+        squashed = migrator.squash(self.path, prune=True)
+
+        self.assertEqual(
+            [
+                "2018_01_01_000000_create_users_table",
+                "2018_01_01_000001_create_posts_table",
+            ],
+            squashed,
+        )
+        self.assertEqual(
+            ["__init__.py", "schema.sql"], sorted(os.listdir(self.path))[:2]
+        )
+
+        self._write_migration(2, "tags")
+        migrator = self._get_migrator("new")
+        with mock.patch.object(
+            migrator, "_resolve", wraps=migrator._resolve
+        ) as resolve:
+            migrator.run(self.path)
+
+        resolve.assert_called_once_with(
+            self.path, "2018_01_01_000002_create_tags_table"
+        )
+
+        schema = self.db.connection("new").get_schema_builder()
+        self.assertTrue(schema.has_table("users"))
+        self.assertTrue(schema.has_table("tags"))
+        self.assertEqual(
+            squashed + ["2018_01_01_000002_create_tags_table"],
+            sorted(migrator.get_repository().get_ran()),
+        )
+        self.assertEqual(
+            [1, 1, 2],
+            self.db.connection("new")
+            .table("migrations")
+            .order_by("migration")
+            .lists("batch")
+            .all(),
+        )
+
+    def test_migration_files_are_only_listed_once(self):
+        migrator = self._get_migrator("old")
+
+        self.assertEqual(2, len(migrator._get_migration_files(self.path)))
+
+        self._write_migration(2, "tags")
+        self.assertEqual(2, len(migrator._get_migration_files(self.path)))
+
+    def _get_migrator(self, name):
+        repository = DatabaseMigrationRepository(self.db, "migrations", connection=name)
+        repository.create_repository()
+
+        return Migrator(repository, self.db)
+
+    def _write_migration(self, i, table):
+        filename = "2018_01_01_00000%d_create_%s_table.py" % (i, table)
+
+        with open(os.path.join(self.path, filename), "w") as fh:
+            fh.write(MIGRATION.format(name=table.capitalize(), table=table))
@@ -2,6 +2,7 @@
 
 
 import pendulum
+from collections import OrderedDict
 from flexmock import flexmock, flexmock_teardown
 from ... import OratorTestCase
 from ...utils import MockConnection
@@ -14,6 +15,7 @@ from orator.orm.builder import Builder
 from orator.orm.model import Model
 from orator.orm.relations import BelongsToMany
 from orator.orm.relations.pivot import Pivot
+from orator.orm.relations.wrapper import LazyPivot
 from orator.orm.collection import Collection
 
 
@@ -77,6 +79,28 @@ class OrmBelongsToTestCase(OratorTestCase):
         self.assertEqual("user_role", results[0].pivot.get_table())
         self.assertTrue(results[0].pivot.exists)
 
+    def test_pivots_are_built_when_first_accessed(self):
+        model = OrmBelongsToManyModelStub()
+        model.fill(name="john", pivot_user_id=1, pivot_role_id=2, pivot_foo="bar")
+
+        flexmock(BelongsToMany)
+        relation = self._get_relation()
+        relation.get_parent().should_receive("get_connection_name").and_return(
+            "foo.connection"
+        )
+        relation.should_receive("new_existing_pivot").never()
+
+        relation._hydrate_pivot_relation([model])
+
+        self.assertEqual({"name": "john", "pivot_foo": "bar"}, model.get_attributes())
+        self.assertIsInstance(model.get_relation("pivot"), LazyPivot)
+
+        relation.should_receive("new_existing_pivot").once().with_args(
+            {"user_id": 1, "role_id": 2}
+        ).and_return(OrmBelongsToManyPivotStub())
+
+        self.assertIsInstance(model.pivot, OrmBelongsToManyPivotStub)
+
     def test_timestamps_can_be_retrieved_properly(self):
         model1 = OrmBelongsToManyModelStub()
         model1.fill(name="john", pivot_user_id=1, pivot_role_id=2)
@@ -189,19 +213,44 @@ class OrmBelongsToTestCase(OratorTestCase):
         flexmock(BelongsToMany, touch_if_touching=lambda: True)
         relation = self._get_relation()
         query = flexmock()
-        query.should_receive("from_").once().with_args("user_role").and_return(query)
+        query.should_receive("from_").twice().with_args("user_role").and_return(query)
         query.should_receive("insert").once().with_args(
             [
                 {"user_id": 1, "role_id": 2, "foo": "bar"},
-                {"user_id": 1, "role_id": 3, "bar": "baz", "foo": "bar"},
+                {"user_id": 1, "role_id": 4, "foo": "bar"},
             ]
         ).and_return(True)
+        query.should_receive("insert").once().with_args(
+            [{"user_id": 1, "role_id": 3, "bar": "baz", "foo": "bar"}]
+        ).and_return(True)
         mock_query_builder = flexmock()
         relation.get_query().should_receive("get_query").and_return(mock_query_builder)
-        mock_query_builder.should_receive("new_query").once().and_return(query)
+        mock_query_builder.should_receive("new_query").twice().and_return(query)
         relation.should_receive("touch_if_touching").once()
 
-        relation.attach([2, {3: {"bar": "baz"}}], {"foo": "bar"})
+        relation.attach([2, {3: {"bar": "baz"}}, 4], {"foo": "bar"})
+
+    def test_attach_splits_large_inserts(self):
+        flexmock(BelongsToMany, touch_if_touching=lambda: True)
+        relation = self._get_relation()
+        relation.max_bindings = 10
+        query = flexmock()
+        query.should_receive("from_").times(3).with_args("user_role").and_return(query)
+        query.should_receive("insert").once().with_args(
+            [{"user_id": 1, "role_id": i} for i in range(1, 5)]
+        ).and_return(True)
+        query.should_receive("insert").once().with_args(
+            [{"user_id": 1, "role_id": i} for i in range(5, 9)]
+        ).and_return(True)
+        query.should_receive("insert").once().with_args(
+            [{"user_id": 1, "role_id": 9}]
+        ).and_return(True)
+        mock_query_builder = flexmock()
+        relation.get_query().should_receive("get_query").and_return(mock_query_builder)
+        mock_query_builder.should_receive("new_query").times(3).and_return(query)
+        relation.should_receive("touch_if_touching").once()
+
+        relation.attach(list(range(1, 10)))
 
     def test_attach_inserts_pivot_table_records_with_timestamps_when_ncessary(self):
         flexmock(BelongsToMany, touch_if_touching=lambda: True)
@@ -449,10 +498,12 @@ class OrmBelongsToTestCase(OratorTestCase):
             query.should_receive("lists").once().with_args("role_id").and_return(
                 Collection([1, list_[0], list_[1]])
             )
-            relation.should_receive("attach").once().with_args(list_[2], {}, False)
-            relation.should_receive("detach").once().with_args([1])
-            relation.get_related().should_receive("touches").and_return(False)
-            relation.get_parent().should_receive("touches").and_return(False)
+            self._mock_transaction(relation)
+            relation.should_receive("attach").once().with_args(
+                [{list_[2]: {}}], touch=False
+            )
+            relation.should_receive("detach").once().with_args([1], False)
+            relation.should_receive("touch_if_touching").once()
 
             self.assertEqual(
                 {"attached": [list_[2]], "detached": [1], "updated": []},
@@ -468,17 +519,24 @@ class OrmBelongsToTestCase(OratorTestCase):
         mock_query_builder = flexmock()
         relation.get_query().should_receive("get_query").and_return(mock_query_builder)
         mock_query_builder.should_receive("new_query").once().and_return(query)
-        query.should_receive("lists").once().with_args("role_id").and_return(
-            Collection([1, 2, 3])
+        query.should_receive("get").once().with_args(
+            ["role_id", "bar", "foo"]
+        ).and_return(
+            [
+                {"role_id": 1, "bar": None, "foo": None},
+                {"role_id": 2, "bar": None, "foo": None},
+                {"role_id": 3, "bar": "qux", "foo": None},
+            ]
         )
-        relation.should_receive("attach").once().with_args(4, {"foo": "bar"}, False)
-        relation.should_receive("update_existing_pivot").once().with_args(
-            3, {"bar": "baz"}, False
-        ).and_return(True)
-        relation.should_receive("detach").once().with_args([1])
+        self._mock_transaction(relation)
+        relation.should_receive("attach").once().with_args(
+            [{4: {"foo": "bar"}}], touch=False
+        )
+        relation.should_receive("update_existing_pivots").once().with_args(
+            {3: {"bar": "baz"}}, False
+        )
+        relation.should_receive("detach").once().with_args([1], False)
         relation.should_receive("touch_if_touching").once()
-        relation.get_related().should_receive("touches").and_return(False)
-        relation.get_parent().should_receive("touches").and_return(False)
 
         self.assertEqual(
             {"attached": [4], "detached": [1], "updated": [3]},
@@ -494,17 +552,22 @@ class OrmBelongsToTestCase(OratorTestCase):
         mock_query_builder = flexmock()
         relation.get_query().should_receive("get_query").and_return(mock_query_builder)
         mock_query_builder.should_receive("new_query").once().and_return(query)
-        query.should_receive("lists").once().with_args("role_id").and_return(
-            Collection([1, 2, 3])
+        query.should_receive("get").once().with_args(
+            ["role_id", "bar", "foo"]
+        ).and_return(
+            [
+                {"role_id": 1, "bar": None, "foo": None},
+                {"role_id": 2, "bar": None, "foo": None},
+                {"role_id": 3, "bar": "baz", "foo": None},
+            ]
+        )
+        self._mock_transaction(relation)
+        relation.should_receive("attach").once().with_args(
+            [{4: {"foo": "bar"}}], touch=False
         )
-        relation.should_receive("attach").once().with_args(4, {"foo": "bar"}, False)
-        relation.should_receive("update_existing_pivot").once().with_args(
-            3, {"bar": "baz"}, False
-        ).and_return(False)
-        relation.should_receive("detach").once().with_args([1])
+        relation.should_receive("update_existing_pivots").never()
+        relation.should_receive("detach").once().with_args([1], False)
         relation.should_receive("touch_if_touching").once()
-        relation.get_related().should_receive("touches").and_return(False)
-        relation.get_parent().should_receive("touches").and_return(False)
 
         self.assertEqual(
             {"attached": [4], "detached": [1], "updated": []},
@@ -561,6 +624,9 @@ class OrmBelongsToTestCase(OratorTestCase):
             Collection([1, 2, 3])
         )
 
+        self._mock_transaction(relation)
+        relation.should_receive("touch_if_touching").never()
+
         collection = flexmock(Collection())
         collection.should_receive("model_keys").once().and_return([1, 2, 3])
         relation.should_receive("_format_sync_list").with_args([1, 2, 3]).and_return(
@@ -594,10 +660,42 @@ class OrmBelongsToTestCase(OratorTestCase):
         relation.should_receive("_format_sync_list").with_args([1, 2, 3]).and_return(
             {1: {}, 2: {}, 3: {}}
         )
+        self._mock_transaction(relation)
 
         relation = relation.where_pivot("foo", "=", "bar")
         relation.sync([1, 2, 3])
 
+    def test_update_existing_pivots_groups_identical_attributes(self):
+        flexmock(BelongsToMany, touch_if_touching=lambda: True)
+        relation = self._get_relation()
+        query = flexmock()
+        query.should_receive("from_").twice().with_args("user_role").and_return(query)
+        query.should_receive("where").twice().with_args("user_id", 1).and_return(query)
+        query.should_receive("where_in").once().with_args("role_id", [2, 4])
+        query.should_receive("where_in").once().with_args("role_id", [3])
+        query.should_receive("update").once().with_args({"foo": "bar"}).and_return(2)
+        query.should_receive("update").once().with_args({"foo": "baz"}).and_return(1)
+        mock_query_builder = flexmock()
+        relation.get_query().should_receive("get_query").and_return(mock_query_builder)
+        mock_query_builder.should_receive("new_query").twice().and_return(query)
+        relation.should_receive("touch_if_touching").once()
+
+        self.assertEqual(
+            3,
+            relation.update_existing_pivots(
+                OrderedDict(
+                    [(2, {"foo": "bar"}), (3, {"foo": "baz"}), (4, {"foo": "bar"})]
+                )
+            ),
+        )
+
+    def _mock_transaction(self, relation):
+        connection = flexmock()
+        connection.should_receive("transaction").once().and_return(
+            OrmBelongsToManyTransactionStub()
+        )
+        relation.should_receive("_get_connection").and_return(connection)
+
     def _get_relation(self):
         builder, parent = self._get_relation_arguments()[:2]
 
@@ -656,3 +754,11 @@ class OrmBelongsToManyModelPivotStub(Model):
 
 class OrmBelongsToManyPivotStub(object):
     pass
+
+
+class OrmBelongsToManyTransactionStub(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
@@ -14,6 +14,7 @@ from orator.orm.builder import Builder
 from orator.orm.model import Model
 from orator.orm.relations import MorphToMany
 from orator.orm.relations.pivot import Pivot
+from orator.orm.relations.morph_pivot import MorphPivot
 from orator.orm.collection import Collection
 
 
@@ -98,6 +99,13 @@ class OrmMorphToManyTestCase(OratorTestCase):
 
         self.assertTrue(relation.detach())
 
+    def test_new_pivot_can_be_booted(self):
+        relation = self._get_relation()
+        pivot = relation.new_pivot({"tag_id": 2})
+
+        self.assertIsInstance(pivot, MorphPivot)
+        self.assertEqual(2, pivot.tag_id)
+
     def _get_relation(self):
         builder, parent = self._get_relation_arguments()[:2]
 
@@ -4,6 +4,7 @@ import simplejson as json
 import hashlib
 import time
 import datetime
+import threading
 from pendulum import Pendulum
 from flexmock import flexmock, flexmock_teardown
 from .. import OratorTestCase, mock
@@ -14,7 +15,7 @@ from orator.query.grammars import QueryGrammar
 from orator.query.processors import QueryProcessor
 from orator.orm.builder import Builder
 from orator.orm.model import Model
-from orator.orm.utils import mutator, accessor
+from orator.orm.utils import mutator, accessor, has_many, scope
 from orator.exceptions.orm import ModelNotFound, MassAssignmentError
 from orator.orm.collection import Collection
 from orator.connections import Connection
@@ -1041,6 +1042,130 @@ class OrmModelTestCase(OratorTestCase):
 
         self.assertEqual("stub", model.get_morph_name())
 
+    def test_meta_is_computed_when_the_class_is_created(self):
+        meta = OrmModelCastingStub().get_meta()
+
+        self.assertIs(OrmModelCastingStub._meta, meta)
+        self.assertEqual("orm_model_casting_stubs", meta.table)
+        self.assertEqual("orm_model_casting_stub_id", meta.foreign_key)
+        self.assertEqual("int", meta.casts["first"])
+        self.assertEqual(frozenset(["sixth", "seventh", "eighth"]), meta.json_casts)
+        self.assertEqual(frozenset(["created_at", "updated_at"]), meta.dates)
+        self.assertTrue(meta.totally_guarded)
+
+    def test_meta_detects_scopes_and_relations(self):
+        meta = OrmModelMetaStub().get_meta()
+
+        self.assertEqual({"active": "active", "popular": "scope_popular"}, meta.scopes)
+        self.assertEqual(["posts"], list(meta.relations.keys()))
+        self.assertIsNone(OrmModelStub().get_meta().dates)
+
+    def test_meta_follows_instance_overrides(self):
+        model = OrmModelStub()
+        model.set_hidden(["name"])
+        model.set_key_name("uuid")
+
+        self.assertEqual(frozenset(["name"]), model.get_meta().hidden)
+        self.assertEqual("uuid", model.get_key_name())
+        self.assertEqual(frozenset(), OrmModelStub().get_meta().hidden)
+        self.assertEqual("id", OrmModelStub().get_key_name())
+
+    def test_touching_state_is_specific_to_each_thread(self):
+        entered = threading.Event()
+        checked = threading.Event()
+        states = []
+
+        def worker():
+            with Model.without_touching(), OrmModelStub.batch_touches() as batch:
+                states.append((OrmModelStub.is_ignoring_touch(), batch))
+                entered.set()
+                checked.wait(5)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        entered.wait(5)
+        try:
+            self.assertTrue(states[0][0])
+            self.assertIsNotNone(states[0][1])
+            self.assertFalse(OrmModelStub.is_ignoring_touch())
+            self.assertIsNone(OrmModelStub.get_touch_batch())
+
+            with OrmModelStub.batch_touches() as batch:
+                self.assertIsNot(states[0][1], batch)
+        finally:
+            checked.set()
+            thread.join()
+
+    def test_disabled_events_are_specific_to_each_thread(self):
+        entered = threading.Event()
+        checked = threading.Event()
+        states = []
+
+        def worker():
+            with Model.without_events():
+                states.append(OrmModelEventsStub.is_ignoring_events())
+                entered.set()
+                checked.wait(5)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        entered.wait(5)
+        try:
+            self.assertEqual([True], states)
+            self.assertFalse(OrmModelEventsStub.is_ignoring_events())
+        finally:
+            checked.set()
+            thread.join()
+
+    def test_meta_follows_class_reassignments(self):
+        class OrmModelReassignedStub(Model):
+            __guarded__ = []
+
+        class OrmModelReassignedChildStub(OrmModelReassignedStub):
+            pass
+
+        OrmModelReassignedStub.__hidden__ = ["password"]
+
+        model = OrmModelReassignedStub(name="john", password="secret")
+        self.assertEqual({"name": "john"}, model.to_dict())
+        self.assertEqual(
+            frozenset(["password"]), OrmModelReassignedChildStub._meta.hidden
+        )
+
+        OrmModelReassignedStub.__table__ = "reassigned"
+        self.assertEqual("reassigned", OrmModelReassignedStub().get_table())
+        self.assertEqual("reassigned", OrmModelReassignedChildStub().get_table())
+        self.assertIn("reassigned", Model._register)
+        self.assertNotIn("orm_model_reassigned_stubs", Model._register)
+
+    def test_events_without_listeners_are_not_dispatched(self):
+        with mock.patch.object(Event, "events") as events:
+            self.assertIsNone(OrmModelEventsStub()._fire_model_event("saving"))
+
+        self.assertFalse(events.signal.called)
+
+    def test_model_events_can_be_disabled(self):
+        fired = []
+
+        OrmModelEventsStub.saving(lambda model: fired.append(model))
+        try:
+            model = OrmModelEventsStub()
+            model._fire_model_event("saving")
+
+            with Model.without_events():
+                model._fire_model_event("saving")
+
+            with OrmModelEventsStub.without_events():
+                self.assertTrue(OrmModelEventsStub.is_ignoring_events())
+                self.assertFalse(OrmModelStub.is_ignoring_events())
+
+                model._fire_model_event("saving")
+        finally:
+            OrmModelEventsStub.flush_event_listeners()
+
+        self.assertEqual([model], fired)
+        self.assertFalse(Event.has_listeners("saving: OrmModelEventsStub"))
+
 
 class OrmModelStub(Model):
 
@@ -1165,6 +1290,24 @@ class OrmModelCastingStub(Model):
     }
 
 
+class OrmModelMetaStub(Model):
+    @has_many
+    def posts(self):
+        return OrmModelStub
+
+    @scope
+    def active(self, query):
+        return query.where("active", True)
+
+    def scope_popular(self, query):
+        return query.where("votes", ">", 100)
+
+
+class OrmModelEventsStub(Model):
+
+    pass
+
+
 class OrmModelCreatedAt(Model):
 
     __timestamps__ = ["created_at"]
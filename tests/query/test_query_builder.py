@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import io
 import re
+import json
+import math
+import datetime
 
 from .. import OratorTestCase
 from .. import mock
@@ -15,6 +19,11 @@ from orator.query.grammars import (
     MySQLQueryGrammar,
 )
 from orator.query.builder import QueryBuilder
+from orator.query.processors import (
+    PostgresQueryProcessor,
+    MySQLQueryProcessor,
+    SQLiteQueryProcessor,
+)
 from orator.query.expression import QueryExpression
 from orator.query.join_clause import JoinClause
 from orator.support import Collection
@@ -61,6 +70,30 @@ class QueryBuilderTestCase(OratorTestCase):
 
         self.assertEqual('SELECT * FROM "prefix_users"', builder.to_sql())
 
+    def test_table_prefix_change_is_reflected_in_wrapped_identifiers(self):
+        builder = self.get_builder()
+        builder.select("users.id", "users.name").from_("users")
+
+        self.assertEqual(
+            'SELECT "users"."id", "users"."name" FROM "users"', builder.to_sql()
+        )
+
+        builder.get_grammar().set_table_prefix("prefix_")
+
+        self.assertEqual(
+            'SELECT "prefix_users"."id", "prefix_users"."name" FROM "prefix_users"',
+            builder.to_sql(),
+        )
+
+    def test_wrapping_cache_is_bounded(self):
+        grammar = QueryGrammar()
+        grammar.cache_size = 2
+
+        for column in ["foo", "bar", "baz", "boom"]:
+            self.assertEqual('"%s"' % column, grammar.wrap(column))
+
+        self.assertLessEqual(len(grammar._wrap_cache), 2)
+
     def test_basic_select_distinct(self):
         builder = self.get_builder()
         builder.distinct().select("foo", "bar").from_("users")
@@ -1181,6 +1214,129 @@ class QueryBuilderTestCase(OratorTestCase):
         )
         self.assertEqual([{"column2": "foo", "column3": "bar"}], result)
 
+    def test_aggregates(self):
+        builder = self.get_builder()
+        builder.get_connection().select.return_value = [
+            {"aggregate_0": 5, "aggregate_1": "2018-01-01", "aggregate_2": 3}
+        ]
+        builder.get_processor().process_select = mock.MagicMock(
+            side_effect=lambda builder_, results_: results_
+        )
+        builder.from_("orders").where("paid", True).order_by("id").limit(3)
+
+        result = builder.aggregates(count="*", max="created_at", sum="amount")
+
+        builder.get_connection().select.assert_called_once_with(
+            'SELECT COUNT(*) AS aggregate_0, MAX("created_at") AS aggregate_1, '
+            'SUM("amount") AS aggregate_2 FROM "orders" WHERE "paid" = ?',
+            [True],
+            True,
+        )
+        self.assertEqual({"count": 5, "max": "2018-01-01", "sum": 3}, result)
+        self.assertEqual(
+            'SELECT * FROM "orders" WHERE "paid" = ? ORDER BY "id" ASC LIMIT 3',
+            builder.to_sql(),
+        )
+
+    def test_aggregates_by_group(self):
+        builder = self.get_mysql_builder()
+        builder.get_connection().select.return_value = [
+            {"GROUP_0": "FR", "AGGREGATE_0": 2, "AGGREGATE_1": 10},
+            {"GROUP_0": "US", "AGGREGATE_0": 1, "AGGREGATE_1": 20},
+        ]
+        builder.get_processor().process_select = mock.MagicMock(
+            side_effect=lambda builder_, results_: results_
+        )
+        builder.from_("orders").distinct().order_by("created_at").limit(1)
+
+        result = builder.aggregates(
+            group_by="orders.country", count=["id", "orders.customer_id"]
+        )
+
+        builder.get_connection().select.assert_called_once_with(
+            "SELECT `orders`.`country` AS group_0, COUNT(DISTINCT `id`) AS aggregate_0, "
+            "COUNT(DISTINCT `orders`.`customer_id`) AS aggregate_1 "
+            "FROM `orders` GROUP BY `orders`.`country` ORDER BY `orders`.`country` ASC",
+            [],
+            True,
+        )
+        self.assertEqual(["FR", "US"], list(result.keys()))
+        self.assertEqual({"count_id": 1, "count_customer_id": 20}, result["US"])
+
+        self.assertRaises(ArgumentError, builder.aggregates)
+
+    def test_estimate_count_uses_table_statistics(self):
+        builder = self.get_postgres_builder()
+        connection = builder.get_connection()
+        connection.get_table_prefix = mock.MagicMock(return_value="")
+        connection.select.return_value = [{"estimate": 1200}]
+
+        self.assertEqual(1200, builder.from_("users").estimate_count())
+        connection.select.assert_called_once_with(
+            "SELECT CASE WHEN c.reltuples > 0 THEN c.reltuples::bigint END AS estimate "
+            "FROM pg_class c WHERE c.oid = to_regclass(%s)",
+            ["users"],
+            True,
+        )
+
+        builder = self.get_mysql_builder()
+        connection = builder.get_connection()
+        connection.get_table_prefix = mock.MagicMock(return_value="")
+        connection.select.return_value = [{"estimate": 30}]
+
+        self.assertEqual(30, builder.from_("users").estimate_count())
+        connection.select.assert_called_once_with(
+            "SELECT table_rows AS estimate FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s",
+            ["users"],
+            True,
+        )
+
+    def test_paginate_with_estimated_count(self):
+        builder = self.get_postgres_builder()
+        builder.explain = mock.MagicMock()
+        builder.explain.return_value.estimated_rows = 42
+        builder.get_connection().select.return_value = []
+        builder.from_("users").where("active", True).order_by("id")
+
+        paginator = builder.paginate(10, 2, count_strategy="estimate")
+
+        self.assertEqual(42, paginator.total)
+        self.assertTrue(paginator.approximate)
+        self.assertEqual(5, paginator.last_page)
+        builder.get_connection().select.assert_called_once_with(
+            'SELECT * FROM "users" WHERE "active" = %s '
+            'ORDER BY "id" ASC LIMIT 10 OFFSET 10',
+            [True],
+            True,
+        )
+
+    def test_paginate_with_cached_count(self):
+        builder = self.get_builder()
+        cache = {}
+        builder.get_connection().get_count_cache = lambda: cache
+        builder.count = mock.MagicMock(return_value=25)
+        builder.get_connection().select.return_value = []
+        builder.from_("users").where("active", True)
+
+        paginator = builder.paginate(10, 1, count_strategy="cached")
+        self.assertEqual(25, paginator.total)
+        self.assertFalse(paginator.approximate)
+
+        paginator = builder.paginate(10, 1, count_strategy="cached")
+        self.assertEqual(25, paginator.total)
+        self.assertTrue(paginator.approximate)
+        self.assertEqual(1, builder.count.call_count)
+        self.assertEqual(1, len(cache))
+
+        with mock.patch("time.time", return_value=list(cache.values())[0][0]):
+            paginator = builder.paginate(10, 1, count_strategy="cached")
+
+        self.assertFalse(paginator.approximate)
+        self.assertEqual(2, builder.count.call_count)
+
+        self.assertRaises(ArgumentError, builder.paginate, count_strategy="fast")
+
     def test_insert_method(self):
         builder = self.get_builder()
         query = 'INSERT INTO "users" ("email") VALUES (?)'
@@ -1589,6 +1745,281 @@ class QueryBuilderTestCase(OratorTestCase):
         builder.add_binding(["foo"], "where")
         self.assertEqual(["foo", "bar", "baz"], builder.get_bindings())
 
+    def test_explain(self):
+        builder = self.get_sqlite_builder()
+        builder._processor = SQLiteQueryProcessor()
+        builder.get_connection().select.return_value = [
+            {"detail": "SEARCH TABLE users USING INDEX users_email_index (email=?)"},
+            {"detail": "SCAN TABLE posts"},
+            {"detail": "USE TEMP B-TREE FOR ORDER BY"},
+        ]
+        plan = builder.select("*").from_("users").where("email", "foo").explain()
+        builder.get_connection().select.assert_called_once_with(
+            'EXPLAIN QUERY PLAN SELECT * FROM "users" WHERE "email" = ?', ["foo"], True
+        )
+        self.assertEqual(3, len(plan))
+        self.assertTrue(plan.uses_index("users_email_index", "users"))
+        self.assertEqual(["posts"], plan.sequential_scans)
+        self.assertEqual(["posts"], plan.tables_without_index)
+        self.assertIsNone(plan.estimated_rows)
+
+        builder = self.get_sqlite_builder()
+        self.assertRaises(
+            ArgumentError, builder.select("*").from_("users").explain, True
+        )
+        self.assertRaises(
+            ArgumentError, builder.select("*").from_("users").explain, format="xml"
+        )
+
+    def test_to_columns(self):
+        builder = self.get_builder()
+        builder.get_connection().select_tuples = mock.MagicMock(
+            return_value=(
+                ["id", "score", "name"],
+                None,
+                iter([[(1, 1.5, "foo"), (2, None, "bar")], [(None, 3.0, "baz")]]),
+            )
+        )
+
+        columns = builder.from_("users").where("id", ">", 0).to_columns()
+
+        builder.get_connection().select_tuples.assert_called_once_with(
+            1000, 'SELECT * FROM "users" WHERE "id" > ?', [0], True, False
+        )
+        self.assertFalse(builder.columns)
+        self.assertEqual(["id", "score", "name"], list(columns.keys()))
+        self.assertEqual([1.0, 2.0], list(columns["id"])[:2])
+        self.assertTrue(math.isnan(columns["id"][2]))
+        self.assertEqual([1.5, 3.0], [columns["score"][0], columns["score"][2]])
+        self.assertEqual(["foo", "bar", "baz"], list(columns["name"]))
+
+    def test_to_columns_with_explicit_types(self):
+        builder = self.get_builder()
+        builder.get_connection().select_tuples = mock.MagicMock(
+            return_value=(["id"], 2, iter([[(1,), (None,)]]))
+        )
+
+        self.assertRaises(TypeError, builder.from_("users").to_columns, {"id": "l"})
+
+    def test_to_records(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+
+        builder = self.get_builder()
+        builder.get_connection().select_tuples = mock.MagicMock(
+            return_value=(
+                ["id", "name"],
+                3,
+                iter([[(1, "foo"), (2, "bar")], [(None, "baz")]]),
+            )
+        )
+
+        records = builder.from_("users").to_records()
+
+        self.assertEqual(3, len(records))
+        self.assertEqual(numpy.float64, records["id"].dtype)
+        self.assertEqual(["foo", "bar", "baz"], list(records["name"]))
+
+    def test_to_columns_degrades_numpy_arrays_on_unsafe_casts(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+
+        builder = self.get_builder()
+        builder.get_connection().select_tuples = mock.MagicMock(
+            return_value=(
+                ["id", "code"],
+                None,
+                iter([[(1, 1), (2, 2)], [(1.7, "3"), (2.5, "4")]]),
+            )
+        )
+
+        columns = builder.from_("users").to_columns()
+
+        self.assertEqual(numpy.float64, columns["id"].dtype)
+        self.assertEqual([1, 2, 1.7, 2.5], list(columns["id"]))
+        self.assertEqual(numpy.object_, columns["code"].dtype)
+        self.assertEqual([1, 2, "3", "4"], list(columns["code"]))
+
+    def test_export(self):
+        builder = self.get_builder()
+        builder.get_connection().select_tuples = mock.MagicMock(
+            return_value=(
+                ["id", "name"],
+                None,
+                iter([[(1, "foo"), (2, "bar, baz")], [(3, None)]]),
+            )
+        )
+        fp = io.StringIO()
+
+        count = builder.from_("users").export(fp, chunk_size=2)
+
+        builder.get_connection().select_tuples.assert_called_once_with(
+            2, 'SELECT * FROM "users"', [], True, True
+        )
+        self.assertEqual(3, count)
+        self.assertEqual('id,name\r\n1,foo\r\n2,"bar, baz"\r\n3,\r\n', fp.getvalue())
+
+    def test_export_json_values_to_csv(self):
+        builder = self.get_builder()
+        builder.get_connection().select_tuples = mock.MagicMock(
+            return_value=(
+                ["id", "options", "tags"],
+                None,
+                iter([[(1, {"k": 1}, ["a", "b"]), (2, None, [])]]),
+            )
+        )
+        fp = io.StringIO()
+
+        builder.from_("users").export(fp, header=False)
+
+        self.assertEqual('1,"{""k"": 1}","[""a"", ""b""]"\r\n2,,[]\r\n', fp.getvalue())
+
+    def test_export_to_ndjson(self):
+        builder = self.get_builder()
+        builder.get_connection().select_tuples = mock.MagicMock(
+            return_value=(
+                ["id", "created_at"],
+                None,
+                iter([[(1, datetime.datetime(2018, 1, 1)), (2, None)]]),
+            )
+        )
+        fp = io.StringIO()
+
+        count = builder.from_("users").export(fp, format="ndjson")
+
+        self.assertEqual(2, count)
+        self.assertEqual(
+            [
+                {"id": 1, "created_at": "2018-01-01T00:00:00"},
+                {"id": 2, "created_at": None},
+            ],
+            [json.loads(line) for line in fp.getvalue().splitlines()],
+        )
+        self.assertRaises(ArgumentError, builder.export, fp, format="xml")
+
+    def test_postgres_copy_to(self):
+        builder = self.get_postgres_builder()
+        builder.get_connection().copy_to = mock.MagicMock()
+        destination = mock.MagicMock()
+        builder.select("id", "email").from_("users").where("id", ">", 1).copy_to(
+            destination, header=True
+        )
+        builder.get_connection().copy_to.assert_called_once_with(
+            'COPY (SELECT "id", "email" FROM "users" WHERE "id" > %s) '
+            "TO STDOUT WITH (FORMAT csv, HEADER)",
+            [1],
+            destination,
+        )
+
+        builder = self.get_postgres_builder()
+        self.assertRaises(
+            ArgumentError, builder.from_("users").copy_to, destination, format="xml"
+        )
+
+    def test_postgres_explain(self):
+        builder = self.get_postgres_builder()
+        builder._processor = PostgresQueryProcessor()
+        builder.get_connection().select.return_value = [
+            {
+                "QUERY PLAN": [
+                    {
+                        "Plan": {
+                            "Node Type": "Nested Loop",
+                            "Plan Rows": 10,
+                            "Total Cost": 32.5,
+                            "Plans": [
+                                {
+                                    "Node Type": "Index Scan",
+                                    "Relation Name": "users",
+                                    "Index Name": "users_pkey",
+                                    "Plan Rows": 1,
+                                },
+                                {
+                                    "Node Type": "Seq Scan",
+                                    "Relation Name": "posts",
+                                    "Plan Rows": 10,
+                                },
+                            ],
+                        }
+                    }
+                ]
+            }
+        ]
+        plan = builder.select("*").from_("users").where("id", 1).explain(True)
+        builder.get_connection().select.assert_called_once_with(
+            'EXPLAIN (ANALYZE, FORMAT JSON) SELECT * FROM "users" WHERE "id" = %s',
+            [1],
+            True,
+        )
+        self.assertEqual(10, plan.estimated_rows)
+        self.assertEqual(["posts"], plan.sequential_scans)
+        self.assertEqual(["users_pkey"], plan.indexes)
+
+        builder = self.get_postgres_builder()
+        builder._processor = PostgresQueryProcessor()
+        builder.get_connection().select.return_value = [
+            {
+                "QUERY PLAN": "Bitmap Heap Scan on users  (cost=4.18..12.64 rows=4 width=36)"
+            },
+            {"QUERY PLAN": "  Recheck Cond: (email = 'foo'::text)"},
+            {
+                "QUERY PLAN": "  ->  Bitmap Index Scan on users_email_index  "
+                "(cost=0.00..4.18 rows=4 width=0)"
+            },
+        ]
+        plan = builder.select("*").from_("users").explain(format="text")
+        builder.get_connection().select.assert_called_once_with(
+            'EXPLAIN (FORMAT TEXT) SELECT * FROM "users"', [], True
+        )
+        self.assertEqual(2, len(plan))
+        self.assertEqual(4, plan.estimated_rows)
+        self.assertFalse(plan.has_sequential_scan())
+        self.assertTrue(plan.uses_index("users_email_index"))
+
+    def test_mysql_explain(self):
+        builder = self.get_mysql_builder()
+        builder._processor = MySQLQueryProcessor()
+        builder.get_connection().select.return_value = [
+            {
+                "EXPLAIN": '{"query_block": {"select_id": 1, "nested_loop": ['
+                '{"table": {"table_name": "users", "access_type": "ref", '
+                '"key": "users_email_index", "rows_examined_per_scan": 1}}, '
+                '{"table": {"table_name": "posts", "access_type": "ALL", '
+                '"rows_examined_per_scan": 120}}]}}'
+            }
+        ]
+        plan = builder.select("*").from_("users").where("email", "foo").explain()
+        builder.get_connection().select.assert_called_once_with(
+            "EXPLAIN FORMAT=JSON SELECT * FROM `users` WHERE `email` = %s",
+            ["foo"],
+            True,
+        )
+        self.assertEqual(2, len(plan))
+        self.assertEqual(["posts"], plan.sequential_scans)
+        self.assertTrue(plan.uses_index("users_email_index", "users"))
+
+        builder = self.get_mysql_builder()
+        builder._processor = MySQLQueryProcessor()
+        builder.get_connection().select.return_value = [
+            {
+                "EXPLAIN": "-> Filter: (users.id > 1)  (cost=1.25 rows=4) "
+                "(actual time=0.03..0.04 rows=3 loops=1)\n"
+                "    -> Table scan on users  (cost=1.25 rows=10) "
+                "(actual time=0.02..0.03 rows=10 loops=1)\n"
+            }
+        ]
+        plan = builder.select("*").from_("users").explain(analyze=True)
+        builder.get_connection().select.assert_called_once_with(
+            "EXPLAIN ANALYZE SELECT * FROM `users`", [], True
+        )
+        self.assertEqual(4, plan.estimated_rows)
+        self.assertEqual(3, plan.nodes[0].actual_rows)
+        self.assertEqual(["users"], plan.sequential_scans)
+
     def test_merge_builders(self):
         builder = self.get_builder()
         builder.add_binding("foo", "where")
@@ -1661,6 +2092,141 @@ class QueryBuilderTestCase(OratorTestCase):
 
         self.assertEqual('SELECT * FROM "users"', builder.to_sql())
 
+    def test_common_table_expressions(self):
+        builder = self.get_builder()
+        builder.with_(
+            "active_users",
+            self.get_builder().from_("users").where("active", True),
+            ["id", "name"],
+        )
+        builder.from_("active_users").where("name", "john")
+        self.assertEqual(
+            'WITH "active_users" ("id", "name") AS (SELECT * FROM "users" WHERE "active" = ?) '
+            'SELECT * FROM "active_users" WHERE "name" = ?',
+            builder.to_sql(),
+        )
+        self.assertEqual([True, "john"], builder.get_bindings())
+
+        builder = self.get_mysql_builder()
+        builder.with_("u", "SELECT * FROM `users`").select_raw("%s", [1]).from_("u")
+        builder.union(self.get_mysql_builder().from_("u").where("id", 2))
+        self.assertEqual(
+            "WITH `u` AS (SELECT * FROM `users`) "
+            "(SELECT %s FROM `u`) UNION (SELECT * FROM `u` WHERE `id` = %s)",
+            builder.to_sql(),
+        )
+        self.assertEqual([1, 2], builder.get_bindings())
+
+    def test_recursive_common_table_expressions(self):
+        for builder, marker in [
+            (self.get_sqlite_builder, "?"),
+            (self.get_postgres_builder, "%s"),
+        ]:
+            query = builder()
+            query.with_recursive(
+                "tree",
+                builder().from_("categories").where("id", 1),
+                builder()
+                .select("categories.*")
+                .from_("categories")
+                .join("tree", "tree.id", "=", "categories.parent_id")
+                .where("categories.active", True),
+            ).from_("tree").where("depth", "<", 3)
+            self.assertEqual(
+                'WITH RECURSIVE "tree" AS (SELECT * FROM "categories" WHERE "id" = {0} '
+                'UNION ALL SELECT "categories".* FROM "categories" '
+                'INNER JOIN "tree" ON "tree"."id" = "categories"."parent_id" '
+                'WHERE "categories"."active" = {0}) '
+                'SELECT * FROM "tree" WHERE "depth" < {0}'.format(marker),
+                query.to_sql(),
+            )
+            self.assertEqual([1, True, 3], query.get_bindings())
+
+    def test_update_and_delete_with_common_table_expressions(self):
+        builder = self.get_builder()
+        builder.get_connection().update.return_value = 1
+        builder.with_("old", self.get_builder().from_("users").where("age", ">", 90))
+        builder.from_("users").where_in(
+            "id", self.get_builder().from_("old").select("id")
+        )
+        builder.update(email="foo")
+        builder.get_connection().update.assert_called_once_with(
+            'WITH "old" AS (SELECT * FROM "users" WHERE "age" > ?) UPDATE "users" '
+            'SET "email" = ? WHERE "id" IN (SELECT "id" FROM "old")',
+            [90, "foo"],
+        )
+
+        builder = self.get_mysql_builder()
+        builder.get_connection().delete.return_value = 1
+        builder.with_("old", "SELECT `id` FROM `users`").from_("users").where("id", 1)
+        builder.delete()
+        builder.get_connection().delete.assert_called_once_with(
+            "WITH `old` AS (SELECT `id` FROM `users`) DELETE FROM `users` WHERE `id` = %s",
+            [1],
+        )
+
+    def test_window_functions(self):
+        builder = self.get_builder()
+        builder.select("id").select_window(
+            "RANK()", "rank", "post_id", [("votes", "desc"), "id"]
+        ).from_("comments")
+        self.assertEqual(
+            'SELECT "id", RANK() OVER (PARTITION BY "post_id" ORDER BY "votes" DESC, "id" ASC) '
+            'AS "rank" FROM "comments"',
+            builder.to_sql(),
+        )
+
+        builder = self.get_mysql_builder()
+        builder.select_window("SUM(`amount`)", "total", order_by="id").from_("orders")
+        self.assertEqual(
+            "SELECT SUM(`amount`) OVER (ORDER BY `id` ASC) AS `total` FROM `orders`",
+            builder.to_sql(),
+        )
+
+    def test_limit_per_group(self):
+        builder = self.get_builder()
+        builder.from_("comments").where_in("post_id", [1, 2])
+        builder.order_by_raw("votes > ? DESC", [10]).limit(3).offset(1)
+        builder.limit_per_group("post_id")
+        self.assertEqual(
+            'SELECT * FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY "post_id" '
+            'ORDER BY votes > ? DESC) AS "orator_row" FROM "comments" '
+            'WHERE "post_id" IN (?, ?)) AS "orator_rows" '
+            'WHERE "orator_row" > 1 AND "orator_row" <= 4 ORDER BY "orator_row"',
+            builder.to_sql(),
+        )
+        self.assertEqual([10, 1, 2], builder.get_bindings())
+
+        builder = self.get_mysql_builder()
+        builder.select("comments.*").from_("comments").order_by("id").take(2)
+        builder.limit_per_group("comments.post_id", "comments.type")
+        self.assertEqual(
+            "SELECT * FROM (SELECT `comments`.*, ROW_NUMBER() OVER "
+            "(PARTITION BY `comments`.`post_id`, `comments`.`type` ORDER BY `id` ASC) "
+            "AS `orator_row` FROM `comments`) AS `orator_rows` "
+            "WHERE `orator_row` <= 2 ORDER BY `orator_row`",
+            builder.to_sql(),
+        )
+
+    def test_lateral_joins(self):
+        builder = self.get_postgres_builder()
+        builder.from_("posts").where("posts.id", 3).left_join_lateral(
+            self.get_postgres_builder()
+            .from_("comments")
+            .where_raw('"comments"."post_id" = "posts"."id"')
+            .where("approved", True)
+            .order_by("id", "desc")
+            .limit(3),
+            "latest",
+        )
+        self.assertEqual(
+            'SELECT * FROM "posts" LEFT JOIN LATERAL (SELECT * FROM "comments" '
+            'WHERE "comments"."post_id" = "posts"."id" AND "approved" = %s '
+            'ORDER BY "id" DESC LIMIT 3) AS "latest" ON TRUE WHERE "posts"."id" = %s',
+            builder.to_sql(),
+        )
+        self.assertEqual([True, 3], builder.get_bindings())
+
     def test_merge(self):
         b1 = self.get_builder()
         b1.from_("test").select("foo", "bar").where("baz", "boom")
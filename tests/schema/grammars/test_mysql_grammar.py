@@ -5,6 +5,7 @@ from orator.connections import Connection
 from orator.schema.grammars import MySQLSchemaGrammar
 from orator.schema.blueprint import Blueprint
 from orator.connectors import MySQLConnector
+from orator.exceptions import ArgumentError
 from ... import OratorTestCase
 
 
@@ -216,6 +217,28 @@ class MySQLSchemaGrammarTestCase(OratorTestCase):
             "ALTER TABLE `users` ADD INDEX baz(`foo`, `bar`)", statements[0]
         )
 
+    def test_adding_index_online(self):
+        blueprint = Blueprint("users")
+        blueprint.index(["foo", "bar"], "baz", algorithm="inplace", lock="none")
+        blueprint.unique("foo").concurrently()
+        blueprint.drop_index("bar", lock="shared")
+        blueprint.validate_foreign(["order_id"])
+        statements = blueprint.to_sql(self.get_connection(), self.get_grammar())
+
+        expected = [
+            "ALTER TABLE `users` ADD INDEX baz(`foo`, `bar`), ALGORITHM=INPLACE, LOCK=NONE",
+            "ALTER TABLE `users` ADD UNIQUE users_foo_unique(`foo`),"
+            " ALGORITHM=INPLACE, LOCK=NONE",
+            "ALTER TABLE `users` DROP INDEX bar, LOCK=SHARED",
+        ]
+        self.assertEqual(expected, statements)
+
+        blueprint = Blueprint("users")
+        blueprint.index("foo", lock="nothing")
+        self.assertRaises(
+            ArgumentError, blueprint.to_sql, self.get_connection(), self.get_grammar()
+        )
+
     def test_adding_incrementing_id(self):
         blueprint = Blueprint("users")
         blueprint.increments("id")
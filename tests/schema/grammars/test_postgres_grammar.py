@@ -165,6 +165,40 @@ class PostgresSchemaGrammarTestCase(OratorTestCase):
         self.assertEqual(1, len(statements))
         self.assertEqual('CREATE INDEX baz ON "users" ("foo", "bar")', statements[0])
 
+    def test_adding_index_concurrently(self):
+        blueprint = Blueprint("users")
+        blueprint.index(["foo", "bar"], "baz", concurrently=True)
+        blueprint.unique("foo").concurrently()
+        blueprint.drop_index("bar", concurrently=True)
+        grammar = self.get_grammar()
+        statements = blueprint.to_sql(self.get_connection(), grammar)
+
+        expected = [
+            'CREATE INDEX CONCURRENTLY baz ON "users" ("foo", "bar")',
+            'CREATE UNIQUE INDEX CONCURRENTLY users_foo_unique ON "users" ("foo")',
+            'ALTER TABLE "users" ADD CONSTRAINT users_foo_unique'
+            " UNIQUE USING INDEX users_foo_unique",
+            "DROP INDEX CONCURRENTLY bar",
+        ]
+        self.assertEqual(expected, statements)
+        self.assertEqual(
+            [False, False, True, False],
+            [grammar.is_transactional(s) for s in statements],
+        )
+
+    def test_adding_not_valid_foreign_key(self):
+        blueprint = Blueprint("users")
+        blueprint.foreign("order_id").references("id").on("orders").not_valid()
+        blueprint.validate_foreign(["order_id"])
+        statements = blueprint.to_sql(self.get_connection(), self.get_grammar())
+
+        expected = [
+            'ALTER TABLE "users" ADD CONSTRAINT users_order_id_foreign'
+            ' FOREIGN KEY ("order_id") REFERENCES "orders" ("id") NOT VALID',
+            'ALTER TABLE "users" VALIDATE CONSTRAINT users_order_id_foreign',
+        ]
+        self.assertEqual(expected, statements)
+
     def test_adding_incrementing_id(self):
         blueprint = Blueprint("users")
         blueprint.increments("id")
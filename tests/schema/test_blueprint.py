@@ -2,7 +2,7 @@
 
 from flexmock import flexmock, flexmock_teardown
 from orator.schema import Blueprint
-from orator.schema.grammars import SchemaGrammar
+from orator.schema.grammars import SchemaGrammar, PostgresSchemaGrammar
 from orator.connections import Connection
 from .. import OratorTestCase
 
@@ -23,6 +23,22 @@ class SchemaBuilderTestCase(OratorTestCase):
 
         blueprint.build(conn, grammar)
 
+    def test_non_transactional_statements_can_not_be_run_in_a_transaction(self):
+        conn = flexmock(Connection(None))
+        conn.should_receive("transaction_level").and_return(1)
+        conn.should_receive("statement").once().with_args(
+            'CREATE INDEX users_foo_index ON "users" ("foo")'
+        )
+        grammar = PostgresSchemaGrammar(conn)
+
+        blueprint = Blueprint("users")
+        blueprint.index("foo")
+        blueprint.build(conn, grammar)
+
+        blueprint = Blueprint("users")
+        blueprint.index("foo", concurrently=True)
+        self.assertRaises(RuntimeError, blueprint.build, conn, grammar)
+
     def test_index_default_names(self):
         blueprint = Blueprint("users")
         blueprint.unique(["foo", "bar"])
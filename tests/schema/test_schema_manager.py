@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from .. import OratorTestCase, mock
+from orator import DatabaseManager
+
+
+class SchemaManagerCacheTestCase(OratorTestCase):
+    def setUp(self):
+        self.db = DatabaseManager(
+            {"sqlite": {"driver": "sqlite", "database": ":memory:"}}
+        )
+        self.connection = self.db.connection()
+        self.schema = self.connection.get_schema_builder()
+
+        with self.schema.create("users") as table:
+            table.increments("id")
+            table.string("email").unique()
+            table.string("first_name")
+            table.string("last_name")
+            table.index(["last_name", "first_name"])
+
+        with self.schema.create("posts") as table:
+            table.increments("id")
+            table.integer("user_id")
+            table.string("name")
+
+            table.foreign("user_id").references("id").on("users")
+
+    def test_table_metadata_is_cached(self):
+        manager = self.connection.get_schema_manager()
+
+        with mock.patch.object(
+            self.connection, "select", wraps=self.connection.select
+        ) as select:
+            manager.list_table_details("users")
+            queries = select.call_count
+
+            self.connection.get_column("users", "email")
+            self.connection.get_schema_manager().list_table_details("users")
+
+        self.assertEqual(queries, select.call_count)
+        self.assertIn("users", self.connection.get_schema_cache())
+
+    def test_cache_is_cleared_by_schema_changes(self):
+        manager = self.connection.get_schema_manager()
+        manager.list_table_columns("users")
+
+        with self.schema.table("users") as table:
+            table.string("nickname").nullable()
+
+        self.assertIn("nickname", manager.list_table_columns("users"))
+
+        self.connection.statement("DROP TABLE posts")
+
+        self.assertEqual({}, self.connection.get_schema_cache())
+
+    def test_cache_is_cleared_by_rollbacks(self):
+        manager = self.connection.get_schema_manager()
+
+        with self.connection.transaction():
+            manager.list_table_columns("users")
+
+            self.connection.rollback()
+            self.connection.begin_transaction()
+
+            self.assertEqual({}, self.connection.get_schema_cache())
+
+    def test_nothing_is_cached_while_pretending(self):
+        with self.connection.pretend():
+            self.connection.get_schema_manager().list_table_indexes("users")
+
+        self.assertEqual({}, self.connection.get_schema_cache())
+        self.assertEqual(
+            ["primary", "users_email_unique", "users_last_name_first_name_index"],
+            sorted(self.connection.get_schema_manager().list_table_indexes("users")),
+        )
+
+    def test_introspect_loads_all_tables_at_once(self):
+        manager = self.connection.get_schema_manager()
+        expected = [self._describe(manager, table) for table in ["posts", "users"]]
+        self.connection.forget_schema()
+
+        with mock.patch.object(
+            self.connection, "select", wraps=self.connection.select
+        ) as select:
+            tables = manager.introspect()
+
+        self.assertEqual(["posts", "users"], tables)
+        self.assertEqual(2, select.call_count)
+
+        with mock.patch.object(self.connection, "select") as select:
+            described = [self._describe(manager, table) for table in tables]
+
+        self.assertFalse(select.called)
+        self.assertEqual(expected, described)
+        self.assertEqual(
+            ["last_name", "first_name"],
+            described[1][1]["users_last_name_first_name_index"],
+        )
+
+    def test_introspect_can_be_limited_to_some_tables(self):
+        tables = self.connection.get_schema_manager().introspect(["users"])
+
+        self.assertEqual(["users"], tables)
+        self.assertEqual(["users"], list(self.connection.get_schema_cache().keys()))
+
+    def _describe(self, manager, table):
+        details = manager.list_table_details(table)
+
+        return (
+            [(c.get_name(), c.get_type()) for c in details.get_columns().values()],
+            dict(
+                (name, index.get_columns())
+                for name, index in details.get_indexes().items()
+            ),
+            [
+                (fk.get_local_columns(), fk.get_foreign_table_name())
+                for fk in details.get_foreign_keys().values()
+            ],
+        )
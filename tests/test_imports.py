@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import subprocess
+
+from unittest import TestCase
+
+
+class ImportsTestCase(TestCase):
+
+    LAZY_MODULES = [
+        "blinker",
+        "cleo",
+        "faker",
+        "MySQLdb",
+        "pendulum",
+        "psycopg2",
+        "pygments",
+        "pymysql",
+    ]
+
+    def test_heavy_dependencies_are_not_loaded_on_import(self):
+        loaded = self._loaded_modules("orator")
+
+        for module in self.LAZY_MODULES:
+            self.assertNotIn(module, loaded)
+
+    def test_drivers_are_not_loaded_when_using_sqlite(self):
+        loaded = self._loaded_modules(
+            "orator",
+            "db = orator.DatabaseManager("
+            "{'sqlite': {'driver': 'sqlite', 'database': ':memory:'}})",
+            "db.table('sqlite_master').count()",
+        )
+
+        for module in ["MySQLdb", "psycopg2", "pymysql"]:
+            self.assertNotIn(module, loaded)
+
+    def test_connectors_are_still_importable(self):
+        from orator.connectors import MySQLConnector, PostgresConnector, SQLiteConnector
+
+        self.assertEqual("SQLiteConnector", SQLiteConnector.__name__)
+        self.assertEqual("MySQLConnector", MySQLConnector.__name__)
+        self.assertEqual("PostgresConnector", PostgresConnector.__name__)
+
+    def _loaded_modules(self, module, *statements):
+        code = "; ".join(
+            ["import sys", "import %s" % module]
+            + list(statements)
+            + ["print('\\n'.join(m.split('.')[0] for m in sys.modules))"]
+        )
+
+        output = subprocess.check_output([sys.executable, "-c", code])
+
+        return set(output.decode().split())